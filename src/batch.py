@@ -0,0 +1,134 @@
+import sys
+import os
+import time
+import argparse
+import contextlib
+import multiprocessing
+
+# Compile many sources at once:
+#   python batch.py [-j N] [-o out] ../tests/ extra.cpp ...
+# Every input gets its own directory under the output root holding
+# AST.dot, tac.txt, symtables.csv and the compiler's console output, and
+# with --opt-report opt_report.txt.
+
+_compiler = None
+_cache = None
+_opt_report = False
+
+def _init_worker(cache_dir=None, passes=None, opt_report=False):
+    # runs once per worker: loads the parser tables and keeps one Compiler
+    global _compiler, _cache, _opt_report
+    from parser import Compiler
+    _compiler = Compiler(passes=passes)
+    _opt_report = opt_report
+    if cache_dir is not None:
+        from cache import CompileCache
+        _cache = CompileCache(cache_dir or None)
+
+def compile_one(job):
+    src, outdir = job
+    os.makedirs(outdir, exist_ok=True)
+    with open(src, 'r') as fl:
+        inp = fl.read()
+    lines = inp.count('\n')
+    start = time.perf_counter()
+    hit = False
+    try:
+        with open(os.path.join(outdir, "stdout.txt"), "w") as log, contextlib.redirect_stdout(log):
+            if _cache is None:
+                result = _compiler.compile_to(inp, outdir)
+                errors = list(_compiler.errors)
+                for err in errors:
+                    print(err)
+                ok = result is not None and not errors
+            else:
+                from cache import compile_cached
+                ok, errors, hit = compile_cached(_cache, inp, outdir, _compiler)
+        if not ok and not errors:
+            errors = ["syntax error"]
+        if ok and _opt_report and _compiler.opt_report:
+            from optimize import format_report
+            with open(os.path.join(outdir, "opt_report.txt"), "w") as f:
+                f.write(format_report(_compiler.opt_report)+"\n")
+    except Exception as e:
+        errors = [f"{type(e).__name__}: {e}"]
+    return src, outdir, lines, errors, hit, time.perf_counter()-start
+
+def collect_sources(inputs):
+    files = []
+    for path in inputs:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                files += [os.path.join(root, n) for n in sorted(names) if n.endswith(".cpp")]
+        else:
+            files.append(path)
+    return files
+
+def plan_jobs(files, outroot):
+    jobs = []
+    used = set()
+    for f in files:
+        stem = os.path.splitext(os.path.basename(f))[0]
+        name, n = stem, 1
+        while name in used:
+            n += 1
+            name = f"{stem}_{n}"
+        used.add(name)
+        jobs.append((f, os.path.join(outroot, name)))
+    return jobs
+
+def run(jobs, workers, cache_dir=None, passes=None, opt_report=False):
+    if workers == 1:
+        _init_worker(cache_dir, passes, opt_report)
+        yield from map(compile_one, jobs)
+        return
+    # load the tables in the parent too: forked workers then start with them
+    import parser
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(cache_dir, passes, opt_report)) as pool:
+        yield from pool.imap_unordered(compile_one, jobs, chunksize=max(1, len(jobs)//(workers*8)))
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="compile many .cpp files in parallel")
+    ap.add_argument("inputs", nargs="+", help=".cpp files or directories to search")
+    ap.add_argument("-o", "--outdir", default="out")
+    ap.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("-q", "--quiet", action="store_true", help="only print failures and the summary")
+    ap.add_argument("--cache", nargs="?", const="", default=None, metavar="DIR", help="reuse results of unchanged sources")
+    ap.add_argument("-O", dest="passes", nargs="?", const="", default=None, metavar="PASSES", help="optimise the TAC (comma separated passes of optimize.py, default all)")
+    ap.add_argument("--opt-report", action="store_true", help="write what each optimisation pass removed to opt_report.txt")
+    args = ap.parse_args(argv)
+    passes = None
+    if args.passes is not None:
+        from optimize import PASSES, parse_passes
+        passes = parse_passes(args.passes)
+        unknown = [p for p in passes if p not in PASSES]
+        if unknown:
+            ap.error(f"unknown pass {unknown[0]!r}; choose from {', '.join(PASSES)}")
+
+    jobs = plan_jobs(collect_sources(args.inputs), args.outdir)
+    if not jobs:
+        print("no input files")
+        return 1
+    workers = max(1, min(args.jobs, len(jobs)))
+    start = time.perf_counter()
+    failed = 0
+    total_lines = 0
+    hits = 0
+    for src, outdir, lines, errors, hit, elapsed in run(jobs, workers, args.cache, passes, args.opt_report):
+        total_lines += lines
+        hits += hit
+        if errors:
+            failed += 1
+            print(f"FAIL {src}: {errors[0]}")
+        elif not args.quiet:
+            print(f"ok   {src} -> {outdir} ({elapsed*1000:.1f} ms{', cached' if hit else ''})")
+    wall = time.perf_counter()-start
+    print(f"{len(jobs)} files ({failed} failed), {total_lines} lines in {wall:.2f} s on {workers} workers: "
+          f"{len(jobs)/wall:.1f} files/s, {total_lines/wall:.0f} lines/s")
+    if args.cache is not None:
+        print(f"cache: {hits} hits, {len(jobs)-hits} misses")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,303 @@
+import sys
+import os
+import io
+import time
+import argparse
+import tempfile
+import contextlib
+import shutil
+import subprocess
+import json
+import platform
+
+# Regression benchmarks for the compiler front end.
+#   python bench.py scaling [--sizes 2000 4000 8000 16000]
+#   python bench.py startup [--runs 10]
+#   python bench.py corpus [--axis statements] [--compare bench_results/latest.json]
+#   python bench.py memory [--statements 1600]
+#   python bench.py optimize [--axis statements] [--passes constprop,gvn,dce]
+
+def gen_statements(n):
+    lines = ["int main(){", "    int x, y;", "    x = 0;", "    y = 1;"]
+    for i in range(n):
+        lines.append("    x = x + y * %d;" % (i % 7 + 1))
+    lines += ["    cout << x;", "    return 0;", "}"]
+    return "\n".join(lines)+"\n"
+
+def time_parse(inp):
+    from parser import Compiler
+    compiler = Compiler(symtab_csv=None)
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = compiler.compile(inp)
+        elapsed = time.perf_counter()-start
+    if result is None or compiler.errors:
+        raise RuntimeError("benchmark input failed to compile: "+"; ".join(compiler.errors))
+    return elapsed
+
+def scaling(args):
+    rows = []
+    for n in args.sizes:
+        best = min(time_parse(gen_statements(n)) for _ in range(args.repeat))
+        rows.append((n, best))
+        print(f"{n:>8} statements  {best*1000:10.1f} ms  {best/n*1e6:8.2f} us/stmt")
+    # per-statement cost of the largest input relative to the smallest one;
+    # a linear parser stays close to 1, a quadratic one grows with the size ratio
+    growth = (rows[-1][1]/rows[-1][0])/(rows[0][1]/rows[0][0])
+    print(f"per-statement growth x{growth:.2f} over a x{rows[-1][0]/rows[0][0]:.0f} size increase")
+    if growth > args.max_growth:
+        print(f"FAIL: parse time is not linear in statement count (limit x{args.max_growth})")
+        return 1
+    return 0
+
+def time_import(src, env, runs, before=None):
+    times = []
+    for _ in range(runs):
+        if before:
+            before()
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import parser"], cwd=src, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter()-start)
+    return sum(times)/len(times), min(times)
+
+def startup(args):
+    here = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as tmp:
+        # a private copy of the sources so the uncached mode can regenerate
+        # parsetab.py/parser.out without touching the tree
+        src = os.path.join(tmp, "src")
+        os.mkdir(src)
+        for f in os.listdir(here):
+            if f.endswith(".py") and f != "parsetab.py":
+                shutil.copy(os.path.join(here, f), src)
+        cache = os.path.join(tmp, "cache")
+        env = dict(os.environ, CS335_CACHE_DIR=cache)
+        env.pop("CS335_NO_CACHE", None)
+        legacy = dict(env, CS335_NO_CACHE="1")
+        def cold():
+            shutil.rmtree(cache, ignore_errors=True)
+        def stale():
+            for f in ("parsetab.py", "parser.out"):
+                if os.path.exists(os.path.join(src, f)):
+                    os.remove(os.path.join(src, f))
+        modes = [
+            ("uncached, tables rebuilt", legacy, stale),
+            ("uncached, parsetab.py current", legacy, None),
+            ("cache miss", env, cold),
+            ("cache hit", env, None),
+        ]
+        # compile the copies to bytecode first so every mode starts from .pyc
+        time_import(src, legacy, 1)
+        for label, e, before in modes:
+            mean, best = time_import(src, e, args.runs, before)
+            print(f"{label:<32} mean {mean*1000:8.1f} ms   best {best*1000:8.1f} ms")
+    return 0
+
+# per-axis sweeps of the synthetic corpus; the other knobs stay at
+# corpus.DEFAULTS. --quick keeps the two smallest points of each axis.
+SWEEPS = {
+    "functions": [1, 4, 16, 64],
+    "statements": [100, 400, 1600, 6400],
+    "expr_depth": [1, 3, 5, 7],
+    "nesting": [0, 2, 4, 8],
+    "identifiers": [4, 32, 256, 2048],
+}
+
+def time_phases(compiler, timer, inp, runs):
+    # best of `runs` compiles; phases are taken from the fastest run
+    best = None
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(runs):
+            timer.reset()
+            timer.start()
+            result = compiler.compile_to(inp, tmp)
+            timer.stop()
+            if result is None or compiler.errors:
+                raise RuntimeError("corpus program failed to compile: "+"; ".join(compiler.errors))
+            report = timer.report()
+            if best is None or report["total"]["wall_s"] < best["total"]["wall_s"]:
+                best = report
+    return best
+
+def corpus_bench(args):
+    import corpus
+    from parser import Compiler
+    from timing import PhaseTimer
+    from cache import compiler_version
+    timer = PhaseTimer(memory=args.memory)
+    compiler = Compiler(timer=timer)
+    axes = args.axis or list(SWEEPS)
+    results = []
+    for axis in axes:
+        values = SWEEPS[axis][:2] if args.quick else SWEEPS[axis]
+        for value, inp in corpus.sweep(axis, values, args.seed):
+            report = time_phases(compiler, timer, inp, args.repeat)
+            phases = {name: p["wall_s"] for name, p in report["phases"].items()}
+            row = {"axis": axis, "value": value, "lines": inp.count("\n"),
+                   "wall_s": report["total"]["wall_s"], "peak_bytes": report["total"]["peak_bytes"], "phases": phases}
+            results.append(row)
+            print(f"{axis:<12} {value:>6} {row['lines']:>7} lines {row['wall_s']*1000:10.1f} ms  "
+                  + "  ".join(f"{k} {v*1000:.1f}" for k, v in phases.items() if v))
+    doc = {"compiler_version": compiler_version(), "python": platform.python_version(),
+           "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "seed": args.seed, "repeat": args.repeat, "results": results}
+    if args.save:
+        os.makedirs(args.save, exist_ok=True)
+        for name in (doc["compiler_version"]+".json", "latest.json"):
+            with open(os.path.join(args.save, name), "w") as f:
+                json.dump(doc, f, indent=1)
+        print(f"results saved to {os.path.join(args.save, doc['compiler_version']+'.json')}")
+    if args.compare:
+        return compare(doc, args.compare, args.threshold)
+    return 0
+
+def compare(doc, path, threshold):
+    with open(path) as f:
+        old = json.load(f)
+    base = {(r["axis"], r["value"]): r for r in old["results"]}
+    worse = 0
+    print(f"compared with {old['compiler_version']} ({old['time']})")
+    for r in doc["results"]:
+        b = base.get((r["axis"], r["value"]))
+        if b is None or not b["wall_s"]:
+            continue
+        ratio = r["wall_s"]/b["wall_s"]
+        flag = ""
+        if ratio > 1+threshold:
+            worse += 1
+            flag = "  REGRESSION"
+        print(f"{r['axis']:<12} {r['value']:>6} {b['wall_s']*1000:10.1f} -> {r['wall_s']*1000:10.1f} ms  x{ratio:.2f}{flag}")
+    if worse:
+        print(f"FAIL: {worse} points slower by more than {threshold*100:.0f}%")
+        return 1
+    return 0
+
+def ast_footprint(root):
+    # bytes held by the tree itself: nodes, their attribute storage and the
+    # containers they own. Leaf values and TAC quads are left out; objects
+    # shared between nodes (like an empty code buffer) count once.
+    from draw import Node, walk
+    seen = set()
+    total = [0, 0]
+    def size(obj):
+        if obj is None or id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        return sys.getsizeof(obj)
+    def visit(nid, item, parent, key):
+        if not isinstance(item, Node):
+            return
+        total[0] += 1
+        n = size(item)
+        if hasattr(item, "__dict__"):
+            # the dict-based layout of older checkouts, kept comparable
+            n += size(item.__dict__)+size(item.children)
+            for v in (item.children or {}).values():
+                if isinstance(v, list):
+                    n += size(v)
+        else:
+            n += size(item._kids)
+        if isinstance(item._value, list):
+            n += size(item._value)
+        if not len(item.code):
+            n += size(item.code)
+        total[1] += n
+    walk(root, pre=visit)
+    return total[0], total[1]
+
+def memory(args):
+    import gc
+    import tracemalloc
+    import corpus
+    from parser import Compiler
+    inp = corpus.generate(args.seed, statements=args.statements)
+    compiler = Compiler(symtab_csv=None)
+    gc.collect()
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = compiler.compile(inp)
+    gc.collect()
+    traced = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    if result is None or compiler.errors:
+        raise RuntimeError("benchmark input failed to compile: "+"; ".join(compiler.errors))
+    nodes, own = ast_footprint(result)
+    print(f"{inp.count(chr(10))} lines, {nodes} AST nodes")
+    print(f"tree storage   {own/nodes:8.1f} bytes/node  {own/1024/1024:8.2f} MiB")
+    print(f"whole compile  {traced/nodes:8.1f} bytes/node  {traced/1024/1024:8.2f} MiB (tree, TAC and symbol tables)")
+    return 0
+
+def optimize_bench(args):
+    # quads left after each pass, and the time it took, along corpus sweeps
+    import corpus
+    import optimize
+    from ir import Program
+    from parser import Compiler
+    passes = optimize.parse_passes(args.passes)
+    compiler = Compiler(symtab_csv=None)
+    totals = {}
+    print(f"{'':<12} {'':>6} {'quads':>8}  "+"  ".join(f"{p:>16}" for p in passes))
+    for axis in args.axis:
+        values = SWEEPS[axis][:2] if args.quick else SWEEPS[axis]
+        for value, inp in corpus.sweep(axis, values, args.seed, jumps=not args.no_jumps):
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = compiler.compile(inp)
+            if result is None or compiler.errors:
+                raise RuntimeError("corpus program failed to compile: "+"; ".join(compiler.errors))
+            program = Program.from_quads(result.code)
+            cells = []
+            for name in passes:
+                t = time.perf_counter()
+                program, report = optimize.optimize(program, [name], compiler.global_names())
+                r = report[0]
+                cells.append(f"{r['after']:>8} {(time.perf_counter()-t)*1000:5.0f}ms")
+                t = totals.setdefault(name, {})
+                for k, v in r.items():
+                    if k != "pass" and not isinstance(v, dict):
+                        t[k] = t.get(k, 0)+v
+            print(f"{axis:<12} {value:>6} {len(result.code):>8}  "+"  ".join(f"{c:>16}" for c in cells))
+    for name in passes:
+        t = dict(totals[name])
+        before, after = t.pop("before"), t.pop("after")
+        print(f"{name:<12} {before:>9} -> {after:>9} quads ({(before-after)/before*100 if before else 0:.1f}% removed)  "
+              + "  ".join(f"{k} {v}" for k, v in t.items()))
+    return 0
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="compiler benchmarks")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sp = sub.add_parser("scaling", help="parse time vs. number of statements in one function")
+    sp.add_argument("--sizes", type=int, nargs="+", default=[2000, 4000, 8000, 16000])
+    sp.add_argument("--repeat", type=int, default=1)
+    sp.add_argument("--max-growth", type=float, default=2.0)
+    sp.set_defaults(func=scaling)
+    sp = sub.add_parser("startup", help="time to import the compiler with and without the table cache")
+    sp.add_argument("--runs", type=int, default=10)
+    sp.set_defaults(func=startup)
+    sp = sub.add_parser("corpus", help="per-phase times over synthetic programs scaled along each axis")
+    sp.add_argument("--axis", nargs="+", choices=list(SWEEPS))
+    sp.add_argument("--quick", action="store_true", help="only the two smallest points per axis")
+    sp.add_argument("--repeat", type=int, default=3)
+    sp.add_argument("--seed", type=int, default=0)
+    sp.add_argument("--memory", action="store_true", help="also trace peak memory (slows every phase down)")
+    sp.add_argument("--save", nargs="?", const="bench_results", default=None, metavar="DIR",
+                    help="write <compiler version>.json and latest.json to DIR")
+    sp.add_argument("--compare", metavar="FILE", help="earlier results to check against")
+    sp.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown before a point counts as a regression")
+    sp.set_defaults(func=corpus_bench)
+    sp = sub.add_parser("memory", help="bytes per AST node on a corpus program")
+    sp.add_argument("--statements", type=int, default=1600)
+    sp.add_argument("--seed", type=int, default=0)
+    sp.set_defaults(func=memory)
+    sp = sub.add_parser("optimize", help="quads removed by each optimisation pass on the corpus")
+    sp.add_argument("--axis", nargs="+", choices=list(SWEEPS), default=["statements"])
+    sp.add_argument("--passes", help="comma separated, in order (default: optimize.DEFAULT)")
+    sp.add_argument("--quick", action="store_true", help="only the two smallest points per axis")
+    sp.add_argument("--seed", type=int, default=0)
+    sp.add_argument("--no-jumps", action="store_true", help="corpus without break/continue")
+    sp.set_defaults(func=optimize_bench)
+    args = ap.parse_args(argv)
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
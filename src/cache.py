@@ -0,0 +1,210 @@
+import sys
+import os
+import io
+import json
+import fcntl
+import pickle
+import hashlib
+import tempfile
+import argparse
+import contextlib
+import tables
+
+# On-disk cache of compilation results keyed by sha256(compiler version +
+# source). An entry holds everything a compile leaves behind (tac.txt,
+# AST.dot, symtables.csv, console output, errors), so a hit replays it
+# without running the lexer or parser. Entries are evicted least recently
+# used first once the cache grows past max_bytes.
+#   python cache.py stats|clear [--dir DIR]
+
+DEFAULT_MAX_BYTES = 256*1024*1024
+OUTPUTS = {"tac": "tac.txt", "ast": "AST.dot", "symtables": "symtables.csv"}
+
+_version = None
+
+def compiler_version():
+    # digest of every module next to this one, the passes of optimize.py
+    # included, so any edit to the compiler invalidates
+    global _version
+    if _version is None:
+        here = os.path.dirname(os.path.abspath(__file__))
+        h = hashlib.sha256(str(tables.CACHE_VERSION).encode())
+        for name in sorted(os.listdir(here)):
+            if not name.endswith(".py"):
+                continue
+            h.update(name.encode()+b"\0")
+            with open(os.path.join(here, name), "rb") as f:
+                h.update(f.read())
+        _version = h.hexdigest()[:16]
+    return _version
+
+def default_dir():
+    return os.path.join(tables.cache_dir(), "build")
+
+class CompileCache:
+    def __init__(self, root=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = root or default_dir()
+        self.max_bytes = max_bytes
+        os.makedirs(self.root, exist_ok=True)
+
+    def key(self, source, options=""):
+        # options: anything besides the source that changes the output
+        h = hashlib.sha256(compiler_version().encode()+b"\0")
+        h.update(options.encode()+b"\0")
+        h.update(source.encode())
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], key+".pickle")
+
+    @contextlib.contextmanager
+    def _locked_stats(self):
+        # stats.json is shared by every process using the cache
+        with open(os.path.join(self.root, "stats.lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            path = os.path.join(self.root, "stats.json")
+            try:
+                with open(path) as f:
+                    stats = json.load(f)
+            except (OSError, ValueError):
+                stats = {"hits": 0, "misses": 0, "evictions": 0, "bytes": None}
+            yield stats
+            tmp = f"{path}.{os.getpid()}"
+            with open(tmp, "w") as f:
+                json.dump(stats, f)
+            os.replace(tmp, path)
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+            os.utime(path)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            entry = None
+        with self._locked_stats() as stats:
+            stats["hits" if entry is not None else "misses"] += 1
+        return entry
+
+    def put(self, key, entry):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}"
+        with open(tmp, "wb") as f:
+            pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+        size = os.path.getsize(tmp)
+        try:
+            # an entry written over only adds the difference
+            size -= os.path.getsize(path)
+        except OSError:
+            pass
+        os.replace(tmp, path)
+        with self._locked_stats() as stats:
+            if stats["bytes"] is None:
+                stats["bytes"] = self._scan_bytes()
+            else:
+                stats["bytes"] += size
+            if stats["bytes"] > self.max_bytes:
+                self._evict(stats)
+
+    def _entries(self):
+        for d in os.listdir(self.root):
+            sub = os.path.join(self.root, d)
+            if len(d) == 2 and os.path.isdir(sub):
+                for name in os.listdir(sub):
+                    if name.endswith(".pickle"):
+                        p = os.path.join(sub, name)
+                        try:
+                            st = os.stat(p)
+                        except OSError:
+                            continue
+                        yield p, st.st_size, st.st_mtime
+
+    def _scan_bytes(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self, stats):
+        # drop least recently used entries until 90% of the limit is left
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes*0.9
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            stats["evictions"] += 1
+        stats["bytes"] = total
+
+    def stats(self):
+        with self._locked_stats() as stats:
+            stats["bytes"] = self._scan_bytes()
+            result = dict(stats)
+        result["entries"] = sum(1 for _ in self._entries())
+        lookups = result["hits"]+result["misses"]
+        result["hit_rate"] = result["hits"]/lookups if lookups else 0.0
+        return result
+
+    def clear(self):
+        n = 0
+        for path, _, _ in list(self._entries()):
+            os.remove(path)
+            n += 1
+        with self._locked_stats() as stats:
+            stats.update(hits=0, misses=0, evictions=0, bytes=0)
+        return n
+
+def compile_cached(cache, inp, outdir, compiler):
+    # same effect as compiler.compile_to plus printing the errors; returns
+    # (ok, errors, hit). Failed compiles are not stored.
+    key = cache.key(inp, ",".join(compiler.passes or ()))
+    entry = cache.get(key)
+    hit = entry is not None
+    if not hit:
+        entry = compile_entry(inp, compiler)
+        if entry["ok"]:
+            cache.put(key, entry)
+    for k, name in OUTPUTS.items():
+        if k in entry:
+            with open(os.path.join(outdir, name), "w", newline="") as f:
+                f.write(entry[k])
+    sys.stdout.write(entry["stdout"])
+    compiler.opt_report = entry.get("opt_report")
+    return entry["ok"], entry["errors"], hit
+
+def compile_entry(inp, compiler):
+    out = io.StringIO()
+    with tempfile.TemporaryDirectory() as tmp:
+        with contextlib.redirect_stdout(out):
+            result = compiler.compile_to(inp, tmp)
+            for err in compiler.errors:
+                print(err)
+        entry = {"stdout": out.getvalue(), "errors": list(compiler.errors),
+                 "ok": result is not None and not compiler.errors,
+                 "opt_report": compiler.opt_report}
+        for k, name in OUTPUTS.items():
+            path = os.path.join(tmp, name)
+            if os.path.exists(path):
+                with open(path, newline="") as f:
+                    entry[k] = f.read()
+    return entry
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="inspect the compilation cache")
+    ap.add_argument("cmd", choices=["stats", "clear"])
+    ap.add_argument("--dir", default=None)
+    args = ap.parse_args(argv)
+    cache = CompileCache(args.dir)
+    if args.cmd == "clear":
+        print(f"removed {cache.clear()} entries from {cache.root}")
+    else:
+        s = cache.stats()
+        print(f"{cache.root}: {s['entries']} entries, {s['bytes']/1024:.1f} KiB, "
+              f"{s['hits']} hits, {s['misses']} misses ({s['hit_rate']*100:.1f}% hit rate), {s['evictions']} evictions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
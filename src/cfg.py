@@ -0,0 +1,391 @@
+import sys
+import argparse
+import ir
+from ir import Op
+
+# Basic blocks, dominators and natural loops over TAC, one Function per
+# "name:" label. Blocks keep their layout order; a block without a
+# terminator falls through to the next one, so to_program just concatenates
+# them. Quads in blocks are (op, x, y, z) tuples as ir.Program yields them.
+# BREAK/CONTINUE (only found in TAC from before the parser lowered them to
+# GOTOs) have no target; a function using them is marked opaque and passes
+# leave it alone.
+#   python cfg.py tac.txt [--function main] [--dot cfg.dot]
+
+JUMPS = frozenset([Op.GOTO]) | ir.IF_OPS
+TERMINATORS = JUMPS | frozenset([Op.RETURN, Op.BREAK, Op.CONTINUE])
+
+class Block:
+    __slots__ = ("id", "quads", "succ", "pred", "idom", "dom", "rpo", "pre", "post", "loop", "phis")
+
+    def __init__(self, id, quads):
+        self.id = id
+        self.quads = quads
+        self.succ = []
+        self.pred = []
+        self.idom = None
+        self.dom = []
+        self.rpo = None
+        self.pre = None
+        self.post = None
+        self.loop = None
+        # phi functions while the function is in SSA form (see ssa.py)
+        self.phis = []
+
+    @property
+    def label(self):
+        if self.quads and self.quads[0][0] == Op.LABEL:
+            return self.quads[0][1]
+        return None
+
+    @property
+    def terminator(self):
+        if self.quads and self.quads[-1][0] in TERMINATORS:
+            return self.quads[-1]
+        return None
+
+    @property
+    def depth(self):
+        return self.loop.depth if self.loop is not None else 0
+
+    def __repr__(self):
+        return f"B{self.id}"
+
+class Loop:
+    __slots__ = ("header", "blocks", "latches", "parent", "children", "depth")
+
+    def __init__(self, header, blocks, latches):
+        self.header = header
+        self.blocks = blocks
+        self.latches = latches
+        self.parent = None
+        self.children = []
+        self.depth = 1
+
+    def exits(self):
+        # (inside, outside) edges leaving the loop
+        return [(b, s) for b in self.blocks for s in b.succ if s not in self.blocks]
+
+    def __repr__(self):
+        return f"Loop({self.header!r}, {len(self.blocks)} blocks, depth {self.depth})"
+
+class Function:
+    def __init__(self, name, blocks):
+        self.name = name
+        self.blocks = blocks
+        self.loops = []
+        # SSA name -> the name it was made from, while in SSA form (ssa.py)
+        self.origin = {}
+        self.link()
+
+    @classmethod
+    def from_quads(cls, name, quads):
+        return cls(name, _blocks(quads))
+
+    def replace(self, quads):
+        # new body from a flat quad list, e.g. after a pass over the text
+        self.blocks = _blocks(quads)
+        self.link()
+        self.analyze()
+
+    @property
+    def entry(self):
+        return self.blocks[0]
+
+    @property
+    def editable(self):
+        # passes leave the top-level code and opaque functions alone
+        return self.name is not None and not self.opaque
+
+    def link(self):
+        # (re)number blocks and rebuild the edges from the quads
+        self.labels = {}
+        for i, b in enumerate(self.blocks):
+            b.id = i
+            b.succ = []
+            b.pred = []
+            if b.label is not None:
+                self.labels[b.label] = b
+        self.opaque = False
+        n = len(self.blocks)
+        for i, b in enumerate(self.blocks):
+            nxt = self.blocks[i+1] if i+1 < n else None
+            t = b.terminator
+            op = t[0] if t else None
+            if op == Op.GOTO:
+                targets = [self.target(t[1])]
+            elif op in ir.IF_OPS:
+                targets = [nxt, self.target(t[3])]
+            elif op == Op.RETURN:
+                targets = []
+            elif op in (Op.BREAK, Op.CONTINUE):
+                targets = []
+                self.opaque = True
+            else:
+                targets = [nxt]
+            for s in targets:
+                if s is not None and s not in b.succ:
+                    b.succ.append(s)
+                    s.pred.append(b)
+
+    def target(self, label):
+        b = self.labels.get(label)
+        if b is None:
+            raise ValueError(f"{self.name}: jump to unknown label {label}")
+        return b
+
+    def rpo(self):
+        # reachable blocks in reverse postorder
+        entry = self.entry
+        seen = {entry}
+        post = []
+        stack = [(entry, iter(entry.succ))]
+        while stack:
+            b, it = stack[-1]
+            for s in it:
+                if s not in seen:
+                    seen.add(s)
+                    stack.append((s, iter(s.succ)))
+                    break
+            else:
+                stack.pop()
+                post.append(b)
+        post.reverse()
+        return post
+
+    def analyze(self):
+        self.dominators()
+        self.find_loops()
+        return self
+
+    def dominators(self):
+        # Cooper, Harvey and Kennedy, "A Simple, Fast Dominance Algorithm"
+        for b in self.blocks:
+            b.idom = None
+            b.rpo = None
+            b.dom = []
+            b.pre = b.post = None
+        order = self.rpo()
+        for i, b in enumerate(order):
+            b.rpo = i
+        entry = order[0]
+        entry.idom = entry
+        changed = True
+        while changed:
+            changed = False
+            for b in order[1:]:
+                new = None
+                for p in b.pred:
+                    if p.idom is None:
+                        continue
+                    new = p if new is None else _intersect(p, new)
+                if b.idom is not new:
+                    b.idom = new
+                    changed = True
+        entry.idom = None
+        for b in order[1:]:
+            b.idom.dom.append(b)
+        # pre/post numbers on the dominator tree answer dominates() in O(1)
+        n = 0
+        stack = [(entry, False)]
+        while stack:
+            b, done = stack.pop()
+            if done:
+                b.post = n
+            else:
+                b.pre = n
+                stack.append((b, True))
+                stack.extend((c, False) for c in reversed(b.dom))
+            n += 1
+        return order
+
+    def dominates(self, a, b):
+        if a.pre is None or b.pre is None:
+            return False
+        return a.pre <= b.pre and b.post <= a.post
+
+    def find_loops(self):
+        # natural loops of the back edges t -> h (h dominates t); loops with
+        # the same header are merged. Retreating edges into a block that does
+        # not dominate their source (irreducible flow) form no loop.
+        latches = {}
+        for b in self.blocks:
+            b.loop = None
+            for s in b.succ:
+                if self.dominates(s, b):
+                    latches.setdefault(s, []).append(b)
+        loops = []
+        for h, ls in latches.items():
+            body = {h}
+            work = [l for l in ls if l is not h]
+            body.update(work)
+            while work:
+                x = work.pop()
+                for p in x.pred:
+                    if p not in body and p.rpo is not None:
+                        body.add(p)
+                        work.append(p)
+            loops.append(Loop(h, body, ls))
+        # outermost first: when a loop is reached, its header's current loop
+        # is the smallest one seen so far that encloses it
+        loops.sort(key=lambda l: len(l.blocks), reverse=True)
+        for l in loops:
+            parent = l.header.loop
+            if parent is not None:
+                l.parent = parent
+                l.depth = parent.depth+1
+                parent.children.append(l)
+            for b in l.blocks:
+                b.loop = l
+        self.loops = loops
+        return loops
+
+    def liveness(self, exit_live=frozenset(), call_live=frozenset()):
+        # live variables at block entry and exit. exit_live is live when the
+        # function returns, call_live is read by every CALL.
+        gen = {}
+        kill = {}
+        for b in self.blocks:
+            g = set()
+            k = set()
+            for q in reversed(b.quads):
+                g, k = _backward(q, g, k, call_live)
+            gen[b] = g
+            kill[b] = k
+        live_in = {b: set() for b in self.blocks}
+        live_out = {b: set() for b in self.blocks}
+        work = list(self.blocks)
+        queued = set(work)
+        while work:
+            b = work.pop()
+            queued.discard(b)
+            out = set(exit_live) if not b.succ else set()
+            for s in b.succ:
+                out |= live_in[s]
+            live_out[b] = out
+            new = gen[b] | (out-kill[b])
+            if new != live_in[b]:
+                live_in[b] = new
+                for p in b.pred:
+                    if p not in queued:
+                        queued.add(p)
+                        work.append(p)
+        return live_in, live_out
+
+    def quads(self):
+        for b in self.blocks:
+            yield from b.quads
+
+def _blocks(quads):
+    # leaders: the first quad, every label and every quad after a jump
+    blocks = []
+    cur = []
+    for q in quads:
+        if q[0] == Op.LABEL and cur:
+            blocks.append(cur)
+            cur = []
+        cur.append(q)
+        if q[0] in TERMINATORS:
+            blocks.append(cur)
+            cur = []
+    if cur or not blocks:
+        blocks.append(cur)
+    return [Block(i, b) for i, b in enumerate(blocks)]
+
+def _backward(q, gen, kill, call_live):
+    # gen/kill of a block extended backwards by q
+    op = q[0]
+    if ir.defines(op):
+        gen.discard(q[1])
+        kill.add(q[1])
+    for i in ir.reads(op):
+        t = q[i]
+        if ir.classify(t) != ir.Kind.CONST:
+            gen.add(t)
+    if op == Op.CALL:
+        gen |= call_live
+    return gen, kill
+
+def _intersect(a, b):
+    while a is not b:
+        while a.rpo > b.rpo:
+            a = a.idom
+        while b.rpo > a.rpo:
+            b = b.idom
+    return a
+
+def split(quads):
+    # (name, quads) per function; code ahead of the first function (global
+    # array allocations) comes first under the name None
+    units = []
+    name = None
+    cur = []
+    for q in quads:
+        if q[0] == Op.FUNC:
+            if cur:
+                units.append((name, cur))
+            name = q[1]
+            cur = []
+        cur.append(q)
+    if cur:
+        units.append((name, cur))
+    return units
+
+def build(program, analyze=True):
+    funcs = [Function.from_quads(name, quads) for name, quads in split(program)]
+    if analyze:
+        for f in funcs:
+            f.analyze()
+    return funcs
+
+def to_program(funcs):
+    prog = ir.Program()
+    for f in funcs:
+        for q in f.quads():
+            prog.append(*q)
+    return prog
+
+def dump(f, out):
+    out.write(f"function {f.name}: {len(f.blocks)} blocks, {len(f.loops)} loops{' (opaque)' if f.opaque else ''}\n")
+    for b in f.blocks:
+        info = f"  {b!r}"
+        if b.label:
+            info += f" [{b.label}]"
+        info += f" pred {','.join(map(repr, b.pred)) or '-'} succ {','.join(map(repr, b.succ)) or '-'}"
+        info += f" idom {b.idom!r}" if b.idom is not None else (" entry" if b is f.entry else " unreachable")
+        if b.loop is not None:
+            info += f" loop {b.loop.header!r} depth {b.depth}"
+        out.write(info+"\n")
+        for q in b.quads:
+            out.write("      "+ir.format_quad(q)+"\n")
+
+def write_dot(funcs, path):
+    with open(path, "w") as f:
+        f.write("digraph CFG {\nnode [shape=box, fontname=monospace];\n")
+        for k, fn in enumerate(funcs):
+            f.write(f"subgraph cluster{k} {{\nlabel=\"{fn.name}\";\n")
+            for b in fn.blocks:
+                text = "\\l".join(ir.format_quad(q).replace("\\", "\\\\").replace('"', '\\"') for q in b.quads)
+                f.write(f"f{k}b{b.id} [label=\"B{b.id}\\l{text}\\l\"];\n")
+                for s in b.succ:
+                    f.write(f"f{k}b{b.id} -> f{k}b{s.id};\n")
+            f.write("}\n")
+        f.write("}\n")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="basic blocks, dominators and loops of a TAC file")
+    ap.add_argument("tac")
+    ap.add_argument("--function")
+    ap.add_argument("--dot", metavar="FILE", help="also write the CFG as DOT")
+    args = ap.parse_args(argv)
+    funcs = build(ir.read(args.tac))
+    if args.function:
+        funcs = [f for f in funcs if f.name == args.function]
+    for f in funcs:
+        dump(f, sys.stdout)
+    if args.dot:
+        write_dot(funcs, args.dot)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+import os
+import argparse
+
+# The command line of parser.py. client.py takes the same arguments and
+# sends the ones that change the compilation to the server as the
+# "options" of its request (see server.py); --tac-bin and --render are
+# done by whichever side ends up with the outputs in the current directory.
+
+def arg_parser(description=None):
+    ap = argparse.ArgumentParser(description=description)
+    ap.add_argument("file")
+    ap.add_argument("--cache", nargs="?", const="", default=None, metavar="DIR", help="reuse results of unchanged sources")
+    ap.add_argument("--tac-bin", action="store_true", help="also write tac.bin, the binary TAC format of tacbin.py")
+    ap.add_argument("--render", metavar="FMT", help="also render AST.dot to AST.FMT (needs pydot and graphviz)")
+    ap.add_argument("-O", dest="passes", nargs="?", const="", default=None, metavar="PASSES", help="optimise the TAC (comma separated passes of optimize.py, default all)")
+    ap.add_argument("--opt-report", action="store_true", help="print what each optimisation pass removed to stderr")
+    ap.add_argument("--time-report", nargs="?", const="text", choices=["text", "json"], help="print per-phase time and peak memory to stderr (bypasses --cache)")
+    return ap
+
+def options(args):
+    # what a compile request carries besides the source
+    return {"passes": args.passes, "opt_report": args.opt_report, "time_report": args.time_report}
+
+def finish(args, ok, program=None):
+    # --tac-bin and --render once the outputs are in the current directory;
+    # program is the TAC if it is still in memory
+    if not ok:
+        return
+    if args.tac_bin:
+        import tacbin
+        if program is None:
+            from ir import read
+            program = read("tac.txt")
+        tacbin.write(program, "tac.bin")
+    if args.render and os.path.exists("AST.dot"):
+        from draw import render
+        render("AST.dot", args.render)
@@ -0,0 +1,67 @@
+import sys
+import os
+import json
+import socket
+import argparse
+
+# Drop-in replacement for parser.py that hands the work to a running
+# server.py. It takes the same arguments (cli.py) plus --socket and
+# --no-fallback; outputs land in the current directory exactly as with the
+# normal CLI, and without a server the file is compiled in-process. --cache
+# only applies then: the server caches if it was started with --cache.
+
+OUTPUTS = {"tac": "tac.txt", "ast": "AST.dot", "symtables": "symtables.csv"}
+
+def request(sock_path, req):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(sock_path)
+        s.sendall(json.dumps(req).encode()+b"\n")
+        f = s.makefile("rb")
+        line = f.readline()
+    if not line:
+        raise ConnectionError("server closed the connection")
+    return json.loads(line)
+
+def compile_remote(sock_path, file, options=None):
+    with open(file, 'r') as fl:
+        inp = fl.read()
+    req = {"op": "compile", "file": file, "source": inp}
+    if options:
+        req["options"] = options
+    resp = request(sock_path, req)
+    for key, name in OUTPUTS.items():
+        if key in resp:
+            with open(name, "w", newline="") as f:
+                f.write(resp[key])
+    sys.stdout.write(resp["stdout"])
+    return resp
+
+def main(argv=None):
+    from server import default_socket
+    from cli import arg_parser, options, finish
+    ap = arg_parser(description="compile through the compile server")
+    ap.add_argument("--socket", default=default_socket())
+    ap.add_argument("--no-fallback", action="store_true", help="fail instead of compiling locally when no server runs")
+    args = ap.parse_args(argv)
+    try:
+        resp = compile_remote(args.socket, args.file, options(args))
+    except (ConnectionError, FileNotFoundError, socket.error) as e:
+        if args.no_fallback or not os.path.exists(args.file):
+            print(f"client: {e}", file=sys.stderr)
+            return 2
+        from parser import run
+        return run(args)
+    if not resp["ok"] and not resp["stdout"]:
+        # the server failed before the compiler printed anything
+        for err in resp.get("errors", ()):
+            print(f"client: {err}", file=sys.stderr)
+    if "time_report" in resp:
+        print(resp["time_report"], file=sys.stderr)
+    if args.opt_report and resp.get("opt_report"):
+        from optimize import format_report
+        print(format_report(resp["opt_report"]), file=sys.stderr)
+    finish(args, resp["ok"])
+    return 0 if resp["ok"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+import heapq
+from ir import Op, Kind, BINARY_OPS, UNARY_OPS, IF_OPS, classify, defines, reads
+
+# Constant folding and conditional constant propagation. This is Wegman and
+# Zadeck's conditional constant propagation run over the CFG without SSA:
+# the state at a block entry maps variables to the literal they are known
+# to hold (a missing name is not a constant), only blocks reached over
+# executable edges are evaluated, and an IF whose operands are constant
+# marks a single successor executable. The code is then rewritten:
+#   - constant operands are substituted, constant expressions folded;
+#   - decided IFs become a GOTO or disappear;
+#   - blocks never found executable are dropped;
+#   - folded temps left without readers are removed.
+# Only int and bool literals are folded; char and string literals are just
+# propagated. Arithmetic is C's on 32-bit ints; a fold that would overflow
+# or divide by zero is left to run time.
+
+INT_MIN = -2**31
+INT_MAX = 2**31-1
+
+def value(text):
+    # int value of an int or bool literal, None for anything else
+    if text is None:
+        return None
+    if text == "true":
+        return 1
+    if text == "false":
+        return 0
+    if text.isdigit() or (text[:1] == "-" and text[1:].isdigit()):
+        return int(text)
+    return None
+
+def c_div(a, b):
+    q = abs(a)//abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+def c_mod(a, b):
+    return a-b*c_div(a, b)
+
+def c_shl(a, b):
+    # shifts wrap like the multiplication they stand for
+    r = (a << b) & 0xffffffff
+    return r-(1 << 32) if r & 0x80000000 else r
+
+BINARY = {
+    Op.ADD: lambda a, b: a+b,
+    Op.SUB: lambda a, b: a-b,
+    Op.MUL: lambda a, b: a*b,
+    Op.DIV: lambda a, b: c_div(a, b) if b else None,
+    Op.MOD: lambda a, b: c_mod(a, b) if b else None,
+    Op.LT: lambda a, b: int(a < b),
+    Op.GT: lambda a, b: int(a > b),
+    Op.LE: lambda a, b: int(a <= b),
+    Op.GE: lambda a, b: int(a >= b),
+    Op.EQ: lambda a, b: int(a == b),
+    Op.NE: lambda a, b: int(a != b),
+    Op.BAND: lambda a, b: a & b,
+    Op.BXOR: lambda a, b: a ^ b,
+    Op.BOR: lambda a, b: a | b,
+    Op.AND: lambda a, b: int(bool(a) and bool(b)),
+    Op.OR: lambda a, b: int(bool(a) or bool(b)),
+    Op.SHL: lambda a, b: c_shl(a, b) if 0 <= b < 32 else None,
+    Op.SHR: lambda a, b: a >> b if 0 <= b < 32 else None,
+}
+UNARY = {
+    Op.NEG: lambda a: -a,
+    Op.POS: lambda a: a,
+    Op.NOT: lambda a: int(not a),
+    Op.BNOT: lambda a: ~a,
+}
+BRANCH = {
+    Op.IF_EQ: lambda a, b: a == b,
+    Op.IF_NE: lambda a, b: a != b,
+    Op.IF_LT: lambda a, b: a < b,
+    Op.IF_LE: lambda a, b: a <= b,
+    Op.IF_GT: lambda a, b: a > b,
+    Op.IF_GE: lambda a, b: a >= b,
+}
+
+def fold(op, a, b=None):
+    # literal text of op applied to literals a (and b), None if not foldable
+    va = value(a)
+    if va is None:
+        return None
+    if op in UNARY:
+        r = UNARY[op](va)
+    else:
+        vb = value(b)
+        if vb is None or op not in BINARY:
+            return None
+        r = BINARY[op](va, vb)
+    if r is None or not INT_MIN <= r <= INT_MAX:
+        return None
+    return str(r)
+
+class _State:
+    def __init__(self, f, ctx):
+        self.f = f
+        self.ctx = ctx
+        # names whose address is taken may change behind our back
+        self.escaped = {q[2] for b in f.blocks for q in b.quads if q[0] == Op.ADDR}
+        names = {t for q in f.quads() for t in q[1:] if t is not None}
+        self.consts = {t for t in names if classify(t) == Kind.CONST}
+        # temps seen in a single block are dropped from the state when it
+        # ends, which keeps the states small
+        home = {}
+        for b in f.blocks:
+            for q in b.quads:
+                for t in q[1:]:
+                    if t is not None and home.get(t, b) is b and classify(t) == Kind.TEMP:
+                        home[t] = b
+                    elif t in home and home[t] is not b:
+                        home[t] = None
+        self.local = {}
+        for t, b in home.items():
+            if b is not None:
+                self.local.setdefault(b, []).append(t)
+        # what a call may overwrite
+        self.clobbered = {t for t in names if classify(t) == Kind.VAR and ctx.may_be_global(t)}
+
+    def lookup(self, env, text):
+        if text in self.consts:
+            return text
+        return env.get(text)
+
+    def step(self, q, env):
+        # evaluates q into env; returns the quad rewritten with what is known
+        op, x, y, z = q
+        if op == Op.COPY:
+            v = self.lookup(env, y)
+            self.assign(env, x, v)
+            return (op, x, v or y, z)
+        if op in BINARY_OPS:
+            a, b = self.lookup(env, y), self.lookup(env, z)
+            r = fold(op, a, b)
+            self.assign(env, x, r)
+            return (Op.COPY, x, r, None) if r is not None else (op, x, a or y, b or z)
+        if op in UNARY_OPS and op != Op.ADDR:
+            a = self.lookup(env, y)
+            r = fold(op, a)
+            self.assign(env, x, r)
+            return (Op.COPY, x, r, None) if r is not None else (op, x, a or y, z)
+        if op == Op.CALL:
+            for name in [n for n in env if n in self.clobbered]:
+                del env[name]
+            return q
+        if op in IF_OPS:
+            return (op, self.lookup(env, x) or x, self.lookup(env, y) or y, z)
+        if op == Op.GETIDX:
+            env.pop(x, None)
+            return (op, x, y, self.lookup(env, z) or z)
+        if op in (Op.PARAM, Op.STORE_RET, Op.OUT):
+            return (op, self.lookup(env, x) or x, y, z)
+        if defines(op) or op == Op.ADDR:
+            env.pop(x, None)
+        return q
+
+    def assign(self, env, x, v):
+        if v is None or x in self.escaped:
+            env.pop(x, None)
+        else:
+            env[x] = v
+
+    def block(self, b, env):
+        # runs b from env; returns (rewritten quads, executable successors)
+        out = []
+        for q in b.quads:
+            out.append(self.step(q, env))
+        for t in self.local.get(b, ()):
+            env.pop(t, None)
+        t = out[-1] if out else None
+        f = self.f
+        nxt = f.blocks[b.id+1] if b.id+1 < len(f.blocks) else None
+        if t is not None and t[0] in IF_OPS:
+            a, c = value(t[1]), value(t[2])
+            if a is not None and c is not None:
+                taken = f.labels[t[3]]
+                if BRANCH[t[0]](a, c):
+                    out[-1] = (Op.GOTO, t[3], None, None)
+                    return out, [taken]
+                out.pop()
+                return out, [nxt] if nxt is not None else []
+        return out, b.succ
+
+def _meet(envs):
+    res = dict(envs[0])
+    for e in envs[1:]:
+        for k in [k for k, v in res.items() if e.get(k) != v]:
+            del res[k]
+    return res
+
+def run(f, ctx):
+    st = _State(f, ctx)
+    outs = {}
+    live_edges = set()
+    # blocks are taken in reverse postorder, so most see all their inputs
+    work = [(f.entry.rpo, f.entry.id, f.entry)]
+    queued = {f.entry}
+    while work:
+        b = heapq.heappop(work)[2]
+        queued.discard(b)
+        ins = [outs[p] for p in b.pred if (p, b) in live_edges]
+        env = _meet(ins) if ins else {}
+        _, succ = st.block(b, env)
+        changed = outs.get(b) != env
+        outs[b] = env
+        for s in succ:
+            if (b, s) not in live_edges:
+                live_edges.add((b, s))
+                changed = True
+        if changed:
+            for s in succ:
+                if s not in queued:
+                    queued.add(s)
+                    heapq.heappush(work, (s.rpo, s.id, s))
+    # rewrite with the final states
+    blocks = []
+    for b in f.blocks:
+        if b not in outs:
+            ctx.stats["blocks"] += 1
+            continue
+        ins = [outs[p] for p in b.pred if (p, b) in live_edges]
+        env = _meet(ins) if ins else {}
+        quads, _ = st.block(b, env)
+        for old, new in zip(b.quads, quads):
+            if new[0] == Op.COPY and old[0] != Op.COPY:
+                ctx.stats["folded"] += 1
+            ctx.stats["propagated"] += sum(1 for i in reads(old[0]) if new[0] == old[0] and new[i] != old[i])
+        if b.quads and b.quads[-1][0] in IF_OPS and (not quads or quads[-1][0] not in IF_OPS):
+            ctx.stats["branches"] += 1
+        b.quads = quads
+        blocks.append(b)
+    # folded temps nobody reads any more
+    readers = {}
+    for b in blocks:
+        for q in b.quads:
+            for i in reads(q[0]):
+                readers[q[i]] = readers.get(q[i], 0)+1
+    for b in blocks:
+        b.quads = [q for q in b.quads if not (q[0] == Op.COPY and classify(q[1]) == Kind.TEMP
+                                              and classify(q[2]) == Kind.CONST and not readers.get(q[1]))]
+    f.blocks = blocks
+    f.link()
+    f.analyze()
@@ -0,0 +1,240 @@
+import sys
+import os
+import random
+import argparse
+
+# Synthetic programs in the subset the compiler accepts (int/char/bool,
+# arrays, if/else, for/while, functions, cin/cout). Every knob scales one
+# axis independently:
+#   functions    helper functions besides main (each calls earlier ones)
+#   statements   statements per function body, nested ones included
+#   expr_depth   depth of arithmetic expression trees
+#   nesting      how deep blocks, ifs and loops may nest
+#   identifiers  int locals per function
+#   python corpus.py --statements 5000 -o big.cpp
+#   python corpus.py --sweep statements 100 1000 10000 -o corpus/
+
+AXES = ("functions", "statements", "expr_depth", "nesting", "identifiers")
+DEFAULTS = {"functions": 4, "statements": 200, "expr_depth": 3, "nesting": 2, "identifiers": 8}
+
+ARITH = ("+", "-", "*", "/", "%")
+RELOP = ("<", ">", "<=", ">=", "==", "!=")
+ARRAY_LEN = 8
+
+class ProgramGenerator:
+    def __init__(self, seed=0, functions=4, statements=200, expr_depth=3, nesting=2, identifiers=8, jumps=True, io=True):
+        self.rng = random.Random(seed)
+        self.functions = functions
+        self.statements = statements
+        self.expr_depth = expr_depth
+        self.nesting = nesting
+        self.identifiers = max(1, identifiers)
+        self.jumps = jumps
+        self.io = io
+
+    def generate(self):
+        out = ["int g0, g1;"]
+        for k in range(self.functions):
+            out += self.function(f"f{k}", k, ["a", "b"])
+        out += self.function("main", self.functions, [])
+        return "\n".join(out)+"\n"
+
+    def function(self, name, ncallees, params):
+        self.names = params+[f"v{i}" for i in range(self.identifiers)]
+        self.callees = [f"f{k}" for k in range(ncallees)]
+        self.block_id = 0
+        self.budget = self.statements
+        head = ", ".join("int "+p for p in params)
+        lines = [f"int {name}({head}){{"]
+        lines.append("    int "+", ".join(f"v{i}" for i in range(self.identifiers))+";")
+        lines.append("    int "+", ".join(f"c{d}" for d in range(self.nesting+1))+";")
+        lines.append(f"    int arr[{ARRAY_LEN}];")
+        lines.append("    char ch;")
+        lines.append("    bool flag;")
+        for i in range(self.identifiers):
+            lines.append(f"    v{i} = {i};")
+        lines.append("    flag = true;")
+        lines.append("    ch = 'a';")
+        lines.append("    g0 = g0 + 1;")
+        if name == "main":
+            lines.append("    g0 = 0;")
+            lines.append("    g1 = 1;")
+            if self.io:
+                lines.append("    cin >> v0;")
+            # make sure every helper is reachable
+            for f in self.callees:
+                lines.append(f"    {self.target()} = {f}({self.atom()}, {self.atom()});")
+        while self.budget > 0:
+            lines += self.statement(1, 0)
+        if name == "main":
+            lines.append("    cout << \"result: \" << v0 << g0;")
+            lines.append("    return 0;")
+        else:
+            lines.append(f"    return {self.rng.choice(self.names)};")
+        lines.append("}")
+        return lines
+
+    def target(self):
+        # parameters and locals; loop counters are never assigned in a body
+        return self.rng.choice(self.names)
+
+    def atom(self):
+        r = self.rng.random()
+        if r < 0.55:
+            return self.rng.choice(self.names)
+        if r < 0.9:
+            return str(self.rng.randint(0, 99))
+        return "g"+str(self.rng.randint(0, 1))
+
+    def expr(self, depth):
+        if depth <= 0 or self.rng.random() < 0.25:
+            if self.rng.random() < 0.1:
+                return f"arr[{self.rng.randint(0, ARRAY_LEN-1)}]"
+            return self.atom()
+        op = self.rng.choice(ARITH)
+        left = self.expr(depth-1)
+        if op in "/%":
+            right = str(self.rng.randint(1, 9))
+        else:
+            right = self.expr(depth-1)
+        return f"({left} {op} {right})"
+
+    def cond(self):
+        c = f"{self.expr(min(2, self.expr_depth))} {self.rng.choice(RELOP)} {self.atom()}"
+        r = self.rng.random()
+        if r < 0.15:
+            c = f"{c} && {self.rng.choice(self.names)} < {self.rng.randint(0, 99)}"
+        elif r < 0.3:
+            c = f"{c} || {self.rng.choice(self.names)} == {self.rng.randint(0, 99)}"
+        return c
+
+    def statement(self, indent, depth, in_loop=False):
+        self.budget -= 1
+        pad = "    "*indent
+        r = self.rng.random()
+        nested = depth < self.nesting and self.budget > 0
+        if nested and r < 0.08:
+            return self.if_st(indent, depth, in_loop)
+        if nested and r < 0.13:
+            return self.for_st(indent, depth)
+        if nested and r < 0.17:
+            return self.while_st(indent, depth)
+        if nested and r < 0.20:
+            return self.block(indent, depth, in_loop)
+        if in_loop and self.jumps and r < 0.22:
+            return [f"{pad}if ({self.cond()}) {self.rng.choice(['break', 'continue'])};"]
+        if self.callees and r < 0.30:
+            f = self.rng.choice(self.callees)
+            return [f"{pad}{self.target()} = {f}({self.atom()}, {self.atom()});"]
+        if r < 0.34:
+            return [f"{pad}{self.target()} = arr[{self.rng.choice(self.names)} % {ARRAY_LEN}];"]
+        if r < 0.38:
+            return [f"{pad}{self.target()} += {self.expr(self.expr_depth)};"]
+        if r < 0.41:
+            return [f"{pad}{self.target()}++;"]
+        if self.io and r < 0.44:
+            return [f"{pad}cout << {self.rng.choice(self.names)} << ch;"]
+        if r < 0.46:
+            return [f"{pad}flag = {self.rng.choice(['true', 'false'])};"]
+        return [f"{pad}{self.target()} = {self.expr(self.expr_depth)};"]
+
+    def body(self, indent, depth, in_loop):
+        n = self.rng.randint(1, 4)
+        lines = []
+        for _ in range(n):
+            if self.budget <= 0:
+                break
+            lines += self.statement(indent, depth, in_loop)
+        if not lines:
+            self.budget -= 1
+            lines = ["    "*indent+f"{self.target()} = {self.atom()};"]
+        return lines
+
+    def if_st(self, indent, depth, in_loop):
+        pad = "    "*indent
+        cond = "flag" if self.rng.random() < 0.1 else self.cond()
+        lines = [f"{pad}if ({cond}) {{"]
+        lines += self.body(indent+1, depth+1, in_loop)
+        if self.rng.random() < 0.5:
+            lines.append(f"{pad}}}")
+            lines.append(f"{pad}else {{")
+            lines += self.body(indent+1, depth+1, in_loop)
+        lines.append(f"{pad}}}")
+        return lines
+
+    def for_st(self, indent, depth):
+        pad = "    "*indent
+        c = f"c{depth}"
+        lines = [f"{pad}for ({c} = 0; {c} < {self.rng.randint(2, 6)}; {c}++) {{"]
+        lines += self.body(indent+1, depth+1, True)
+        if self.rng.random() < 0.3:
+            lines.append(f"{pad}    {self.target()} = arr[{c}];")
+        lines.append(f"{pad}}}")
+        return lines
+
+    def while_st(self, indent, depth):
+        pad = "    "*indent
+        c = f"c{depth}"
+        lines = [f"{pad}{c} = 0;", f"{pad}while ({c} < {self.rng.randint(2, 6)}) {{"]
+        # the counter is bumped first so a continue in the body cannot skip it
+        lines.append(f"{pad}    {c} = {c} + 1;")
+        lines += self.body(indent+1, depth+1, True)
+        lines.append(f"{pad}}}")
+        return lines
+
+    def block(self, indent, depth, in_loop):
+        pad = "    "*indent
+        self.block_id += 1
+        s = f"s{self.block_id}"
+        lines = [f"{pad}{{", f"{pad}    int {s};", f"{pad}    {s} = {self.expr(self.expr_depth)};"]
+        self.names.append(s)
+        lines += self.body(indent+1, depth+1, in_loop)
+        self.names.pop()
+        lines.append(f"{pad}    {self.target()} = {s};")
+        lines.append(f"{pad}}}")
+        return lines
+
+def generate(seed=0, **knobs):
+    params = dict(DEFAULTS)
+    params.update(knobs)
+    return ProgramGenerator(seed=seed, **params).generate()
+
+def sweep(axis, values, seed=0, **knobs):
+    # (value, source) along one axis, the other knobs at their defaults
+    for v in values:
+        yield v, generate(seed=seed, **dict(knobs, **{axis: v}))
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="generate synthetic test programs")
+    ap.add_argument("--seed", type=int, default=0)
+    for axis in AXES:
+        ap.add_argument("--"+axis.replace("_", "-"), type=int, default=DEFAULTS[axis])
+    ap.add_argument("--no-jumps", action="store_true", help="no break/continue")
+    ap.add_argument("--no-io", action="store_true", help="no cin/cout inside function bodies")
+    ap.add_argument("--sweep", nargs="+", metavar=("AXIS", "VALUE"), help="one program per value of AXIS")
+    ap.add_argument("-o", "--output", help="file (or directory with --sweep); stdout by default")
+    args = ap.parse_args(argv)
+    knobs = {axis: getattr(args, axis) for axis in AXES}
+    knobs.update(jumps=not args.no_jumps, io=not args.no_io)
+    if args.sweep:
+        axis, values = args.sweep[0], [int(v) for v in args.sweep[1:]]
+        if axis not in AXES:
+            ap.error(f"unknown axis {axis}; choose from {', '.join(AXES)}")
+        outdir = args.output or "corpus"
+        os.makedirs(outdir, exist_ok=True)
+        for v, src in sweep(axis, values, args.seed, **knobs):
+            path = os.path.join(outdir, f"{axis}_{v}.cpp")
+            with open(path, "w") as f:
+                f.write(src)
+            print(path)
+        return 0
+    src = generate(args.seed, **knobs)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(src)
+    else:
+        sys.stdout.write(src)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
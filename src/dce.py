@@ -0,0 +1,77 @@
+from ir import Op, Kind, BINARY_OPS, UNARY_OPS, classify, reads
+
+# Dead code elimination, in three steps:
+#   - functions no CALL reachable from main can get to are dropped;
+#   - blocks unreachable from their function's entry are dropped;
+#   - quads that only compute a value nobody reads are dropped, using live
+#     variables; this repeats until nothing more goes, so chains of dead
+#     temps disappear too.
+# Globals are live at every RETURN and CALL, and so is any variable whose
+# address is taken. GET, INPUT, CALL and output are never removed.
+
+PURE = frozenset([Op.COPY, Op.GETIDX, Op.RETVAL]) | BINARY_OPS | UNARY_OPS
+
+def called(funcs, roots=("main",)):
+    # names of the functions reachable from roots over CALLs
+    calls = {f.name: {q[1] for q in f.quads() if q[0] == Op.CALL} for f in funcs}
+    # code ahead of the first function always runs
+    seen = set(calls.get(None, ()))
+    work = [r for r in roots if r in calls]+list(seen)
+    seen.update(work)
+    while work:
+        for g in calls.get(work.pop(), ()):
+            if g not in seen:
+                seen.add(g)
+                work.append(g)
+    return seen
+
+def prune(funcs, ctx):
+    if not any(f.name == "main" for f in funcs):
+        return funcs
+    live = called(funcs)
+    kept = [f for f in funcs if f.name is None or f.name in live]
+    ctx.stats["functions"] += len(funcs)-len(kept)
+    return kept
+
+def sweep(f, ctx):
+    before = len(f.blocks)
+    f.blocks = [b for b in f.blocks if b.rpo is not None]
+    if len(f.blocks) != before:
+        ctx.stats["unreachable"] += before-len(f.blocks)
+        f.link()
+        f.analyze()
+    names = {t for q in f.quads() for t in q[1:] if t is not None}
+    glob = {n for n in names if classify(n) == Kind.VAR and ctx.may_be_global(n)}
+    escaped = {q[2] for q in f.quads() if q[0] == Op.ADDR}
+    glob |= escaped
+    while True:
+        _, live_out = f.liveness(glob, glob)
+        dead = 0
+        for b in f.blocks:
+            live = set(live_out[b])
+            kept = []
+            for q in reversed(b.quads):
+                op = q[0]
+                if op in PURE and q[1] not in live and q[1] not in escaped:
+                    dead += 1
+                    continue
+                if op in PURE or op in (Op.GET, Op.INPUT):
+                    live.discard(q[1])
+                for i in reads(op):
+                    if classify(q[i]) != Kind.CONST:
+                        live.add(q[i])
+                if op == Op.CALL:
+                    live |= glob
+                kept.append(q)
+            if len(kept) != len(b.quads):
+                kept.reverse()
+                b.quads = kept
+        ctx.stats["dead"] += dead
+        if not dead:
+            break
+
+def run(funcs, ctx):
+    funcs[:] = prune(funcs, ctx)
+    for f in funcs:
+        if f.editable:
+            sweep(f, ctx)
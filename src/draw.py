@@ -1,53 +1,163 @@
-import pydot
+import os
+from tacbuf import TacBuffer
+
+# node kinds are small integers; the strings live once in KINDS
+KINDS = ["identifier","constant","function call","statement","parameter","function","start"]
+KIND = {name:i for i,name in enumerate(KINDS)}
+
+def kind_of(name):
+    k = KIND.get(name)
+    if k is None:
+        k = KIND[name] = len(KINDS)
+        KINDS.append(name)
+    return k
+
+_NO_CODE = TacBuffer()
+_LAYOUTS = {}
+_MAX_LAYOUTS = 4096
 
 class Node:
-    def __init__(self,name,_type,is_array=0,ptr_level=0,children=None,_value=None,code=[],place=None):
-        self.name = name
+    # Children live in one flat tuple _kids; _layout maps each child key to a
+    # range of it as (key, start, n) with n = -1 for a single value. Layouts
+    # repeat ("+" with two operands, IF/WHILE/FOR shapes) and are shared.
+    __slots__ = ("kind","_type","is_array","ptr_level","_value","place","code","_kids","_layout")
+
+    def __init__(self,name,_type,is_array=0,ptr_level=0,children=None,_value=None,code=None,place=None):
+        self.kind = kind_of(name)
         self._type = _type
         self.is_array = is_array
         self._value = _value
         self.ptr_level = ptr_level
         self.children = children
         self.place = place
-        self.code = code
-
-def make_node(graph,nd,k='_'):
-    if isinstance(nd,Node):
-        make_ast(graph,nd,k)
-        name = k+':'+str(nd.name)
-    else:
-        name = k+':'+str(nd)
-        graph.add_node(pydot.Node(name))
-    return name
-
-def make_ast(graph,node,_k='_'):
-    if node is None:
-        graph.add_node(pydot.Node("None"))
-        return "None"
-    name = _k+':'+str(node.name)
-    graph.add_node(pydot.Node(name))
+        if isinstance(code,TacBuffer):
+            self.code = code
+        else:
+            self.code = TacBuffer(code) if code else _NO_CODE
+
+    @property
+    def name(self):
+        return KINDS[self.kind]
+
+    @name.setter
+    def name(self,name):
+        self.kind = kind_of(name)
+
+    @property
+    def children(self):
+        # a fresh dict each time; use set_child to change a child
+        if self._layout is None:
+            return None
+        return {key:self._child(start,n) for key,start,n in self._layout}
+
+    @children.setter
+    def children(self,children):
+        if children is None:
+            self._kids = ()
+            self._layout = None
+            return
+        kids = []
+        layout = []
+        for k,v in children.items():
+            if isinstance(v,list):
+                layout.append((k,len(kids),len(v)))
+                kids.extend(v)
+            else:
+                layout.append((k,len(kids),-1))
+                kids.append(v)
+        layout = tuple(layout)
+        shared = _LAYOUTS.get(layout)
+        if shared is None:
+            shared = layout
+            if len(_LAYOUTS) < _MAX_LAYOUTS:
+                _LAYOUTS[layout] = layout
+        self._layout = shared
+        self._kids = tuple(kids)
+
+    def _child(self,start,n):
+        return self._kids[start] if n < 0 else list(self._kids[start:start+n])
+
+    def child(self,key,default=None):
+        if self._layout is not None:
+            for k,start,n in self._layout:
+                if k == key:
+                    return self._child(start,n)
+        return default
+
+    def set_child(self,key,value):
+        children = self.children or {}
+        children[key] = value
+        self.children = children
+
+def _label(x):
+    s = str(x).replace('\\','\\\\').replace('"','\\"').replace('\n','\\n')
+    return '"'+s+'"'
+
+def _edges(node):
+    # (edge label, child) pairs, values first, then the named children
     if not node._value is None:
         if isinstance(node._value,list):
             for i in node._value:
                 if i is not None:
-                    name2 = make_node(graph,i)
-                    graph.add_edge(pydot.Edge(name,name2))
+                    yield None,i
         else:
-            name2 = make_node(graph,node._value)
-            graph.add_edge(pydot.Edge(name,name2))
-    if not node.children is None:
-        for k,v in node.children.items():
-            if isinstance(v,list):
-                for i in v:
-                    name2 = make_node(graph,i,k)
-                    graph.add_edge(pydot.Edge(name,name2))
+            yield None,node._value
+    if node._layout is not None:
+        kids = node._kids
+        for k,start,n in node._layout:
+            if n < 0:
+                yield k,kids[start]
             else:
-                name2 = make_node(graph,v,k)
-                graph.add_edge(pydot.Edge(name,name2))
-
-def get_tac(inp):
-    f = open("tac.txt","w")
-    for i in inp:
-        f.write(" ".join(i)+"\n")
-    f.close()
-    return
+                for i in range(start,start+n):
+                    yield k,kids[i]
+
+SKIP = object()
+
+def walk(root,pre=None,post=None):
+    # depth-first walk over the tree with an explicit stack, so depth is only
+    # bounded by memory. Every Node and leaf value gets a preorder number nid;
+    # callbacks are called as f(nid,item,parent_nid,key) with parent_nid -1
+    # for the root. pre returning SKIP leaves that item's children out; post
+    # runs once all of the children are done. Returns the number of items.
+    stack = [(None,root,-1,None)]
+    n = 0
+    while stack:
+        nid,item,parent,key = stack.pop()
+        if nid is not None:
+            post(nid,item,parent,key)
+            continue
+        nid = n
+        n += 1
+        if pre is not None and pre(nid,item,parent,key) is SKIP:
+            continue
+        if post is not None:
+            stack.append((nid,item,parent,key))
+        if isinstance(item,Node):
+            kids = [(None,child,nid,k) for k,child in _edges(item)]
+            kids.reverse()
+            stack.extend(kids)
+    return n
+
+def write_ast(root,path="AST.dot"):
+    # streams the tree as DOT; every node gets its own numeric id, so equal
+    # labels never merge. Returns the number of nodes written.
+    with open(path,"w",buffering=1<<16) as f:
+        f.write("graph AST {\n")
+        def emit(nid,item,parent,key):
+            f.write(f"n{nid} [label={_label(item.name if isinstance(item,Node) else item)}];\n")
+            if parent >= 0:
+                f.write(f"n{parent} -- n{nid}" + (f" [label={_label(key)}];\n" if key is not None else ";\n"))
+        n = walk(root,pre=emit)
+        f.write("}\n")
+    return n
+
+def render(path,fmt="png",out=None):
+    # DOT -> image; the only place graphviz (through pydot) is needed
+    try:
+        import pydot
+    except ImportError:
+        raise RuntimeError("rendering needs pydot and graphviz: pip install pydot")
+    graphs = pydot.graph_from_dot_file(path)
+    out = out or os.path.splitext(path)[0]+"."+fmt
+    graphs[0].write(out,format=fmt)
+    return out
@@ -0,0 +1,184 @@
+from ir import Op, Kind, BINARY_OPS, UNARY_OPS, IF_OPS, classify, defines
+
+# Value numbering. Every name carries a value number; constants share one
+# per literal and a copy passes its source's number on. An expression whose
+# operator and operand numbers were seen before is replaced by a copy of a
+# name still holding that value, and operands are rewritten to the oldest
+# name holding their value, which leaves the redundant temps for dce.
+#   lvn  numbers each block on its own;
+#   gvn  walks the dominator tree, so a block starts from what its
+#        immediate dominator knew at its end. The TAC is not in SSA form,
+#        so on entry to a join block every variable assigned somewhere
+#        between the dominator and the block gets a fresh number.
+# Calls give globals (and variables whose address is taken) fresh numbers.
+# Loads through pointers, address-of and values coming from outside (GET,
+# INPUT, RET_VAL) always get fresh numbers.
+
+COMMUTATIVE = frozenset([Op.ADD, Op.MUL, Op.EQ, Op.NE, Op.BAND, Op.BXOR, Op.BOR, Op.AND, Op.OR])
+_MISSING = object()
+
+class Numbering:
+    def __init__(self):
+        self.count = 0
+        self.consts = {}
+        self.vals = {}      # name -> value number
+        self.exprs = {}     # (op, vn, vn) -> value number
+        self.names = {}     # value number -> names that got it, oldest first
+        self.log = []       # (dict, key, old value) to undo a scope
+
+    def fresh(self):
+        self.count += 1
+        return self.count
+
+    def _set(self, table, key, value):
+        self.log.append((table, key, table.get(key, _MISSING)))
+        table[key] = value
+
+    def mark(self):
+        return len(self.log)
+
+    def undo(self, mark):
+        log = self.log
+        while len(log) > mark:
+            table, key, old = log.pop()
+            if old is _MISSING:
+                del table[key]
+            else:
+                table[key] = old
+
+    def vn(self, text):
+        if classify(text) == Kind.CONST:
+            v = self.consts.get(text)
+            if v is None:
+                v = self.consts[text] = self.fresh()
+            return v
+        v = self.vals.get(text)
+        if v is None:
+            v = self.fresh()
+            self.assign(text, v)
+        return v
+
+    def assign(self, name, v):
+        self._set(self.vals, name, v)
+        self._set(self.names, v, self.names.get(v, ())+(name,))
+
+    def holder(self, v):
+        # the oldest name that holds value v right now
+        for name in self.names.get(v, ()):
+            if self.vals.get(name) == v:
+                return name
+        return None
+
+    def kill(self, name):
+        self.assign(name, self.fresh())
+
+def _key(op, a, b):
+    if op in COMMUTATIVE and b is not None and b < a:
+        a, b = b, a
+    return (op, a, b)
+
+class _Pass:
+    def __init__(self, f, ctx):
+        self.f = f
+        self.ctx = ctx
+        names = {t for q in f.quads() for t in q[1:] if t is not None}
+        escaped = {q[2] for q in f.quads() if q[0] == Op.ADDR}
+        self.clobbered = sorted(escaped | {n for n in names if classify(n) == Kind.VAR and self.ctx.may_be_global(n)})
+        self._assigned = {}
+
+    def operand(self, num, text):
+        # text rewritten to the oldest name holding its value
+        if text is None or classify(text) == Kind.CONST:
+            return text
+        h = num.holder(num.vn(text))
+        if h is not None and h != text:
+            self.ctx.stats["operands"] += 1
+            return h
+        return text
+
+    def block(self, b, num):
+        out = []
+        stats = self.ctx.stats
+        for q in b.quads:
+            op, x, y, z = q
+            if op == Op.COPY:
+                y = self.operand(num, y)
+                num.assign(x, num.vn(y))
+                q = (op, x, y, z)
+            elif op in BINARY_OPS or op == Op.GETIDX or (op in UNARY_OPS and op not in (Op.ADDR, Op.DEREF)):
+                if op != Op.GETIDX:
+                    y = self.operand(num, y)
+                z = self.operand(num, z)
+                key = _key(op, num.vn(y), num.vn(z) if z is not None else None)
+                v = num.exprs.get(key)
+                h = num.holder(v) if v is not None else None
+                if h is not None:
+                    stats["redundant"] += 1
+                    q = (Op.COPY, x, h, None)
+                    num.assign(x, v)
+                else:
+                    v = num.fresh()
+                    num.assign(x, v)
+                    num._set(num.exprs, key, v)
+                    q = (op, x, y, z)
+            elif op in IF_OPS:
+                q = (op, self.operand(num, x), self.operand(num, y), z)
+            elif op in (Op.PARAM, Op.STORE_RET, Op.OUT):
+                q = (op, self.operand(num, x), y, z)
+            elif op == Op.CALL:
+                for name in self.clobbered:
+                    num.kill(name)
+            elif defines(op) or op == Op.ALLOC:
+                num.kill(x)
+            out.append(q)
+        b.quads = out
+
+    def assigned(self, b):
+        # variables assigned in b
+        names = self._assigned.get(b)
+        if names is None:
+            names = self._assigned[b] = {q[1] for q in b.quads if defines(q[0]) or q[0] == Op.ALLOC}
+            if any(q[0] == Op.CALL for q in b.quads):
+                names.update(self.clobbered)
+        return names
+
+    def between(self, d, b):
+        # variables assigned on some path from d to b that avoids d
+        seen = set()
+        work = [p for p in b.pred if p is not d and p.rpo is not None]
+        seen.update(work)
+        while work:
+            x = work.pop()
+            for p in x.pred:
+                if p is not d and p not in seen and p.rpo is not None:
+                    seen.add(p)
+                    work.append(p)
+        names = set()
+        for x in seen:
+            names |= self.assigned(x)
+        return names
+
+    def dominator_walk(self):
+        num = Numbering()
+        stack = [(self.f.entry, None)]
+        while stack:
+            b, mark = stack.pop()
+            if mark is not None:
+                num.undo(mark)
+                continue
+            stack.append((None, num.mark()))
+            if b.idom is not None and len(b.pred) > 1:
+                for name in sorted(self.between(b.idom, b)):
+                    num.kill(name)
+            self.block(b, num)
+            stack.extend((c, None) for c in reversed(b.dom))
+
+    def local(self):
+        for b in self.f.blocks:
+            self.block(b, Numbering())
+
+def run_local(f, ctx):
+    _Pass(f, ctx).local()
+
+def run(f, ctx):
+    _Pass(f, ctx).dominator_walk()
@@ -0,0 +1,311 @@
+import re
+import sys
+import enum
+from array import array
+
+# Three-address code as typed quads. Parser actions build (op, x, y, z)
+# tuples (trailing operands may be left off); Program stores them in flat
+# arrays with every operand interned once. Operand meaning by opcode:
+#   LABEL x / FUNC x                    x is the label or function name
+#   GOTO x                              jump to label x
+#   IF_EQ..IF_GE x y z                  if x <relop> y goto label z
+#   COPY x y                            x = y
+#   ADD..OR, SHL, SHR x y z             x = y <op> z (shifts only come from
+#                                       the optimiser)
+#   NEG..DEREF x y                      x = <op> y
+#   GETIDX x y z                        x = y[z]
+#   RETVAL x                            x = value of the last call
+#   PARAM x / GET x / CALL x            push argument, pop parameter, call
+#   STORE_RET x / OUT x / INPUT x       return value, print, read
+#   ALLOC x y                           reserve y elements for array x
+# tac.txt stays the line format the compiler always wrote, and parse()
+# reads it back.
+
+class Op(enum.IntEnum):
+    LABEL = 0
+    FUNC = 1
+    GOTO = 2
+    IF_EQ = 3
+    IF_NE = 4
+    IF_LT = 5
+    IF_LE = 6
+    IF_GT = 7
+    IF_GE = 8
+    COPY = 9
+    ADD = 10
+    SUB = 11
+    MUL = 12
+    DIV = 13
+    MOD = 14
+    LT = 15
+    GT = 16
+    LE = 17
+    GE = 18
+    EQ = 19
+    NE = 20
+    BAND = 21
+    BXOR = 22
+    BOR = 23
+    AND = 24
+    OR = 25
+    NEG = 26
+    POS = 27
+    NOT = 28
+    BNOT = 29
+    ADDR = 30
+    DEREF = 31
+    GETIDX = 32
+    RETVAL = 33
+    SAVE = 34
+    PARAM = 35
+    GET = 36
+    CALL = 37
+    STORE_RET = 38
+    RETURN = 39
+    OUT = 40
+    INPUT = 41
+    ALLOC = 42
+    BREAK = 43
+    CONTINUE = 44
+    SHL = 45
+    SHR = 46
+
+# opcode number -> Op, for turning the arrays of a Program back into quads
+OPS = [None]*(max(Op)+1)
+for _op in Op:
+    OPS[_op] = _op
+BINARY = {"+": Op.ADD, "-": Op.SUB, "*": Op.MUL, "/": Op.DIV, "%": Op.MOD,
+          "<": Op.LT, ">": Op.GT, "<=": Op.LE, ">=": Op.GE, "==": Op.EQ, "!=": Op.NE,
+          "&": Op.BAND, "^": Op.BXOR, "|": Op.BOR, "&&": Op.AND, "||": Op.OR,
+          "<<": Op.SHL, ">>": Op.SHR}
+UNARY = {"-": Op.NEG, "+": Op.POS, "!": Op.NOT, "~": Op.BNOT, "&": Op.ADDR, "*": Op.DEREF}
+IF = {"==": Op.IF_EQ, "!=": Op.IF_NE, "<": Op.IF_LT, "<=": Op.IF_LE, ">": Op.IF_GT, ">=": Op.IF_GE}
+SYMBOL = {}
+for _table in (BINARY, UNARY, IF):
+    for _sym, _op in _table.items():
+        SYMBOL[_op] = _sym
+# opcodes printed as "MNEMONIC operand..."
+MNEMONIC = {Op.GOTO: "GOTO", Op.PARAM: "STORE", Op.GET: "GET", Op.CALL: "JAL", Op.STORE_RET: "STORE_RET",
+            Op.RETURN: "RETURN", Op.OUT: "OUT", Op.INPUT: "INPUT", Op.ALLOC: "ALLOC_MEM",
+            Op.BREAK: "BREAK", Op.CONTINUE: "CONTINUE"}
+BY_MNEMONIC = {m: op for op, m in MNEMONIC.items()}
+
+BINARY_OPS = frozenset(BINARY.values())
+UNARY_OPS = frozenset(UNARY.values())
+IF_OPS = frozenset(IF.values())
+NEGATE = {Op.IF_EQ: Op.IF_NE, Op.IF_NE: Op.IF_EQ, Op.IF_LT: Op.IF_GE,
+          Op.IF_GE: Op.IF_LT, Op.IF_GT: Op.IF_LE, Op.IF_LE: Op.IF_GT}
+
+class Kind(enum.IntEnum):
+    TEMP = 0
+    VAR = 1
+    CONST = 2
+    LABEL = 3
+    FUNC = 4
+
+_TEMP = re.compile(r"VAR\d+$")
+_CONST = re.compile(r"-?\d+$|'.'$|\".*\"$|true$|false$")
+
+# operand kinds fixed by position: labels and function names
+_FORCED = [(None, None, None)]*len(OPS)
+for _op in (Op.LABEL, Op.GOTO):
+    _FORCED[_op] = (Kind.LABEL, None, None)
+for _op in IF_OPS:
+    _FORCED[_op] = (None, None, Kind.LABEL)
+for _op in (Op.FUNC, Op.CALL):
+    _FORCED[_op] = (Kind.FUNC, None, None)
+
+_kinds = {}
+
+def classify(text):
+    k = _kinds.get(text)
+    if k is None:
+        if _TEMP.match(text):
+            k = Kind.TEMP
+        elif _CONST.match(text):
+            k = Kind.CONST
+        else:
+            k = Kind.VAR
+        if len(_kinds) >= 1 << 16:
+            _kinds.clear()
+        _kinds[text] = k
+    return k
+
+def operand_kind(op, pos, text):
+    # kind of the text at operand position pos (0..2) of an op
+    return _FORCED[op][pos] or classify(text)
+
+def defines(op):
+    # opcodes whose x operand is written
+    return op == Op.COPY or op in BINARY_OPS or op in UNARY_OPS or op in (Op.GETIDX, Op.RETVAL, Op.GET, Op.INPUT)
+
+def _reads(op):
+    if op == Op.COPY or op in UNARY_OPS:
+        return () if op == Op.ADDR else (2,)
+    if op in BINARY_OPS:
+        return (2, 3)
+    if op in IF_OPS:
+        return (1, 2)
+    if op == Op.GETIDX:
+        return (3,)
+    if op in (Op.PARAM, Op.STORE_RET, Op.OUT):
+        return (1,)
+    if op == Op.ALLOC:
+        return (2,)
+    return ()
+
+READS = [_reads(op) for op in Op]
+
+def reads(op):
+    # positions (1..3 in an (op, x, y, z) tuple) of the operands op reads
+    return READS[op]
+
+class Program:
+    # op[i], x[i], y[i], z[i] describe quad i; operands are indices into
+    # names/kinds (-1 when absent)
+    __slots__ = ("op", "x", "y", "z", "names", "kinds", "_index", "_plain")
+
+    def __init__(self):
+        self.op = array("B")
+        self.x = array("i")
+        self.y = array("i")
+        self.z = array("i")
+        self.names = []
+        self.kinds = bytearray()
+        self._index = {}
+        self._plain = {}
+
+    @classmethod
+    def from_quads(cls, quads):
+        prog = cls()
+        for q in quads:
+            prog.append(*q)
+        return prog
+
+    def operand(self, op, pos, text):
+        if text is None:
+            return -1
+        forced = _FORCED[op][pos]
+        if forced is None:
+            # temps, variables and constants tell their kind by spelling
+            i = self._plain.get(text)
+            if i is None:
+                i = self._plain[text] = self._intern(classify(str(text)), str(text))
+            return i
+        return self._intern(forced, str(text))
+
+    def _intern(self, kind, text):
+        key = (kind, text)
+        i = self._index.get(key)
+        if i is None:
+            i = self._index[key] = len(self.names)
+            self.names.append(text)
+            self.kinds.append(kind)
+        return i
+
+    def append(self, op, x=None, y=None, z=None):
+        self.op.append(op)
+        self.x.append(self.operand(op, 0, x))
+        self.y.append(self.operand(op, 1, y))
+        self.z.append(self.operand(op, 2, z))
+
+    def __len__(self):
+        return len(self.op)
+
+    def name(self, i):
+        return None if i < 0 else self.names[i]
+
+    def __getitem__(self, i):
+        names = self.names
+        x, y, z = self.x[i], self.y[i], self.z[i]
+        return (OPS[self.op[i]], names[x] if x >= 0 else None,
+                names[y] if y >= 0 else None, names[z] if z >= 0 else None)
+
+    def __iter__(self):
+        # -1 picks the None appended to a copy of the names
+        names = self.names+[None]
+        for op, x, y, z in zip(self.op, self.x, self.y, self.z):
+            yield OPS[op], names[x], names[y], names[z]
+
+    def to_text(self):
+        return "".join(format_quad(q)+"\n" for q in self)
+
+    def write(self, path="tac.txt"):
+        with open(path, "w", buffering=1 << 16) as f:
+            for q in self:
+                f.write(format_quad(q)+"\n")
+
+def format_quad(q):
+    op, x, y, z = (tuple(q)+(None, None, None))[:4]
+    if op == Op.LABEL:
+        return f"{x} :"
+    if op == Op.FUNC:
+        return f"{x}:"
+    if op in IF_OPS:
+        return f"IF {x} {SYMBOL[op]} {y} GOTO {z}"
+    if op == Op.COPY:
+        return f"{x} = {y}"
+    if op in BINARY_OPS:
+        return f"{x} = {y} {SYMBOL[op]} {z}"
+    if op in UNARY_OPS:
+        return f"{x} = {SYMBOL[op]} {y}"
+    if op == Op.GETIDX:
+        return f"{x} = GETIDX {y} {z}"
+    if op == Op.RETVAL:
+        return f"{x} = RET_VAL"
+    if op == Op.SAVE:
+        return "STORE PARENT VARS"
+    return " ".join([MNEMONIC[op]]+[str(v) for v in (x, y, z) if v is not None])
+
+# a string literal runs to the last quote on the line, as in the scanner
+_TOKEN = re.compile(r"\".*\"|'.'|\S+")
+
+def parse_line(line):
+    t = _TOKEN.findall(line)
+    if not t:
+        return None
+    n = len(t)
+    if n == 2 and t[1] == ":":
+        return (Op.LABEL, t[0])
+    if n == 1 and t[0].endswith(":") and len(t[0]) > 1:
+        return (Op.FUNC, t[0][:-1])
+    if t[0] == "IF" and n == 6 and t[4] == "GOTO" and t[2] in IF:
+        return (IF[t[2]], t[1], t[3], t[5])
+    if t == ["STORE", "PARENT", "VARS"]:
+        return (Op.SAVE,)
+    if n >= 3 and t[1] == "=":
+        if n == 3:
+            return (Op.RETVAL, t[0]) if t[2] == "RET_VAL" else (Op.COPY, t[0], t[2])
+        if n == 4 and t[2] in UNARY:
+            return (UNARY[t[2]], t[0], t[3])
+        if n == 5 and t[2] == "GETIDX":
+            return (Op.GETIDX, t[0], t[3], t[4])
+        if n == 5 and t[3] in BINARY:
+            return (BINARY[t[3]], t[0], t[2], t[4])
+    elif t[0] in BY_MNEMONIC and n <= 3:
+        return (BY_MNEMONIC[t[0]],)+tuple(t[1:])
+    raise ValueError(f"cannot parse TAC line {line!r}")
+
+def parse(text):
+    prog = Program()
+    for lineno, line in enumerate(text.splitlines(), 1):
+        try:
+            q = parse_line(line)
+        except ValueError as e:
+            raise ValueError(f"line {lineno}: {e}") from None
+        if q is not None:
+            prog.append(*q)
+    return prog
+
+def read(path="tac.txt"):
+    with open(path) as f:
+        return parse(f.read())
+
+if __name__ == "__main__":
+    # round trip check: python ir.py tac.txt
+    with open(sys.argv[1]) as f:
+        text = f.read()
+    prog = parse(text)
+    same = prog.to_text() == text
+    print(f"{len(prog)} quads, {len(prog.names)} operands, round trip {'ok' if same else 'DIFFERS'}")
+    sys.exit(0 if same else 1)
@@ -0,0 +1,156 @@
+from ir import Op, Kind, BINARY_OPS, UNARY_OPS, IF_OPS, classify, defines, reads
+from cfg import Block
+
+# Loop-invariant code motion. Loops are handled innermost first; a quad
+# x = y <op> z moves to the loop's preheader when
+#   - its operands are constants, not assigned in the loop, or assigned
+#     only by quads that move too;
+#   - it is the loop's only assignment to x and x is not live into the
+#     header, so every use of x in the loop sees this very quad;
+#   - its block dominates every exit of the loop, or x is dead after the
+#     loop (then computing it once too often is harmless). Division,
+#     modulo and GETIDX may fault and always need the dominance.
+# A CALL in the loop counts as an assignment to every global, so nothing
+# around calls moves past them; INPUT is an assignment like any other.
+# The preheader is the header's single outside predecessor when it has no
+# other successor, otherwise a new labelled block laid out just ahead of
+# the header; outside jumps to the header are redirected to it.
+
+MOVABLE = frozenset([Op.COPY, Op.GETIDX]) | BINARY_OPS | (UNARY_OPS-{Op.ADDR, Op.DEREF})
+FAULTING = frozenset([Op.DIV, Op.MOD, Op.GETIDX])
+
+class _Pass:
+    def __init__(self, f, ctx):
+        self.f = f
+        self.ctx = ctx
+        names = {t for q in f.quads() for t in q[1:] if t is not None}
+        self.escaped = {q[2] for q in f.quads() if q[0] == Op.ADDR}
+        self.glob = self.escaped | {n for n in names if classify(n) == Kind.VAR and ctx.may_be_global(n)}
+        self.live_in, _ = f.liveness(self.glob, self.glob)
+        # new preheader -> its header; the analysis is not redone while the
+        # pass runs, so questions about a preheader go to its header
+        self.proxy = {}
+        self.changed = False
+
+    def dominates(self, a, b):
+        return self.f.dominates(self.proxy.get(a, a), b)
+
+    def live_at(self, b):
+        h = self.proxy.get(b)
+        if h is None:
+            return self.live_in[b]
+        return self.live_in[h] | {q[i] for q in b.quads for i in reads(q[0])}
+
+    def run(self):
+        for loop in sorted(self.f.loops, key=lambda l: -l.depth):
+            self.loop(loop)
+        if self.changed:
+            self.f.link()
+            self.f.analyze()
+
+    def loop(self, loop):
+        h = loop.header
+        if h.label is None or not self.can_insert(loop):
+            return
+        blocks = sorted(loop.blocks, key=lambda b: self.proxy.get(b, b).rpo)
+        defs = {}
+        calls = False
+        for b in blocks:
+            for q in b.quads:
+                if defines(q[0]) or q[0] == Op.ALLOC:
+                    defs[q[1]] = defs.get(q[1], 0)+1
+                elif q[0] == Op.CALL:
+                    calls = True
+        if calls:
+            for g in self.glob:
+                defs[g] = defs.get(g, 0)+2
+        exits = set()
+        exit_live = set()
+        for b in blocks:
+            if not b.succ:
+                exits.add(b)
+                exit_live |= self.glob
+            for s in b.succ:
+                if s not in loop.blocks:
+                    exits.add(b)
+                    exit_live |= self.live_at(s)
+        live_h = self.live_in[h]
+        moved = []
+        marked = set()
+        invariant = set()
+        always = {b: bool(exits) and all(self.dominates(b, e) for e in exits) for b in blocks}
+
+        def stays(t):
+            return classify(t) != Kind.CONST and t in defs and t not in invariant
+
+        changed = True
+        while changed:
+            changed = False
+            for b in blocks:
+                for i, q in enumerate(b.quads):
+                    op, x = q[0], q[1]
+                    if op not in MOVABLE or (b, i) in marked:
+                        continue
+                    if defs.get(x) != 1 or x in live_h or x in self.escaped:
+                        continue
+                    if not always[b] and (op in FAULTING or x in exit_live):
+                        continue
+                    if any(stays(q[j]) for j in reads(op)) or (op == Op.GETIDX and q[2] in defs):
+                        continue
+                    marked.add((b, i))
+                    moved.append(q)
+                    invariant.add(x)
+                    changed = True
+        if not moved:
+            return
+        for b in blocks:
+            if any((b, i) in marked for i in range(len(b.quads))):
+                b.quads = [q for i, q in enumerate(b.quads) if (b, i) not in marked]
+        p = self.preheader(loop)
+        at = len(p.quads)-1 if p.terminator is not None else len(p.quads)
+        p.quads[at:at] = moved
+        self.ctx.stats["hoisted"] += len(moved)
+        self.changed = True
+
+    def can_insert(self, loop):
+        # a new block ahead of the header must not come between a loop
+        # block and the header it falls through to
+        f = self.f
+        h = loop.header
+        k = f.blocks.index(h)
+        prev = f.blocks[k-1] if k else None
+        if prev is None or prev not in loop.blocks or h not in prev.succ:
+            return True
+        t = prev.terminator
+        return t is not None and t[0] == Op.GOTO
+
+    def preheader(self, loop):
+        f = self.f
+        h = loop.header
+        outside = [p for p in h.pred if p not in loop.blocks]
+        if len(outside) == 1 and outside[0].succ == [h]:
+            return outside[0]
+        label = self.ctx.label()
+        p = Block(None, [(Op.LABEL, label, None, None)])
+        f.blocks.insert(f.blocks.index(h), p)
+        f.labels[label] = p
+        for o in outside:
+            t = o.terminator
+            if t is not None and t[0] == Op.GOTO and t[1] == h.label:
+                o.quads[-1] = (Op.GOTO, label, None, None)
+            elif t is not None and t[0] in IF_OPS and t[3] == h.label:
+                o.quads[-1] = (t[0], t[1], t[2], label)
+            o.succ = [p if s is h else s for s in o.succ]
+        p.pred = outside
+        p.succ = [h]
+        h.pred = [b for b in h.pred if b in loop.blocks]+[p]
+        l = loop.parent
+        while l is not None:
+            l.blocks.add(p)
+            l = l.parent
+        self.proxy[p] = h
+        self.ctx.stats["preheaders"] += 1
+        return p
+
+def run(f, ctx):
+    _Pass(f, ctx).run()
@@ -0,0 +1,127 @@
+import sys
+import argparse
+import itertools
+import collections
+import ir
+import cfg
+import constprop
+import dce
+import gvn
+import licm
+import strength
+import peephole
+import temps
+import ssa
+
+# Optimisation driver. The program is split into CFG functions once; every
+# pass then gets the whole list and leaves each CFG linked and analysed for
+# the next one. Functions that contain BREAK/CONTINUE (old TAC, see cfg.py)
+# and the code ahead of the first function are not edited.
+# Passes may take options, given per pass name, e.g.
+# {"peephole": {"rules": ["goto_next", "jump_thread"]}}; a pass finds its own
+# in ctx.options.
+#   python optimize.py tac.txt [-p constprop,gvn,licm,strength,dce,peephole,temps] [-o tac.opt.txt]
+
+def each(run):
+    # a pass that works on one function at a time
+    def over(funcs, ctx):
+        for f in funcs:
+            if f.editable:
+                run(f, ctx)
+    return over
+
+PASSES = {
+    "constprop": each(constprop.run),
+    "lvn": each(gvn.run_local),
+    "gvn": each(gvn.run),
+    "licm": each(licm.run),
+    "strength": each(strength.run),
+    "dce": dce.run,
+    "peephole": each(peephole.run),
+    "temps": each(temps.run),
+    "ssa": each(ssa.run),
+}
+DEFAULT = ["constprop", "gvn", "licm", "strength", "dce", "peephole", "temps"]
+
+class Context:
+    def __init__(self, global_names=None, labels=None, temps=None, options=None):
+        # global variables of the program; None when not known, in which
+        # case every named variable may be one
+        self.globals = global_names
+        self.options = options or {}
+        self.stats = collections.Counter()
+        self._labels = labels if labels is not None else itertools.count(1)
+        self._temps = temps if temps is not None else itertools.count(1)
+
+    def label(self):
+        # a label no other quad of the program uses
+        return f"L{next(self._labels)}"
+
+    def temp(self):
+        # a temp no other quad of the program uses
+        return f"VAR{next(self._temps)}"
+
+    def may_be_global(self, name):
+        return self.globals is None or name in self.globals
+
+def counters(program):
+    # label and temp counters starting past the names program uses
+    used = [int(n[1:]) for n, k in zip(program.names, program.kinds)
+            if k == ir.Kind.LABEL and n[:1] == "L" and n[1:].isdigit()]
+    labels = itertools.count(max(used, default=0)+1)
+    used = [int(n[3:]) for n, k in zip(program.names, program.kinds) if k == ir.Kind.TEMP]
+    temps = itertools.count(max(used, default=0)+1)
+    return labels, temps
+
+def optimize(program, passes=None, global_names=None, options=None):
+    passes = DEFAULT if passes is None else passes
+    for name in passes:
+        if name not in PASSES:
+            raise ValueError(f"unknown pass {name!r}; choose from {', '.join(PASSES)}")
+    funcs = cfg.build(program)
+    labels, temps = counters(program)
+    report = []
+    for name in passes:
+        ctx = Context(global_names, labels, temps, (options or {}).get(name))
+        before = sum(len(b.quads) for f in funcs for b in f.blocks)
+        PASSES[name](funcs, ctx)
+        after = sum(len(b.quads) for f in funcs for b in f.blocks)
+        report.append({"pass": name, "before": before, "after": after, **ctx.stats})
+    return cfg.to_program(funcs), report
+
+def format_report(report):
+    lines = []
+    for r in report:
+        extra = "  ".join(f"{k} {v}" for k, v in r.items() if k not in ("pass", "before", "after") and not isinstance(v, dict))
+        lines.append(f"{r['pass']:<12} {r['before']:>8} -> {r['after']:>8} quads  {r['before']-r['after']:>6} removed  {extra}")
+        # per-function figures (temps), one line each
+        for v in r.values():
+            if isinstance(v, dict):
+                for name, figures in v.items():
+                    lines.append(f"{'':<12} {name:<20} "+"  ".join(f"{k} {n}" for k, n in figures.items()))
+    return "\n".join(lines)
+
+def parse_passes(text):
+    return [p for p in text.split(",") if p] if text else DEFAULT
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="optimise a TAC file")
+    ap.add_argument("tac")
+    ap.add_argument("-p", "--passes", help=f"comma separated, default {','.join(DEFAULT)}; available: {', '.join(PASSES)}")
+    ap.add_argument("-g", "--globals", help="comma separated global variables (default: any named variable may be global)")
+    ap.add_argument("--rules", help=f"comma separated peephole rules, default all: {', '.join(peephole.RULES)}")
+    ap.add_argument("-o", "--output", help="write the optimised TAC here instead of stdout")
+    args = ap.parse_args(argv)
+    program = ir.read(args.tac)
+    global_names = set(args.globals.split(",")) if args.globals is not None else None
+    options = {"peephole": {"rules": args.rules.split(",")}} if args.rules else None
+    program, report = optimize(program, parse_passes(args.passes), global_names, options)
+    if args.output:
+        program.write(args.output)
+    else:
+        sys.stdout.write(program.to_text())
+    print(format_report(report), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
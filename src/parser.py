@@ -1,39 +1,25 @@
 import sys
 import os
+import copy
+import contextlib
 import scanner
-import pydot
-import ply.yacc as yacc
-from symtab import (
-    SYMBOL_TABLES,
-    pop_scope,
-    push_scope,
-    new_scope,
-    get_current_symtab,
-)
-from draw import make_ast,Node,get_tac
-
-LABEL_CNT=0
-TEMP_VAR=0
-
-def get_label():
-    global LABEL_CNT
-    LABEL_CNT+=1
-    return "L"+str(LABEL_CNT)
-
-def get_var():
-    global TEMP_VAR
-    TEMP_VAR+=1
-    return "VAR"+str(TEMP_VAR)
-
-INIT_PARAMETERS={"type":[],"declarations":[]}
-LAST_FUNCTION = None
-INCOMING_FUNCTION = False
-ERROR = []
+import tables
+from symtab import ScopeStack
+from draw import write_ast,Node
+from tacbuf import TacBuffer
+from ir import Op,BINARY,UNARY,IF,NEGATE,Program
+
+def get_label(p):
+    return p.parser.compiler.get_label()
+
+def get_var(p):
+    return p.parser.compiler.get_var()
+
+def get_current_symtab(p):
+    return p.parser.compiler.scopes.get_current_symtab()
 
 tokens = scanner.scanner.tokens
 literals = scanner.scanner.literals
-flag_for_error = 0
-
 start = "start"
 
 #done
@@ -52,11 +38,11 @@ def p_primary_expression(p):
 #done 
 def p_id(p):
     """id : ID"""
-    symtab = get_current_symtab()
+    symtab = get_current_symtab(p)
     i = symtab.lookup(p[1],1)
     if i is None:
         err_msg = "Identifier "+p[1]+" not declared on line "+str(p.lineno(1))
-        ERROR.append(err_msg)
+        p.parser.compiler.errors.append(err_msg)
         raise SyntaxError
     arr = 0
     if i["kind"]==0:
@@ -69,8 +55,8 @@ def p_id(p):
 #done
 def p_str(p):
     """str : STRING"""
-    _place = get_var()
-    p[0] = Node("constant","char",is_array=1,_value=p[1],place=_place,code=[[_place,"=",p[1]]])
+    _place = get_var(p)
+    p[0] = Node("constant","char",is_array=1,_value=p[1],place=_place,code=[(Op.COPY,_place,p[1])])
 
 #done    
 def p_int(p):
@@ -80,15 +66,15 @@ def p_int(p):
 #done    
 def p_char(p):
     """char : CHARACTER"""
-    _place = get_var()
-    p[0] = Node("constant","char",_value=p[1],place=_place,code=[[_place,"=",p[1]]])
+    _place = get_var(p)
+    p[0] = Node("constant","char",_value=p[1],place=_place,code=[(Op.COPY,_place,p[1])])
 
 #done   
 def p_bool(p):
     """bool : TRUE
     | FALSE"""
-    _place = get_var()
-    p[0] = Node("constant","bool",_value=p[1],place=_place,code=[[_place,"=",p[1]]])
+    _place = get_var(p)
+    p[0] = Node("constant","bool",_value=p[1],place=_place,code=[(Op.COPY,_place,p[1])])
 
 #done
 def p_postfix_expression(p):
@@ -98,7 +84,7 @@ def p_postfix_expression(p):
     | postfix_expression '(' argument_expression_list ')'
     | postfix_expression INC
     | postfix_expression DEC"""
-    symtab=get_current_symtab()
+    symtab=get_current_symtab(p)
     if len(p)==2:
         p[0]=p[1]
     elif len(p)==3:
@@ -106,18 +92,18 @@ def p_postfix_expression(p):
         i = symtab.lookup(name)
         if i is None:
             err_msg = "Incompatible type for "+p[2]+" in line "+str(p.lineno(1))
-            ERROR.append(err_msg)
+            p.parser.compiler.errors.append(err_msg)
             raise SyntaxError
-        p[0] = Node("function call",i["return type"],children={i["name"]:[p[1]]},place=p[1].place,code=p[1].code+[[p[1].place,"=",p[1].place,p[2][0],"1"]])
+        p[0] = Node("function call",i["return type"],children={i["name"]:[p[1]]},place=p[1].place,code=p[1].code+[(BINARY[p[2][0]],p[1].place,p[1].place,"1")])
     elif len(p)==4:
         name = p[1]._value+"()"
         i = symtab.lookup(name)
         if i is None:
             err_msg = "Incompatible type for "+p[1]._value+" in line "+str(p.lineno(1))
-            ERROR.append(err_msg)
+            p.parser.compiler.errors.append(err_msg)
             raise SyntaxError
-        _place = get_var()
-        _code = [["STORE PARENT VARS"]]+p[1].code+[["JAL",p[1].place],[_place,"=","RET_VAL"]]
+        _place = get_var(p)
+        _code = [(Op.SAVE,)]+p[1].code+[(Op.CALL,p[1].place),(Op.RETVAL,_place)]
         p[0] = Node("function call",i["return type"],children={i["name"]:None},place=_place,code=_code)    
     elif len(p)==5:
         if p[2]=='(':
@@ -125,27 +111,27 @@ def p_postfix_expression(p):
             i = symtab.lookup(name)
             if i is None:
                 err_msg = "Incompatible type for "+p[1]._value+" in line "+str(p.lineno(1))
-                ERROR.append(err_msg)
+                p.parser.compiler.errors.append(err_msg)
                 raise SyntaxError
-            _place = get_var()
-            _code = [["STORE PARENT VARS"]]+p[1].code
+            _place = get_var(p)
+            _code = [(Op.SAVE,)]+p[1].code
             temp = []
             for j in p[3]:
                 _code+=j.code
-                temp+=[["STORE",j.place]]
+                temp+=[(Op.PARAM,j.place)]
             _code+=temp
-            _code+=[["JAL",p[1].place],[_place,"=","RET_VAL"]]
+            _code+=[(Op.CALL,p[1].place),(Op.RETVAL,_place)]
             p[0] = Node("function call",i["return type"],children={i["name"]:p[3]},place=_place,code=_code)
         else:
-            name = '[]('+p[1]._type+','+p[3]._type+')'
+            name = '[]('+p[1]._type+'*'*p[1].is_array+','+p[3][0]._type+')'
             i = symtab.lookup(name)
             if i is None:
                 err_msg = "Incompatible type for [] in line "+str(p.lineno(1))
-                ERROR.append(err_msg)
+                p.parser.compiler.errors.append(err_msg)
                 raise SyntaxError
-            _place = get_var()
-            _code = p[1].code+p[3][0].code+[[_place,"=","GETIDX",p[1].place,p[3][0].place]]
-            p[0] = Node("function call",i["return type"],children={i["name"]:[p[1],p[3]]},place=_place,code=_code)
+            _place = get_var(p)
+            _code = p[1].code+p[3][0].code+[(Op.GETIDX,_place,p[1].place,p[3][0].place)]
+            p[0] = Node("function call",i["return type"],children={i["name"]:[p[1],p[3][0]]},place=_place,code=_code)
 
 #done    
 def p_argument_expression_list(p):
@@ -154,7 +140,8 @@ def p_argument_expression_list(p):
     if len(p)==2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1]+[p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 #done
 def p_unary_expression(p):
@@ -165,18 +152,18 @@ def p_unary_expression(p):
     if len(p)==2:
         p[0]=p[1]
     else:
-        symtab=get_current_symtab()
+        symtab=get_current_symtab(p)
         name = p[1]+'('+p[2]._type.lower()+')'
         i = symtab.lookup(name)
         if i is None:
             err_msg = "Incompatible type for "+p[1]+" in line "+str(p.lineno(1))
-            ERROR.append(err_msg)
+            p.parser.compiler.errors.append(err_msg)
             raise SyntaxError
         _code = p[2].code
         if p[1]=='++' or p[1]=='--':
-            _code+=[[p[2].place,"=",p[2].place,p[1][0],"1"]]
+            _code+=[(BINARY[p[1][0]],p[2].place,p[2].place,"1")]
         else:
-            _code+=[[p[2].place,"=",p[1],p[2].place]]
+            _code+=[(UNARY[p[1]],p[2].place,p[2].place)]
         p[0] = Node("function call",i["return type"],children={i["name"]:[p[2]]},place=p[2].place,code=_code)
 
 #done
@@ -198,15 +185,15 @@ def p_multiplicative_expression(p):
     if len(p)==2:
         p[0]=p[1]
     else:
-        symtab=get_current_symtab()
+        symtab=get_current_symtab(p)
         name = p[2]+'('+p[1]._type.lower()+','+p[3]._type.lower()+')'
         i = symtab.lookup(name)
         if i is None:
             err_msg = "Incompatible types for "+p[2]+" in line "+str(p.lineno(1))
-            ERROR.append(err_msg)
+            p.parser.compiler.errors.append(err_msg)
             raise SyntaxError
-        _place = get_var()
-        _code = p[1].code+p[3].code+[[_place,"=",p[1].place,p[2],p[3].place]]
+        _place = get_var(p)
+        _code = p[1].code+p[3].code+[(BINARY[p[2]],_place,p[1].place,p[3].place)]
         p[0] = Node("function call",i["return type"],children={i["name"]:[p[1],p[3]]},place=_place,code=_code)
 
 #done
@@ -217,15 +204,15 @@ def p_additive_expression(p):
     if len(p)==2:
         p[0]=p[1]
     else:
-        symtab=get_current_symtab()
+        symtab=get_current_symtab(p)
         name = p[2]+'('+p[1]._type.lower()+','+p[3]._type.lower()+')'
         i = symtab.lookup(name)
         if i is None:
             err_msg = "Incompatible types for "+p[2]+" in line "+str(p.lineno(1))
-            ERROR.append(err_msg)
+            p.parser.compiler.errors.append(err_msg)
             raise SyntaxError
-        _place = get_var()
-        _code = p[1].code+p[3].code+[[_place,"=",p[1].place,p[2],p[3].place]]
+        _place = get_var(p)
+        _code = p[1].code+p[3].code+[(BINARY[p[2]],_place,p[1].place,p[3].place)]
         p[0] = Node("function call",i["return type"],children={i["name"]:[p[1],p[3]]},place=_place,code=_code)
 
 #done
@@ -238,15 +225,15 @@ def p_relational_expression(p):
     if len(p)==2:
         p[0]=p[1]
     else:
-        symtab=get_current_symtab()
+        symtab=get_current_symtab(p)
         name = p[2]+'('+p[1]._type.lower()+','+p[3]._type.lower()+')'
         i = symtab.lookup(name)
         if i is None:
             err_msg = "Incompatible types for "+p[2]+" in line "+str(p.lineno(1))
-            ERROR.append(err_msg)
+            p.parser.compiler.errors.append(err_msg)
             raise SyntaxError
-        _place = get_var()
-        _code = p[1].code+p[3].code+[[_place,"=",p[1].place,p[2],p[3].place]]
+        _place = get_var(p)
+        _code = p[1].code+p[3].code+[(BINARY[p[2]],_place,p[1].place,p[3].place)]
         p[0] = Node("function call",i["return type"],children={i["name"]:[p[1],p[3]]},place=_place,code=_code)
 
 #done
@@ -257,15 +244,15 @@ def p_equality_expression(p):
     if len(p)==2:
         p[0]=p[1]
     else:
-        symtab=get_current_symtab()
+        symtab=get_current_symtab(p)
         name = p[2]+'('+p[1]._type.lower()+','+p[3]._type.lower()+')'
         i = symtab.lookup(name)
         if i is None:
             err_msg = "Incompatible types for "+p[2]+" in line "+str(p.lineno(1))
-            ERROR.append(err_msg)
+            p.parser.compiler.errors.append(err_msg)
             raise SyntaxError
-        _place = get_var()
-        _code = p[1].code+p[3].code+[[_place,"=",p[1].place,p[2],p[3].place]]
+        _place = get_var(p)
+        _code = p[1].code+p[3].code+[(BINARY[p[2]],_place,p[1].place,p[3].place)]
         p[0] = Node("function call",i["return type"],children={i["name"]:[p[1],p[3]]},place=_place,code=_code)
 
 #done
@@ -275,15 +262,15 @@ def p_and_expression(p):
     if len(p)==2:
         p[0]=p[1]
     else:
-        symtab=get_current_symtab()
+        symtab=get_current_symtab(p)
         name = p[2]+'('+p[1]._type.lower()+','+p[3]._type.lower()+')'
         i = symtab.lookup(name)
         if i is None:
             err_msg = "Incompatible types for "+p[2]+" in line "+str(p.lineno(1))
-            ERROR.append(err_msg)
+            p.parser.compiler.errors.append(err_msg)
             raise SyntaxError
-        _place = get_var()
-        _code = p[1].code+p[3].code+[[_place,"=",p[1].place,p[2],p[3].place]]
+        _place = get_var(p)
+        _code = p[1].code+p[3].code+[(BINARY[p[2]],_place,p[1].place,p[3].place)]
         p[0] = Node("function call",i["return type"],children={i["name"]:[p[1],p[3]]},place=_place,code=_code)
 
 #done
@@ -293,15 +280,15 @@ def p_exclusive_or_expression(p):
     if len(p)==2:
         p[0]=p[1]
     else:
-        symtab=get_current_symtab()
+        symtab=get_current_symtab(p)
         name = p[2]+'('+p[1]._type.lower()+','+p[3]._type.lower()+')'
         i = symtab.lookup(name)
         if i is None:
             err_msg = "Incompatible types for "+p[2]+" in line "+str(p.lineno(1))
-            ERROR.append(err_msg)
+            p.parser.compiler.errors.append(err_msg)
             raise SyntaxError
-        _place = get_var()
-        _code = p[1].code+p[3].code+[[_place,"=",p[1].place,p[2],p[3].place]]
+        _place = get_var(p)
+        _code = p[1].code+p[3].code+[(BINARY[p[2]],_place,p[1].place,p[3].place)]
         p[0] = Node("function call",i["return type"],children={i["name"]:[p[1],p[3]]},place=_place,code=_code)
 
 #done
@@ -311,15 +298,15 @@ def p_inclusive_or_expression(p):
     if len(p)==2:
         p[0]=p[1]
     else:
-        symtab=get_current_symtab()
+        symtab=get_current_symtab(p)
         name = p[2]+'('+p[1]._type.lower()+','+p[3]._type.lower()+')'
         i = symtab.lookup(name)
         if i is None:
             err_msg = "Incompatible types for "+p[2]+" in line "+str(p.lineno(1))
-            ERROR.append(err_msg)
+            p.parser.compiler.errors.append(err_msg)
             raise SyntaxError
-        _place = get_var()
-        _code = p[1].code+p[3].code+[[_place,"=",p[1].place,p[2],p[3].place]]
+        _place = get_var(p)
+        _code = p[1].code+p[3].code+[(BINARY[p[2]],_place,p[1].place,p[3].place)]
         p[0] = Node("function call",i["return type"],children={i["name"]:[p[1],p[3]]},place=_place,code=_code)
 
 #done
@@ -329,15 +316,15 @@ def p_logical_and_expression(p):
     if len(p)==2:
         p[0]=p[1]
     else:
-        symtab=get_current_symtab()
+        symtab=get_current_symtab(p)
         name = p[2]+'('+p[1]._type.lower()+','+p[3]._type.lower()+')'
         i = symtab.lookup(name)
         if i is None:
             err_msg = "Incompatible types for "+p[2]+" in line "+str(p.lineno(1))
-            ERROR.append(err_msg)
+            p.parser.compiler.errors.append(err_msg)
             raise SyntaxError
-        _place = get_var()
-        _code = p[1].code+p[3].code+[[_place,"=",p[1].place,p[2],p[3].place]]
+        _place = get_var(p)
+        _code = p[1].code+p[3].code+[(BINARY[p[2]],_place,p[1].place,p[3].place)]
         p[0] = Node("function call",i["return type"],children={i["name"]:[p[1],p[3]]},place=_place,code=_code)
 
 #done
@@ -347,15 +334,15 @@ def p_logical_or_expression(p):
     if len(p)==2:
         p[0]=p[1]
     else:
-        symtab=get_current_symtab()
+        symtab=get_current_symtab(p)
         name = p[2]+'('+p[1]._type.lower()+','+p[3]._type.lower()+')'
         i = symtab.lookup(name)
         if i is None:
             err_msg = "Incompatible types for "+p[2]+" in line "+str(p.lineno(1))
-            ERROR.append(err_msg)
+            p.parser.compiler.errors.append(err_msg)
             raise SyntaxError
-        _place = get_var()
-        _code = p[1].code+p[3].code+[[_place,"=",p[1].place,p[2],p[3].place]]
+        _place = get_var(p)
+        _code = p[1].code+p[3].code+[(BINARY[p[2]],_place,p[1].place,p[3].place)]
         p[0] = Node("function call",i["return type"],children={i["name"]:[p[1],p[3]]},place=_place,code=_code)
 
 #done
@@ -366,24 +353,24 @@ def p_assignment_expression(p):
         p[0]=p[1]
     else:
         if len(p[2])>1:
-            symtab=get_current_symtab()
+            symtab=get_current_symtab(p)
             name = p[2][0]+'('+p[1]._type.lower()+','+p[3]._type.lower()+')'
             i = symtab.lookup(name)
             if i is None:
                 err_msg = "Incompatible types for "+p[2][0]+" in line "+str(p.lineno(1))
-                ERROR.append(err_msg)
+                p.parser.compiler.errors.append(err_msg)
                 raise SyntaxError
-            _code = p[3].code+p[1].code+[p[1].place,"=",p[1].place,p[2][0],p[3].place]
+            _code = p[3].code+p[1].code+[(BINARY[p[2][0]],p[1].place,p[1].place,p[3].place)]
             temp = Node("function call",i["return type"],children={i["name"]:[p[1],p[3]]})
         else:
             temp = p[3]
-            _code = p[3].code+p[1].code+[[p[1].place,"=",temp.place]]
-        symtab=get_current_symtab()
+            _code = p[3].code+p[1].code+[(Op.COPY,p[1].place,temp.place)]
+        symtab=get_current_symtab(p)
         name = '='+'('+p[1]._type.lower()+','+temp._type.lower()+')'
         i = symtab.lookup(name)
         if i is None:
             err_msg = "Incompatible types for = in line "+str(p.lineno(1))+" "+name
-            ERROR.append(err_msg)
+            p.parser.compiler.errors.append(err_msg)
             raise SyntaxError
         p[0] = Node("function call",i["return type"],children={i["name"]:[p[1],temp]},code=_code,place=p[1].place)
 
@@ -407,7 +394,8 @@ def p_expression(p):
     if len(p)==2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1]+[p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 #done
 def p_constant_expression(p):
@@ -418,12 +406,17 @@ def p_declaration(p):
     """declaration : type_specifier init_declarator_list ';'"""
     for i in p[2]:
         i._type = p[1].lower()
-    p[0] = Node("statement","declaration",_value=p[2])
-    symtab = get_current_symtab()
+    # array declarators carry their ALLOC_MEM; function prototypes emit nothing
+    _code = TacBuffer()
+    for i in p[2]:
+        if i.name=="identifier":
+            _code+=i.code
+    p[0] = Node("statement","declaration",_value=p[2],code=_code)
+    symtab = get_current_symtab(p)
     for i in p[2]:
         entry = {"name":i._value,"type":i._type,"ptr_level":i.ptr_level,"is_array":i.is_array}
-        if (i.children is not None) and (i.children.get("dims",None) is not None):
-            entry["dimensions"] = i.children["dims"]
+        if i.child("dims") is not None:
+            entry["dimensions"] = i.child("dims")
         symtab.insert(entry,0)
 
 #done
@@ -433,7 +426,8 @@ def p_init_declarator_list(p):
     if len(p)==2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1]+[p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 #done
 def p_type_specifier(p):
@@ -468,37 +462,34 @@ def p_direct_declarator(p):
             p[0]=p[2]
         elif p[2]=='(':
             if p[1].name=="identifier" and p[1]._type=="undeclared" and p[1].is_array==0:
-                p[0]=Node("function","undeclared",_value=p[1]._value,children={"parameters":[]},place=p[1].place,code=p[1].code+[[p[1].place+":"]])
+                p[0]=Node("function","undeclared",_value=p[1]._value,children={"parameters":[]},place=p[1].place,code=p[1].code+[(Op.FUNC,p[1].place)])
             else:
                 err_msg="Error in function name in function declaration in line "+str(p.lineno(1))
-                ERROR.append(err_msg)
+                p.parser.compiler.errors.append(err_msg)
                 raise SyntaxError
         elif p[2]=='[':
             if p[1].name=="identifier" and p[1]._type=="undeclared":
                 p[1].is_array=1
                 p[1].ptr_level+=1
-                if not p[1].children is None and p[1].children.get("dims",False):
-                    p[1].children["dims"].append(None)
-                else:
-                    p[1].children = {"dims":[None,]}  
+                p[1].set_child("dims",(p[1].child("dims") or [])+[None])
                 p[0]=p[1]
             else:
                 err_msg="Error in array declaration in line "+str(p.lineno(1))
-                ERROR.append(err_msg)
+                p.parser.compiler.errors.append(err_msg)
                 raise SyntaxError
     else:
         if p[2]=='(':
             if p[1].name=="identifier" and p[1]._type=="undeclared" and p[1].is_array==0:
-                _code=p[1].code+[[p[1].place+":"]]
+                _code=p[1].code+[(Op.FUNC,p[1].place)]
                 temp = []
                 for i in p[3]:
                     _code+=i.code
-                    temp.append(["GET",i.place])
+                    temp.append((Op.GET,i.place))
                 _code+=temp
                 p[0]=Node("function","undeclared",_value=p[1]._value,children={"parameters":p[3]},place=p[1].place,code=_code)
             else:
                 err_msg="Error in function name in function declaration in line "+str(p.lineno(1))
-                ERROR.append(err_msg)
+                p.parser.compiler.errors.append(err_msg)
                 raise SyntaxError
         elif p[2]=='[':
             if p[1].name=="identifier" and p[1]._type=="undeclared" and p[3]._type.lower()=="int":
@@ -509,15 +500,12 @@ def p_direct_declarator(p):
                     ndims = p[3]._value
                 else:
                     ndims = p[3]
-                if not p[1].children is None and p[1].children.get("dims",False):
-                    p[1].children["dims"].append(ndims)
-                else:
-                    p[1].children = {"dims":[ndims,]}  
+                p[1].set_child("dims",(p[1].child("dims") or [])+[ndims])
                 p[0]=p[1]
-                p[0].code+=p[3].code+[["ALLOC_MEM",p[1].place,p[3].place]]
+                p[0].code+=p[3].code+[(Op.ALLOC,p[1].place,p[3].place)]
             else:
                 err_msg="Error in array declaration in line "+str(p.lineno(1))
-                ERROR.append(err_msg)
+                p.parser.compiler.errors.append(err_msg)
                 raise SyntaxError
 
 #done
@@ -536,14 +524,15 @@ def p_parameter_list(p):
     if len(p)==2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1]+[p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 #done
 def p_parameter_declaration(p):
     """parameter_declaration : type_specifier declarator"""
-    global INIT_PARAMETERS
-    INIT_PARAMETERS["type"].append(p[1])
-    INIT_PARAMETERS["declarations"].append(p[2])
+    c = p.parser.compiler
+    c.init_parameters["type"].append(p[1])
+    c.init_parameters["declarations"].append(p[2])
     p[0] = Node("parameter",p[1],_value=p[2],place=p[2].place)
 
 #done
@@ -562,7 +551,7 @@ def p_compound_statement(p):
     """compound_statement : lbrace statement_list rbrace
     | lbrace declaration_list rbrace
     | lbrace declaration_list statement_list rbrace"""
-    _code = []
+    _code = TacBuffer()
     if len(p)==4:
         for i in p[2]:
             _code+=i.code
@@ -581,7 +570,8 @@ def p_declaration_list(p):
     if len(p)==2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1]+[p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 #done
 def p_statement_list(p):
@@ -590,7 +580,8 @@ def p_statement_list(p):
     if len(p)==2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1]+[p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 #done
 def p_expression_statement(p):
@@ -599,24 +590,83 @@ def p_expression_statement(p):
     if len(p)==2:
         p[0] = Node("statement","expression")
     else:
-        _code = []
+        _code = TacBuffer()
         for i in p[1]:
             _code += i.code
         p[0] = Node("statement","expression",_value=p[1],code=_code)
 
+def _operator(node):
+    # (operator, operands) of a builtin operator node, else (None, None)
+    kids = node.children
+    if node.name!="function call" or not kids or len(kids)!=1:
+        return None,None
+    (key,args), = kids.items()
+    if not isinstance(args,list):
+        return None,None
+    return key.split('(')[0],args
+
+def jump_code(p,node,l_true,l_false):
+    # code that jumps to l_true when node holds and to l_false otherwise;
+    # one of the two is None and means falling through. &&, || and ! only
+    # evaluate what they need and comparisons branch on their operands
+    # directly, so no temps hold truth values. Conditions are taken apart on
+    # an explicit stack, left operand first: a chain of thousands of ||
+    # terms is as deep as it is long
+    out = []
+    work = [(node,l_true,l_false)]
+    while work:
+        item = work.pop()
+        if isinstance(item,str):
+            out.append((Op.LABEL,item))
+            continue
+        node,l_true,l_false = item
+        op,args = _operator(node)
+        if op=="&&" and len(args)==2:
+            l_out = l_false or get_label(p)
+            if not l_false:
+                work.append(l_out)
+            work.append((args[1],l_true,l_false))
+            work.append((args[0],None,l_out))
+        elif op=="||" and len(args)==2:
+            l_out = l_true or get_label(p)
+            if not l_true:
+                work.append(l_out)
+            work.append((args[1],l_true,l_false))
+            work.append((args[0],l_out,None))
+        elif op=="!" and len(args)==1:
+            work.append((args[0],l_false,l_true))
+        elif op in IF and len(args)==2:
+            out.extend(args[0].code)
+            out.extend(args[1].code)
+            if l_true is None:
+                out.append((NEGATE[IF[op]],args[0].place,args[1].place,l_false))
+            else:
+                out.append((IF[op],args[0].place,args[1].place,l_true))
+                if l_false is not None:
+                    out.append((Op.GOTO,l_false))
+        else:
+            out.extend(node.code)
+            if l_true is None:
+                out.append((Op.IF_EQ,node.place,"0",l_false))
+            else:
+                out.append((Op.IF_NE,node.place,"0",l_true))
+                if l_false is not None:
+                    out.append((Op.GOTO,l_false))
+    return out
+
 #done
 def p_selection_statement(p):
     """selection_statement : IF '(' expression ')' statement
     | IF '(' expression ')' statement ELSE statement"""
-    l_else = get_label()
-    l_after = get_label()
+    l_else = get_label(p)
+    l_after = get_label(p)
     if len(p)==8:
-        _code = p[3][0].code+[["IF",p[3][0].place,"==","0","GOTO",l_else]]+p[5].code+[["GOTO",l_after],[l_else,":"]]+p[7].code+[[l_after,":"]]
+        _code = jump_code(p,p[3][0],None,l_else)+p[5].code+[(Op.GOTO,l_after),(Op.LABEL,l_else)]+p[7].code+[(Op.LABEL,l_after)]
     else:
-        _code = p[3][0].code+[["IF",p[3][0].place,"==","0","GOTO",l_after]]+p[5].code+[[l_after,":"]]
+        _code = jump_code(p,p[3][0],None,l_after)+p[5].code+[(Op.LABEL,l_after)]
     p[0] = Node("statement","IF",children={"condition":p[3],"IF_BLOCK":p[5],"ELSE_BLOCK":None},code=_code)
     if len(p)==8:
-        p[0].children["ELSE_BLOCK"]=p[7]
+        p[0].set_child("ELSE_BLOCK",p[7])
 
 #done
 def p_iteration_statement(p):
@@ -624,32 +674,51 @@ def p_iteration_statement(p):
     | for_st"""
     p[0] = p[1]
 
+#done
+def p_loop_begin(p):
+    """loop_begin : """
+    # reduced right after WHILE/FOR, before the body: the loop's labels go
+    # on a stack so break and continue inside jump straight to them
+    l_begin = get_label(p)
+    l_after = get_label(p)
+    l_next = get_label(p) if p[-1]=='for' else l_begin
+    p[0] = {"begin":l_begin,"continue":l_next,"break":l_after}
+    p.parser.compiler.loops.append(p[0])
+
+def end_loop(p,labels):
+    # p_error empties the stack, so the loop's labels may be gone already
+    loops = p.parser.compiler.loops
+    if loops and loops[-1] is labels:
+        loops.pop()
+
 #done
 def p_while_st(p):
-    """while_st : WHILE '(' expression ')' statement"""
-    if len(p[3])>1:
+    """while_st : WHILE loop_begin '(' expression ')' statement"""
+    end_loop(p,p[2])
+    if len(p[4])>1:
         err_msg = "More than one conditions in line "+str(p.lineno(1))
-        ERROR.append(err_msg)
+        p.parser.compiler.errors.append(err_msg)
         raise SyntaxError
-    s_begin = get_label()
-    s_after = get_label()
-    _code = [[s_begin,":"]]+p[3][0].code+[["IF",p[3][0].place,"==","0","GOTO",s_after]]+p[5].code+[["GOTO",s_begin],[s_after,":"]]
-    p[0] = Node("statement","WHILE",children={"condition":p[3], "BLOCK":p[5]},code=_code)
+    s_begin = p[2]["begin"]
+    s_after = p[2]["break"]
+    _code = [(Op.LABEL,s_begin)]+jump_code(p,p[4][0],None,s_after)+p[6].code+[(Op.GOTO,s_begin),(Op.LABEL,s_after)]
+    p[0] = Node("statement","WHILE",children={"condition":p[4], "BLOCK":p[6]},code=_code)
 
 #done
 def p_for_st(p):
-    """for_st : FOR '(' expression_statement expression_statement expression ')' statement"""
-    f_start = get_label()
-    f_after = get_label()
-    _code = p[3].code+[[f_start,":"]]
-    if p[4]._value!=None:
-        for i in p[4]._value:
-            _code+=i.code+[["IF",i.place,"==","0","GOTO",f_after]]
-    _code+=p[7].code
-    for i in p[5]:
+    """for_st : FOR loop_begin '(' expression_statement expression_statement expression ')' statement"""
+    end_loop(p,p[2])
+    f_start = p[2]["begin"]
+    f_after = p[2]["break"]
+    _code = p[4].code+[(Op.LABEL,f_start)]
+    if p[5]._value!=None:
+        for i in p[5]._value:
+            _code+=jump_code(p,i,None,f_after)
+    _code+=p[8].code+[(Op.LABEL,p[2]["continue"])]
+    for i in p[6]:
         _code+=i.code
-    _code+=[["GOTO",f_start],[f_after,":"]]
-    p[0] = Node("statement","FOR",children={"init":p[3],"condition":p[4],"update":p[5], "BLOCK":p[7]},code=_code)
+    _code+=[(Op.GOTO,f_start),(Op.LABEL,f_after)]
+    p[0] = Node("statement","FOR",children={"init":p[4],"condition":p[5],"update":p[6], "BLOCK":p[8]},code=_code)
 
 #done
 def p_jump_statement(p):
@@ -659,19 +728,22 @@ def p_jump_statement(p):
     | RETURN expression ';'"""
     p[0] = Node("statement","jump",_value=p[1])
     if len(p)==4:
-        p[0].children = {"return":p[2][0]}
-        p[0].code = [["STORE_RET",p[2][0].place],["RETURN"]]
+        p[0].set_child("return",p[2][0])
+        p[0].code = TacBuffer([(Op.STORE_RET,p[2][0].place),(Op.RETURN,)])
     elif p[1]=='return':
-        p[0].code = [["RETURN"]]
-    elif p[1]=='break':
-        p[0].code = [["BREAK"]]
+        p[0].code = TacBuffer([(Op.RETURN,)])
     else:
-        p[0].code = [["CONTINUE"]]
+        loops = p.parser.compiler.loops
+        if not loops:
+            err_msg = p[1]+" outside of a loop in line "+str(p.lineno(1))
+            p.parser.compiler.errors.append(err_msg)
+            raise SyntaxError
+        p[0].code = TacBuffer([(Op.GOTO,loops[-1][p[1]])])
 
 #done
 def p_start(p):
     """start : translation_unit"""
-    _code=[]
+    _code=TacBuffer()
     for i in p[1]:
         _code+=i.code
     p[0] = Node("start","None",_value=p[1],code=_code)
@@ -683,7 +755,8 @@ def p_translation_unit(p):
     if len(p)==2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1]+[p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 #done
 def p_external_declaration(p):
@@ -694,19 +767,19 @@ def p_external_declaration(p):
 #done
 def p_function_definition(p):
     """function_definition : type_specifier declarator compound_statement"""
-    global INCOMING_FUNCTION,LAST_FUNCTION
+    c = p.parser.compiler
     if p[2].name!="function" and p[2]._type!="undeclared":
         err_msg = "Error in function declaration at line "+str(p.lineno(1))
-        ERROR.append(err_msg)
+        c.errors.append(err_msg)
         raise SyntaxError
     p[2]._type=p[1].lower()
-    param = [i._type+'*'*i._value.ptr_level for i in p[2].children["parameters"]]
-    entry = {"name":p[2]._value,"return type":p[1].lower(),"ptr_level":p[2].ptr_level,"parameter types":param,"local scope":p[3].children["local scope"]}
-    symtab = get_current_symtab()
+    param = [i._type+'*'*i._value.ptr_level for i in p[2].child("parameters")]
+    entry = {"name":p[2]._value,"return type":p[1].lower(),"ptr_level":p[2].ptr_level,"parameter types":param,"local scope":p[3].child("local scope")}
+    symtab = get_current_symtab(p)
     symtab.insert(entry,1)
-    INCOMING_FUNCTION=True
-    LAST_FUNCTION = entry["name"]+'('+','.join(entry["parameter types"]) +')'
-    p[2].children["BLOCK"]=p[3]
+    c.incoming_function=True
+    c.last_function = entry["name"]+'('+','.join(entry["parameter types"]) +')'
+    p[2].set_child("BLOCK",p[3])
     _code = p[2].code+p[3].code
     p[0]=p[2]
     p[0].code = _code
@@ -714,16 +787,16 @@ def p_function_definition(p):
 #done    
 def p_input_statement(p):
     """input_statement : CIN IN id ';'"""
-    p[0] = Node("statement","input",_value=p[3],code=p[3].code+[["INPUT",p[3].place]])
+    p[0] = Node("statement","input",_value=p[3],code=p[3].code+[(Op.INPUT,p[3].place)])
 
 #done
 def p_output_statement(p):
     """output_statement : COUT output_list ';'"""
-    _code=[]
+    _code=TacBuffer()
     temp = []
     for i in p[2]:
         _code+=i.code
-        temp+=[["OUT",i.place]]
+        temp+=[(Op.OUT,i.place)]
     _code+=temp
     p[0]=Node("statement","output",_value=p[2],code=_code)
 
@@ -734,59 +807,57 @@ def p_output_list(p):
     if len(p)==3:
         p[0]=[p[2]]
     else:
-        p[0]=p[1]+[p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 #check
 def p_lbrace(p):
     """lbrace : '{'"""
-    global INCOMING_FUNCTION, LAST_FUNCTION
-    push_scope(new_scope(get_current_symtab(), LAST_FUNCTION if INCOMING_FUNCTION else None))
-    symTab = get_current_symtab()
-    global INIT_PARAMETERS
-    if len(INIT_PARAMETERS["type"])!=0:
-        for i in range(len(INIT_PARAMETERS["type"])):
-            curr = INIT_PARAMETERS["declarations"][i]
+    c = p.parser.compiler
+    c.scopes.push_scope(c.scopes.new_scope(get_current_symtab(p), c.last_function if c.incoming_function else None))
+    symTab = get_current_symtab(p)
+    if len(c.init_parameters["type"])!=0:
+        for i in range(len(c.init_parameters["type"])):
+            curr = c.init_parameters["declarations"][i]
             if curr.name!="identifier":
                 err_msg = "Wrong parameter used in line "+str(p.lineno(1))
-                ERROR.append(err_msg)
+                c.errors.append(err_msg)
                 raise SyntaxError
-            if curr.children is None:
-                dims=None
-            else:
-                dims = curr.children.get("dims",None)
-            entry = {"name":curr._value,"type":INIT_PARAMETERS["type"][i].lower(),"is_array":curr.is_array,"ptr_level":curr.ptr_level,"dimensions":dims}
+            dims = curr.child("dims")
+            entry = {"name":curr._value,"type":c.init_parameters["type"][i].lower(),"is_array":curr.is_array,"ptr_level":curr.ptr_level,"dimensions":dims}
             symTab.insert(entry,0)
-        INIT_PARAMETERS = {"type":[],"declarations":[]}
+        c.init_parameters = {"type":[],"declarations":[]}
     p[0] = symTab
 
 
 def p_rbrace(p):
     """rbrace : '}'"""
-    global LAST_POPPED_TABLE,INCOMING_FUNCTION,LAST_FUNCTION
-    LAST_POPPED_TABLE = pop_scope()
-    while not LAST_POPPED_TABLE is None:
-        if LAST_POPPED_TABLE in SYMBOL_TABLES:
+    c = p.parser.compiler
+    c.last_popped_table = c.scopes.pop_scope()
+    while not c.last_popped_table is None:
+        if c.last_popped_table in c.scopes.tables:
             break
-        LAST_POPPED_TABLE=LAST_POPPED_TABLE.parent
-    if LAST_POPPED_TABLE==None:
-        INCOMING_FUNCTION=False
+        c.last_popped_table=c.last_popped_table.parent
+    if c.last_popped_table==None:
+        c.incoming_function=False
     else:
-        LAST_FUNCTION = LAST_POPPED_TABLE.func_scope
+        c.last_function = c.last_popped_table.func_scope
 
 def p_error(p):
-    global flag_for_error
-    flag_for_error = 1
-
     if p is not None:
+        c = p.lexer.compiler
+        c.syntax_error = True
+        # recovery may throw away loops whose labels were pushed; a break
+        # further on must not jump into one of them
+        c.loops = []
         print("error at line no:  %s :: %s" % ((p.lineno), (p.value)))
-        parser.errok()
+        c.parser.errok()
     else:
         print("Unexpected end of input")
 
-parser = yacc.yacc()
+parser = tables.build_parser(sys.modules[__name__])
 
-def populate_global_symbol_table():
-    table = get_current_symtab()
+def populate_global_symbol_table(table):
     for op in ("+", "-"):
         for _type in ["INT","CHAR"]:
             _type = _type.lower()
@@ -827,20 +898,158 @@ def populate_global_symbol_table():
         _type = _type.lower()
         table.insert({"name": "[]", "return type": _type, "parameter types": [f"{_type}*", "int"]}, 1)
 
-if __name__ == "__main__":
-    if(len(sys.argv) == 2):
-        file = sys.argv[1]
-        fl = open(file,'r')
-        inp = fl.read()
-        push_scope(new_scope(get_current_symtab()))
-        populate_global_symbol_table()
-        result = parser.parse(inp)
-        if len(ERROR)==0:
-            pop_scope()
-            graph = pydot.Dot("my_graph", graph_type='graph')
-            make_ast(graph,result)
-            graph.write_dot('AST.dot')
-            get_tac(result.code)
+# the builtin operator signatures are the same for every compilation; they
+# are built once and copied into each new global scope
+BUILTINS = ScopeStack(None).new_scope()
+populate_global_symbol_table(BUILTINS)
+
+class Compiler:
+    # All state of one compilation. The LALR tables are shared, but every
+    # Compiler drives its own parser and lexer, so any number of them can
+    # run back to back (or side by side) in one process.
+    def __init__(self,symtab_csv="symtables.csv",timer=None,passes=None):
+        self.parser = copy.copy(parser)
+        self.parser.compiler = self
+        self.lexer = scanner.scanner.lexer.clone()
+        self.lexer.compiler = self
+        self.symtab_csv = symtab_csv
+        self.timer = timer
+        # optimize.py passes run on the TAC before it is written; None for none
+        self.passes = passes
+        if timer is not None:
+            # time the grammar actions apart from the LR driver
+            prods = []
+            for prod in self.parser.productions:
+                prod = copy.copy(prod)
+                if prod.callable:
+                    prod.callable = timer.wrap("semantic",prod.callable)
+                prods.append(prod)
+            self.parser.productions = prods
+        self.reset()
+
+    def reset(self):
+        self.label_cnt = 0
+        self.temp_var = 0
+        self.errors = []
+        self.syntax_error = False
+        # labels of the loops around the statement being parsed, innermost last
+        self.loops = []
+        self.init_parameters = {"type":[],"declarations":[]}
+        self.last_function = None
+        self.incoming_function = False
+        self.last_popped_table = None
+        self.scopes = ScopeStack(self.symtab_csv,self.timer)
+        self.program = None
+        self.global_table = None
+        self.opt_report = None
+
+    def get_label(self):
+        self.label_cnt+=1
+        return "L"+str(self.label_cnt)
+
+    def get_var(self):
+        self.temp_var+=1
+        return "VAR"+str(self.temp_var)
+
+    def compile(self,inp):
+        self.reset()
+        self.lexer.lineno = 1
+        self.scopes.push_scope(self.scopes.new_scope())
+        self.scopes.get_current_symtab().copy_entries(BUILTINS)
+        if self.timer is None:
+            result = self.parser.parse(inp,lexer=self.lexer)
         else:
-            for err in ERROR:
-                print(err)   
+            # lex everything up front so scanning is measured on its own
+            with self.timer.phase("scanner"):
+                self.lexer.input(inp)
+                toks = list(iter(self.lexer.token,None))
+            toks = iter(toks)
+            with self.timer.phase("parse"):
+                result = self.parser.parse(lexer=self.lexer,tokenfunc=lambda: next(toks,None))
+        if self.syntax_error:
+            # error recovery still hands back a tree, but not of this source
+            result = None
+        if result is not None and len(self.errors)==0:
+            self.global_table = self.scopes.pop_scope()
+        return result
+
+    def global_names(self):
+        # variables of the global scope, None before a successful compile
+        if self.global_table is None:
+            return None
+        return set(self.global_table._variables)
+
+    def compile_to(self,inp,outdir="."):
+        # writes AST.dot, tac.txt and symtables.csv of one source into outdir
+        self.symtab_csv = os.path.join(outdir,"symtables.csv")
+        result = self.compile(inp)
+        if result is not None and len(self.errors)==0:
+            with self.phase("ast"):
+                write_ast(result,os.path.join(outdir,'AST.dot'))
+            with self.phase("tac"):
+                self.program = Program.from_quads(result.code)
+            if self.passes:
+                from optimize import optimize
+                with self.phase("opt"):
+                    self.program,self.opt_report = optimize(self.program,self.passes,self.global_names())
+            with self.phase("tac"):
+                self.program.write(os.path.join(outdir,"tac.txt"))
+        return result
+
+    def phase(self,name):
+        return contextlib.nullcontext() if self.timer is None else self.timer.phase(name)
+
+def compile_source(inp,outdir=".",compiler=None):
+    if compiler is None:
+        compiler = Compiler()
+    result = compiler.compile_to(inp,outdir)
+    return compiler,result
+
+def compile_file(file,outdir=".",compiler=None):
+    with open(file,'r') as fl:
+        inp = fl.read()
+    return compile_source(inp,outdir,compiler)
+
+def run(args):
+    # parser.py with parsed arguments (see cli.py); returns the exit status
+    from cli import finish
+    passes = None
+    if args.passes is not None:
+        from optimize import parse_passes
+        passes = parse_passes(args.passes)
+    if args.time_report is not None:
+        from timing import PhaseTimer,format_report
+        from cache import compiler_version
+        with open(args.file,'r') as fl:
+            inp = fl.read()
+        timer = PhaseTimer()
+        compiler = Compiler(timer=timer,passes=passes)
+        timer.start()
+        result = compiler.compile_to(inp)
+        timer.stop()
+        for err in compiler.errors:
+            print(err)
+        report = timer.report(file=args.file,lines=inp.count('\n'),compiler_version=compiler_version(),errors=len(compiler.errors))
+        print(format_report(report,args.time_report),file=sys.stderr)
+        ok = result is not None and not compiler.errors
+    elif args.cache is None:
+        compiler,result = compile_file(args.file,compiler=Compiler(passes=passes))
+        for err in compiler.errors:
+            print(err)
+        ok = result is not None and not compiler.errors
+    else:
+        from cache import CompileCache,compile_cached
+        with open(args.file,'r') as fl:
+            inp = fl.read()
+        compiler = Compiler(passes=passes)
+        ok,errors,hit = compile_cached(CompileCache(args.cache or None),inp,".",compiler)
+    if args.opt_report and compiler.opt_report:
+        from optimize import format_report as format_opt_report
+        print(format_opt_report(compiler.opt_report),file=sys.stderr)
+    # after a cache hit there is no program in memory; finish reads tac.txt
+    finish(args,ok,compiler.program)
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    from cli import arg_parser
+    sys.exit(run(arg_parser().parse_args()))
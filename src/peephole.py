@@ -0,0 +1,249 @@
+import collections
+from ir import Op, Kind, BINARY_OPS, UNARY_OPS, IF_OPS, NEGATE, classify, reads
+from constprop import value, fold
+
+# Peephole optimisation over a function's quads in text order. Each sweep
+# streams the quads into an output list and, after every quad, tries the
+# rules of RULES on the end of that list until none applies; sweeps repeat
+# until one changes nothing. A rule gets the output list and the sweep's
+# facts and returns True when it rewrote the tail. Jump targets are
+# resolved once per sweep, so a label that some jump will be threaded to
+# is never dropped in the same sweep.
+#   python optimize.py tac.txt -p peephole --rules goto_next,jump_thread
+
+PURE_DEFS = frozenset([Op.COPY, Op.GETIDX, Op.RETVAL]) | BINARY_OPS | (UNARY_OPS-{Op.ADDR})
+
+class Facts:
+    def __init__(self, code):
+        self.start = {}     # label -> index of the first quad after it
+        self.refs = {}      # label -> jumps naming it
+        self.uses = {}      # temp -> quads reading it
+        pending = []
+        for i, q in enumerate(code):
+            op = q[0]
+            if op == Op.LABEL:
+                pending.append(q[1])
+                continue
+            for l in pending:
+                self.start[l] = i
+            pending = []
+            label = jump_label(q)
+            if label is not None:
+                self.refs[label] = self.refs.get(label, 0)+1
+            for k in reads(op):
+                t = q[k]
+                if classify(t) == Kind.TEMP:
+                    self.uses[t] = self.uses.get(t, 0)+1
+        self.code = code
+        self.threads = {}
+        for label in list(self.refs):
+            end = self.final(label)
+            # GOTOs going round in a circle are left alone
+            if end != label and self.final(end) == end:
+                self.threads[label] = end
+        # labels jumps may be threaded to this sweep
+        self.pinned = set(self.threads.values())
+
+    def final(self, label):
+        # where a jump to label ends up after following plain GOTOs
+        seen = {label}
+        while True:
+            i = self.start.get(label)
+            if i is None or self.code[i][0] != Op.GOTO or self.code[i][1] in seen:
+                return label
+            label = self.code[i][1]
+            seen.add(label)
+
+def jump_label(q):
+    if q[0] == Op.GOTO:
+        return q[1]
+    if q[0] in IF_OPS:
+        return q[3]
+    return None
+
+def retarget(q, label):
+    if q[0] == Op.GOTO:
+        return (Op.GOTO, label, None, None)
+    return (q[0], q[1], q[2], label)
+
+def _trailing_labels(out):
+    # index of the last quad before the labels that end out
+    k = len(out)-1
+    while k >= 0 and out[k][0] == Op.LABEL:
+        k -= 1
+    return k
+
+def jump_thread(out, facts):
+    # a jump to a label that only leads to GOTO M jumps to M
+    label = jump_label(out[-1])
+    if label is None or label not in facts.threads:
+        return False
+    to = facts.threads[label]
+    out[-1] = retarget(out[-1], to)
+    facts.refs[label] -= 1
+    facts.refs[to] = facts.refs.get(to, 0)+1
+    return True
+
+def goto_next(out, facts):
+    # GOTO L or IF .. GOTO L right before L : falls through anyway
+    if out[-1][0] != Op.LABEL:
+        return False
+    k = _trailing_labels(out)
+    if k < 0:
+        return False
+    label = jump_label(out[k])
+    if label is None or not any(q[1] == label for q in out[k+1:]):
+        return False
+    del out[k]
+    facts.refs[label] -= 1
+    return True
+
+def invert_if(out, facts):
+    # IF c GOTO L1; GOTO L2; L1 :  ->  IF !c GOTO L2; L1 :
+    if out[-1][0] != Op.LABEL:
+        return False
+    k = _trailing_labels(out)
+    if k < 1 or out[k][0] != Op.GOTO or out[k-1][0] not in IF_OPS:
+        return False
+    cond = out[k-1]
+    if not any(q[1] == cond[3] for q in out[k+1:]):
+        return False
+    facts.refs[cond[3]] -= 1
+    out[k-1] = (NEGATE[cond[0]], cond[1], cond[2], out[k][1])
+    del out[k]
+    return True
+
+def unreachable(out, facts):
+    # nothing but a label can be reached right after GOTO or RETURN
+    if len(out) < 2 or out[-1][0] == Op.LABEL or out[-2][0] not in (Op.GOTO, Op.RETURN):
+        return False
+    label = jump_label(out[-1])
+    if label is not None:
+        facts.refs[label] -= 1
+    out.pop()
+    return True
+
+def dead_label(out, facts):
+    q = out[-1]
+    if q[0] != Op.LABEL or facts.refs.get(q[1], 0) or q[1] in facts.pinned:
+        return False
+    out.pop()
+    return True
+
+def self_copy(out, facts):
+    q = out[-1]
+    if q[0] != Op.COPY or q[1] != q[2]:
+        return False
+    out.pop()
+    return True
+
+def copy_fold(out, facts):
+    # VARn = <expr>; x = VARn  ->  x = <expr> when nothing else reads VARn
+    if len(out) < 2:
+        return False
+    d, q = out[-2], out[-1]
+    if q[0] != Op.COPY or classify(q[2]) != Kind.TEMP or d[0] not in PURE_DEFS or d[1] != q[2]:
+        return False
+    if facts.uses.get(q[2]) != 1:
+        return False
+    out[-2:] = [(d[0], q[1], d[2], d[3])]
+    return True
+
+def identity(out, facts):
+    # x = y + 0, y - 0, y * 1, y / 1, y << 0 ... are copies; y * 0 is 0
+    op, x, y, z = out[-1]
+    if op not in BINARY_OPS:
+        return False
+    a, b = value(y), value(z)
+    if op in (Op.ADD, Op.BOR, Op.BXOR) and a == 0:
+        new = z
+    elif op in (Op.ADD, Op.SUB, Op.BOR, Op.BXOR, Op.SHL, Op.SHR) and b == 0:
+        new = y
+    elif op == Op.MUL and 1 in (a, b):
+        new = z if a == 1 else y
+    elif op == Op.DIV and b == 1:
+        new = y
+    elif op in (Op.MUL, Op.BAND) and 0 in (a, b):
+        new = "0"
+    else:
+        return False
+    out[-1] = (Op.COPY, x, new, None)
+    return True
+
+def add_chain(out, facts):
+    # x = x + c1; x = x + c2  ->  x = x + (c1 + c2), as ++ and -- leave them
+    if len(out) < 2:
+        return False
+    p, q = out[-2], out[-1]
+    step = _step(p)
+    if step is None or p[1] != q[1]:
+        return False
+    more = _step(q)
+    if more is None:
+        return False
+    total = fold(Op.ADD, str(step), str(more))
+    if total is None:
+        return False
+    if total == "0":
+        del out[-2:]
+    else:
+        out[-2:] = [(Op.ADD, q[1], q[1], total)]
+    return True
+
+def _step(q):
+    # c for x = x + c or x = x - c
+    op, x, y, z = q
+    c = value(z)
+    if y != x or c is None or classify(z) != Kind.CONST:
+        return None
+    if op == Op.ADD:
+        return c
+    if op == Op.SUB:
+        return -c
+    return None
+
+RULES = {
+    "jump_thread": jump_thread,
+    "goto_next": goto_next,
+    "invert_if": invert_if,
+    "unreachable": unreachable,
+    "dead_label": dead_label,
+    "self_copy": self_copy,
+    "copy_fold": copy_fold,
+    "identity": identity,
+    "add_chain": add_chain,
+}
+
+def sweep(code, rules, stats):
+    facts = Facts(code)
+    out = []
+    fired = 0
+    for q in code:
+        out.append(q)
+        while out:
+            for name, rule in rules:
+                if rule(out, facts):
+                    stats[name] += 1
+                    fired += 1
+                    break
+            else:
+                break
+    return out, fired
+
+def simplify(code, rules=None, stats=None):
+    # the fixed point of rules (names from RULES, default all) on quads
+    stats = collections.Counter() if stats is None else stats
+    for name in rules or ():
+        if name not in RULES:
+            raise ValueError(f"unknown peephole rule {name!r}; choose from {', '.join(RULES)}")
+    rules = [(name, RULES[name]) for name in (rules or RULES)]
+    while True:
+        code, fired = sweep(code, rules, stats)
+        if not fired:
+            return code
+
+def run(f, ctx):
+    code = list(f.quads())
+    new = simplify(code, ctx.options.get("rules"), ctx.stats)
+    if new != code:
+        f.replace(new)
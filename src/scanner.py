@@ -1,7 +1,7 @@
 import sys
 import ply.lex as lex
 from ply.lex import TOKEN
-from tabulate import tabulate
+import tables
 
 keywords = [
     'break','char','continue','else','for','if','int','return',
@@ -79,9 +79,10 @@ class LexerCPP(object):
         t.lexer.skip(1)
     
     def build(self):
-        self.lexer = lex.lex(module=self)
+        self.lexer = tables.build_lexer(self)
     
     def test(self,inp):
+        from tabulate import tabulate
         self.lexer.input(inp)
         lst = []
         while True:
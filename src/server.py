@@ -0,0 +1,145 @@
+import sys
+import os
+import json
+import stat
+import socket
+import signal
+import argparse
+import tempfile
+import socketserver
+import multiprocessing
+
+# Resident compile server. Workers keep the lexer, the LALR tables and the
+# builtin symbol table loaded; clients talk newline-delimited JSON over a
+# Unix domain socket (see client.py):
+#   request : {"op": "compile", "source": "...", "file": "a.cpp",
+#              "options": {"passes": "constprop,dce", "opt_report": true,
+#                          "time_report": "text"}}
+#   response: {"ok": true, "errors": [], "stdout": "...",
+#              "tac": "...", "ast": "...", "symtables": "...",
+#              "opt_report": [...], "time_report": "..."}
+# options are those of parser.py (cli.options()), all optional: passes is
+# the argument of -O, time_report the format of --time-report, which
+# bypasses the cache. {"op": "ping"} answers {"ok": true, "pid": ...}.
+
+def default_socket():
+    return os.environ.get("CS335_SOCKET") or os.path.join(tempfile.gettempdir(), f"cs335-{os.getuid()}.sock")
+
+_compiler = None
+_cache = None
+
+def _init_worker(cache_dir=None):
+    global _compiler, _cache
+    from parser import Compiler
+    from cache import CompileCache
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _compiler = Compiler()
+    if cache_dir is not None:
+        _cache = CompileCache(cache_dir or None)
+
+def compile_request(req):
+    from cache import compile_entry
+    inp = req["source"]
+    opts = req.get("options") or {}
+    try:
+        passes = None
+        if opts.get("passes") is not None:
+            from optimize import parse_passes
+            passes = parse_passes(opts["passes"])
+        if opts.get("time_report"):
+            return timed_entry(inp, passes, opts["time_report"], req.get("file"))
+        _compiler.passes = passes
+        if _cache is None:
+            return compile_entry(inp, _compiler)
+        key = _cache.key(inp, ",".join(passes or ()))
+        entry = _cache.get(key)
+        if entry is None:
+            entry = compile_entry(inp, _compiler)
+            if entry["ok"]:
+                _cache.put(key, entry)
+        return entry
+    except Exception as e:
+        return {"ok": False, "errors": [f"{type(e).__name__}: {e}"], "stdout": ""}
+
+def timed_entry(inp, passes, fmt, file=None):
+    # the timer wraps the grammar actions, so it needs a Compiler of its own
+    from parser import Compiler
+    from cache import compile_entry, compiler_version
+    from timing import PhaseTimer, format_report
+    timer = PhaseTimer()
+    compiler = Compiler(timer=timer, passes=passes)
+    timer.start()
+    entry = compile_entry(inp, compiler)
+    timer.stop()
+    report = timer.report(file=file, lines=inp.count('\n'), compiler_version=compiler_version(), errors=len(compiler.errors))
+    entry["time_report"] = format_report(report, fmt)
+    return entry
+
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                req = json.loads(line)
+                op = req.get("op", "compile")
+                if op == "ping":
+                    resp = {"ok": True, "pid": os.getpid()}
+                elif op == "compile":
+                    resp = self.server.pool.apply(compile_request, (req,))
+                else:
+                    resp = {"ok": False, "errors": [f"unknown op {op!r}"]}
+            except (ValueError, KeyError) as e:
+                resp = {"ok": False, "errors": [f"bad request: {e}"]}
+            self.wfile.write(json.dumps(resp).encode()+b"\n")
+            self.wfile.flush()
+
+def claim_socket(path):
+    # only a socket nobody listens on any more, left by a server that died,
+    # is removed; a live server or any other file stops this one
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise SystemExit(f"server: {path} exists and is not a socket")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        try:
+            s.connect(path)
+        except ConnectionRefusedError:
+            os.remove(path)
+            return
+    raise SystemExit(f"server: server already running on {path}")
+
+class CompileServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, workers, cache_dir=None):
+        claim_socket(path)
+        super().__init__(path, Handler)
+        import parser
+        self.pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(cache_dir,))
+
+    def server_close(self):
+        super().server_close()
+        self.pool.terminate()
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="resident compile server")
+    ap.add_argument("--socket", default=default_socket())
+    ap.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--cache", nargs="?", const="", default=None, metavar="DIR", help="reuse results of unchanged sources")
+    args = ap.parse_args(argv)
+    server = CompileServer(args.socket, args.jobs, args.cache)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    print(f"serving on {args.socket} with {args.jobs} workers", flush=True)
+    try:
+        server.serve_forever()
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
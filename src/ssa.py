@@ -0,0 +1,286 @@
+import sys
+import argparse
+import ir
+import cfg
+from ir import Op, Kind, IF_OPS, classify, defines, reads
+from cfg import Block
+from temps import Ranges
+
+# SSA form for a function's CFG. to_ssa() gives every assignment to a
+# local scalar its own name and puts phi functions (Block.phis) where
+# versions meet: at the iterated dominance frontier of the assignments,
+# but only where the variable is live. Renaming walks the dominator tree;
+# a read no assignment reaches keeps the original name. Globals, variables
+# whose address is taken and arrays are never renamed. Versions of x are
+# x.1, x.2, ...; versions of a temp are fresh temps.
+# from_ssa() turns every phi into copies at the end of its predecessors;
+# a predecessor ending in an IF first gets its edge split by a new block,
+# and the copies of one edge are made sequential (a cycle of copies goes
+# through a new temp). Versions of one variable whose live ranges do not
+# overlap then share a name again, the original one first, and split
+# blocks left without copies are taken out, so code that was not changed
+# in between comes back as it was. The passes in optimize.py all work on
+# code out of SSA form.
+#   python ssa.py tac.txt [--function f]    print the SSA form
+
+class Phi:
+    __slots__ = ("var", "x", "args")
+
+    def __init__(self, var):
+        self.var = var      # the variable before renaming
+        self.x = var
+        self.args = {}      # predecessor block -> name
+
+    def __repr__(self):
+        args = ", ".join(f"{p!r}: {a}" for p, a in sorted(self.args.items(), key=lambda item: item[0].id))
+        return f"{self.x} = PHI({args})"
+
+def frontiers(f):
+    # dominance frontier of every reachable block
+    df = {b: set() for b in f.blocks}
+    for b in f.blocks:
+        if b.rpo is None or len(b.pred) < 2:
+            continue
+        for p in b.pred:
+            runner = p
+            while runner is not None and runner.rpo is not None and runner is not b.idom:
+                df[runner].add(b)
+                runner = runner.idom
+    return df
+
+def locals_of(f, ctx):
+    # the names to_ssa may rename
+    names = {t for q in f.quads() for t in q[1:] if t is not None}
+    fixed = set()
+    for q in f.quads():
+        if q[0] == Op.ADDR:
+            fixed.add(q[2])
+        elif q[0] == Op.ALLOC or q[0] == Op.GETIDX:
+            fixed.add(q[1] if q[0] == Op.ALLOC else q[2])
+    return {n for n in names if n not in fixed and (classify(n) == Kind.TEMP
+                                                   or (classify(n) == Kind.VAR and not ctx.may_be_global(n)))}
+
+def to_ssa(f, ctx):
+    rename = locals_of(f, ctx)
+    defs = {}
+    for b in f.blocks:
+        if b.rpo is None:
+            continue
+        for q in b.quads:
+            if defines(q[0]) and q[1] in rename:
+                defs.setdefault(q[1], set()).add(b)
+    live_in, _ = f.liveness()
+    df = frontiers(f)
+    for v in sorted(defs):
+        work = list(defs[v])
+        placed = set()
+        while work:
+            for d in df[work.pop()]:
+                if d not in placed and v in live_in[d]:
+                    placed.add(d)
+                    d.phis.append(Phi(v))
+                    ctx.stats["phis"] += 1
+                    if d not in defs[v]:
+                        work.append(d)
+    count = {}
+
+    def version(v):
+        if classify(v) == Kind.TEMP:
+            x = ctx.temp()
+        else:
+            count[v] = count.get(v, 0)+1
+            x = f"{v}.{count[v]}"
+        f.origin[x] = v
+        return x
+
+    current = {}
+    stack = [(f.entry, None)]
+    while stack:
+        b, undo = stack.pop()
+        if undo is not None:
+            for v, old in reversed(undo):
+                current[v] = old
+            continue
+        undo = []
+        for phi in b.phis:
+            undo.append((phi.var, current.get(phi.var)))
+            phi.x = current[phi.var] = version(phi.var)
+            ctx.stats["versions"] += 1
+        out = []
+        for q in b.quads:
+            op = q[0]
+            q = list(q)
+            for i in reads(op):
+                if q[i] in current:
+                    q[i] = current[q[i]] or q[i]
+            if defines(op) and q[1] in rename:
+                v = q[1]
+                undo.append((v, current.get(v)))
+                q[1] = current[v] = version(v)
+                ctx.stats["versions"] += 1
+            out.append(tuple(q))
+        b.quads = out
+        for s in b.succ:
+            for phi in s.phis:
+                phi.args[b] = current.get(phi.var) or phi.var
+        stack.append((None, undo))
+        stack.extend((c, None) for c in reversed(b.dom))
+    # phi arguments from blocks that never run
+    for b in f.blocks:
+        for phi in b.phis:
+            for p in b.pred:
+                phi.args.setdefault(p, phi.var)
+
+def sequential(copies, ctx):
+    # quads doing the parallel copies [(dst, src)] one after the other
+    pending = {d: s for d, s in copies if d != s}
+    waiting = {}
+    for s in pending.values():
+        waiting[s] = waiting.get(s, 0)+1
+    out = []
+    while pending:
+        ready = [d for d in pending if not waiting.get(d)]
+        if not ready:
+            # a cycle: save one destination, then it is free to be written
+            d = next(iter(pending))
+            t = ctx.temp()
+            out.append((Op.COPY, t, d, None))
+            for k, s in pending.items():
+                if s == d:
+                    pending[k] = t
+            waiting[t] = waiting.pop(d)
+            continue
+        for d in ready:
+            s = pending.pop(d)
+            out.append((Op.COPY, d, s, None))
+            waiting[s] -= 1
+    return out
+
+def from_ssa(f, ctx):
+    splits = []     # (new block, predecessor, block, far)
+    far = []
+    added = set()   # ids of the copy quads put in
+    for b in list(f.blocks):
+        if not b.phis:
+            continue
+        for p in list(b.pred):
+            copies = sequential([(phi.x, phi.args[p]) for phi in b.phis], ctx)
+            ctx.stats["copies"] += len(copies)
+            added.update(map(id, copies))
+            t = p.terminator
+            if t is None or t[0] not in IF_OPS:
+                at = len(p.quads)-1 if t is not None and t[0] == Op.GOTO else len(p.quads)
+                p.quads[at:at] = copies
+                continue
+            label = ctx.label()
+            n = Block(None, [(Op.LABEL, label, None, None)]+copies)
+            k = f.blocks.index(p)
+            if k+1 < len(f.blocks) and f.blocks[k+1] is b:
+                f.blocks.insert(k+1, n)
+                if t[3] == b.label:
+                    p.quads[-1] = (t[0], t[1], t[2], label)
+                splits.append((n, p, b, False))
+            else:
+                n.quads.append((Op.GOTO, b.label, None, None))
+                p.quads[-1] = (t[0], t[1], t[2], label)
+                far.append(n)
+                splits.append((n, p, b, True))
+        b.phis = []
+    # far split blocks go at the end of the function, jumped over if the
+    # code before them could fall through
+    tail = []
+    if far:
+        last = f.blocks[-1].terminator
+        end = ctx.label()
+        if last is None or last[0] not in (Op.GOTO, Op.RETURN):
+            tail.append(Block(None, [(Op.GOTO, end, None, None)]))
+        tail.append(Block(None, [(Op.LABEL, end, None, None)]))
+        f.blocks.extend(tail[:-1]+far+tail[-1:])
+    f.link()
+    f.analyze()
+    coalesce(f, ctx, added)
+    # split blocks that got no copies in the end
+    gone = set()
+    for n, p, b, is_far in splits:
+        body = n.quads[1:-1] if is_far else n.quads[1:]
+        if body:
+            ctx.stats["splits"] += 1
+            continue
+        gone.add(n)
+        t = p.quads[-1]
+        if t[0] in IF_OPS and t[3] == n.label:
+            p.quads[-1] = (t[0], t[1], t[2], b.label)
+    if all(n in gone for n in far):
+        gone.update(tail)
+    if gone:
+        f.blocks = [b for b in f.blocks if b not in gone]
+        f.link()
+        f.analyze()
+
+def coalesce(f, ctx, added=()):
+    # versions of one variable share a name where their live ranges allow;
+    # copies among added that end up as x = x go
+    origin = f.origin
+    names = set(origin) | set(origin.values())
+    r = Ranges(f, names)
+    groups = {}
+    for t in r.order:
+        if t in origin:
+            groups.setdefault(origin[t], []).append(t)
+    rename = {}
+    for base, versions in groups.items():
+        colours = {}
+        slots = []
+        for t in [base]+versions:
+            taken = {colours[u] for u in r.edges.get(t, ()) if u in colours}
+            c = 0
+            while c in taken:
+                c += 1
+            colours[t] = c
+            while len(slots) <= c:
+                slots.append(base if not slots else ctx.temp())
+            rename[t] = slots[c]
+    for b in f.blocks:
+        out = []
+        for q in b.quads:
+            new = (q[0],)+tuple(rename.get(t, t) for t in q[1:])
+            if new[0] == Op.COPY and new[1] == new[2] and id(q) in added:
+                continue
+            out.append(new)
+        b.quads = out
+    f.origin = {}
+
+def run(f, ctx):
+    to_ssa(f, ctx)
+    from_ssa(f, ctx)
+
+def dump(f, out):
+    out.write(f"function {f.name}\n")
+    for b in f.blocks:
+        out.write(f"  {b!r}{' [' + b.label + ']' if b.label else ''} pred {','.join(map(repr, b.pred)) or '-'}\n")
+        k = 1 if b.label else 0
+        for q in b.quads[:k]:
+            out.write("      "+ir.format_quad(q)+"\n")
+        for phi in b.phis:
+            out.write(f"      {phi!r}\n")
+        for q in b.quads[k:]:
+            out.write("      "+ir.format_quad(q)+"\n")
+
+def main(argv=None):
+    import optimize
+    ap = argparse.ArgumentParser(description="SSA form of the functions of a TAC file")
+    ap.add_argument("tac")
+    ap.add_argument("--function")
+    ap.add_argument("-g", "--globals", help="comma separated global variables (default: any named variable may be global)")
+    args = ap.parse_args(argv)
+    program = ir.read(args.tac)
+    ctx = optimize.Context(set(args.globals.split(",")) if args.globals is not None else None, *optimize.counters(program))
+    for f in cfg.build(program):
+        if not f.editable or (args.function and f.name != args.function):
+            continue
+        to_ssa(f, ctx)
+        dump(f, sys.stdout)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+from ir import Op, Kind, classify, defines
+from constprop import value, c_shl
+
+# Strength reduction. In every natural loop a basic induction variable is
+# a variable whose only assignments in the loop add or subtract a constant
+# (i = i + c, or t = i + c; i = t as the parser writes i = i + 1). Then
+#   - i * k with k constant or loop-invariant becomes a copy of a new temp
+#     s, set to i * k in the preheader and bumped by c * k right after
+#     every step of i;
+#   - i / 2^n and i % 2^n become i >> n and i & (2^n - 1) when i starts
+#     from a constant >= 0 and only ever grows.
+# Outside of that, x * 2^n anywhere becomes x << n. Loops without a
+# preheader (see licm.py) are skipped, and calls make globals unusable.
+
+def power(text):
+    # n when text is the literal 2^n (n >= 1), else None
+    v = value(text)
+    if v is None or v < 2 or v & (v-1):
+        return None
+    return v.bit_length()-1
+
+def wrap(v):
+    return c_shl(v, 0)
+
+class _Pass:
+    def __init__(self, f, ctx):
+        self.f = f
+        self.ctx = ctx
+        names = {t for q in f.quads() for t in q[1:] if t is not None}
+        self.escaped = {q[2] for q in f.quads() if q[0] == Op.ADDR}
+        self.glob = self.escaped | {n for n in names if classify(n) == Kind.VAR and ctx.may_be_global(n)}
+
+    def run(self):
+        for loop in sorted(self.f.loops, key=lambda l: -l.depth):
+            self.loop(loop)
+        self.shifts()
+
+    def preheader(self, loop):
+        outside = [p for p in loop.header.pred if p not in loop.blocks]
+        if len(outside) == 1 and outside[0].succ == [loop.header]:
+            return outside[0]
+        return None
+
+    def inductions(self, loop, blocks):
+        # {i: [(block, index of the assignment to i, step)]}
+        defs = {}
+        calls = False
+        for b in blocks:
+            for k, q in enumerate(b.quads):
+                if defines(q[0]) or q[0] == Op.ALLOC:
+                    defs.setdefault(q[1], []).append((b, k, q))
+                elif q[0] == Op.CALL:
+                    calls = True
+        ivs = {}
+        for i, sites in defs.items():
+            if classify(i) == Kind.CONST or (calls and i in self.glob) or i in self.escaped:
+                continue
+            steps = []
+            for b, k, q in sites:
+                step = self.step(i, q)
+                if step is None and q[0] == Op.COPY and k and classify(q[2]) == Kind.TEMP:
+                    t = q[2]
+                    prev = b.quads[k-1]
+                    if prev[1] == t and len(defs.get(t, ())) == 1:
+                        step = self.step(i, prev)
+                if step is None:
+                    break
+                steps.append((b, k, step))
+            else:
+                ivs[i] = steps
+        return ivs, defs, calls
+
+    @staticmethod
+    def step(i, q):
+        op, x, y, z = q
+        if op == Op.ADD:
+            if y == i and value(z) is not None:
+                return value(z)
+            if z == i and value(y) is not None:
+                return value(y)
+        elif op == Op.SUB and y == i and value(z) is not None:
+            return -value(z)
+        return None
+
+    def loop(self, loop):
+        pre = self.preheader(loop)
+        if pre is None:
+            return
+        blocks = sorted(loop.blocks, key=lambda b: b.id)
+        ivs, defs, calls = self.inductions(loop, blocks)
+        if not ivs:
+            return
+        self.ctx.stats["ivs"] += len(ivs)
+
+        def invariant(t):
+            return value(t) is not None or (classify(t) != Kind.CONST and t not in defs
+                                             and not (calls and t in self.glob))
+
+        setup = []
+        inserts = {}    # block -> [(index, quad)]
+        reduced = {}    # (i, k) -> s
+        rising = {i for i, steps in ivs.items() if all(s > 0 for _, _, s in steps) and self.start(pre, i) is not None}
+        for b in blocks:
+            for k, q in enumerate(b.quads):
+                op, x, y, z = q
+                if op == Op.MUL:
+                    i, c = (y, z) if y in ivs else (z, y)
+                    if i not in ivs or not invariant(c) or i == c:
+                        continue
+                    s = reduced.get((i, c))
+                    if s is None:
+                        s = reduced[(i, c)] = self.ctx.temp()
+                        setup.append((Op.MUL, s, i, c))
+                        for sb, sk, step in ivs[i]:
+                            if value(c) is not None:
+                                bump = (Op.ADD, s, s, str(wrap(step*value(c))))
+                            elif step in (1, -1):
+                                bump = (Op.ADD if step == 1 else Op.SUB, s, s, c)
+                            else:
+                                d = self.ctx.temp()
+                                setup.append((Op.MUL, d, c, str(step)))
+                                bump = (Op.ADD, s, s, d)
+                            inserts.setdefault(sb, []).append((sk+1, bump))
+                    b.quads[k] = (Op.COPY, x, s, None)
+                    self.ctx.stats["reduced"] += 1
+                elif op in (Op.DIV, Op.MOD) and y in rising and power(z) is not None:
+                    n = power(z)
+                    if op == Op.DIV:
+                        b.quads[k] = (Op.SHR, x, y, str(n))
+                    else:
+                        b.quads[k] = (Op.BAND, x, y, str((1 << n)-1))
+                    self.ctx.stats["reduced"] += 1
+        if not setup:
+            return
+        for b, items in inserts.items():
+            for at, q in sorted(items, key=lambda item: -item[0]):
+                b.quads.insert(at, q)
+        at = len(pre.quads)-1 if pre.terminator is not None else len(pre.quads)
+        pre.quads[at:at] = setup
+
+    def start(self, pre, i):
+        # the constant >= 0 that i holds when the preheader ends, if known
+        for q in reversed(pre.quads):
+            if q[0] == Op.CALL and i in self.glob:
+                return None
+            if defines(q[0]) and q[1] == i:
+                v = value(q[2]) if q[0] == Op.COPY else None
+                return v if v is not None and v >= 0 else None
+        return None
+
+    def shifts(self):
+        for b in self.f.blocks:
+            for k, q in enumerate(b.quads):
+                if q[0] != Op.MUL:
+                    continue
+                op, x, y, z = q
+                if power(y) is not None:
+                    y, z = z, y
+                n = power(z)
+                if n is not None and value(y) is None:
+                    b.quads[k] = (Op.SHL, x, y, str(n))
+                    self.ctx.stats["shifts"] += 1
+
+def run(f, ctx):
+    _Pass(f, ctx).run()
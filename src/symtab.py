@@ -8,10 +8,6 @@ DATATYPE = {
     "BOOL": 1
 }
 
-TABLENUMBER = 0
-
-num_display_invocations = 0
-
 def get_default_value(_type):
     if _type.upper()=="INT":
         return 0
@@ -27,16 +23,14 @@ class SymbolTable:
     #        1 for FN
     #        2 for ST
     #        3 for CL
-    def __init__(self, parent=None, function_scope=None,labels={}):
-        global TABLENUMBER
-        self.func_scope = function_scope if TABLENUMBER != 0 else "GLOBAL"
+    def __init__(self, parent=None, function_scope=None,labels={},table_number=0):
+        self.func_scope = function_scope if table_number != 0 else "GLOBAL"
         self._variables = dict()
         self._functions = dict()
         self._function_name = dict()
         self.parent = parent
         self.labels=labels
-        self.table_number = TABLENUMBER
-        TABLENUMBER += 1
+        self.table_number = table_number
 
         if parent is None:
             self.table_name = "GLOBAL"
@@ -77,6 +71,12 @@ class SymbolTable:
         return False, prev_entry
     
 
+    def copy_entries(self, other):
+        # entries are shared, not copied; they are never modified after insert
+        self._variables.update(other._variables)
+        self._functions.update(other._functions)
+        self._function_name.update(other._function_name)
+
     def lookup_current_table(self, name,func=0):
         res = self._variables.get(name, None)
         res = self._function_name.get(name, None) if res is None else res
@@ -93,7 +93,6 @@ class SymbolTable:
         return self.parent.lookup(name,func) if res is None and self.parent else res
 
     def display(self,disp=0):
-        global num_display_invocations
         if disp==1:
             print()
             print("-" * 100)
@@ -110,72 +109,90 @@ class SymbolTable:
                 print(f"Name: {v['name']}, Return: {v['return type']}, Parameters: {v['parameter types']}, Name Resolution: {k}")
             print()
 
-        # printing symbol tables in csv
-        if num_display_invocations == 0:
-            if os.path.isfile("symtables.csv"):
-                os.remove("symtables.csv")
-
-        with open("symtables.csv", mode="a+") as sym_file:
-            sym_writer = csv.writer(sym_file, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL)
-            if num_display_invocations == 0:
-                sym_writer.writerow(
-                    [
-                        "SYMBOL TABLE",
-                        "FUNCTION SCOPE",
-                        "VARIABLE/FUNCTION",
-                        "NAME",
-                        "TYPE",
-                        "RETURN TYPE",
-                        "PARAMETERS",
-                    ]
-                )
-                num_display_invocations += 1
-            for k, v in self._variables.items():
-                sym_writer.writerow(
-                    [
-                        f"{self.table_name}",
-                        f"{self.func_scope}",
-                        "Variable",
-                        f"{k}",
-                        f"{v['type'] + '*' * v.get('pointer_lvl',0)}",
-                        "",
-                        "",
-                    ]
-                )
-            for k, v in self._function_name.items():
-                sym_writer.writerow(
-                    [
-                        f"{self.table_name}",
-                        f"{self.func_scope}",
-                        "Function",
-                        f"{k}",
-                        "",
-                        f"{v['return type'] + '*' * v.get('pointer_lvl',0)}",
-                        " ".join(v["parameter types"]),
-                    ]
-                )
-
-SYMBOL_TABLES = []
+    def csv_rows(self):
+        rows = []
+        for k, v in self._variables.items():
+            rows.append(
+                [
+                    f"{self.table_name}",
+                    f"{self.func_scope}",
+                    "Variable",
+                    f"{k}",
+                    f"{v['type'] + '*' * v.get('pointer_lvl',0)}",
+                    "",
+                    "",
+                ]
+            )
+        for k, v in self._function_name.items():
+            rows.append(
+                [
+                    f"{self.table_name}",
+                    f"{self.func_scope}",
+                    "Function",
+                    f"{k}",
+                    "",
+                    f"{v['return type'] + '*' * v.get('pointer_lvl',0)}",
+                    " ".join(v["parameter types"]),
+                ]
+            )
+        return rows
+
+CSV_HEADER = [
+    "SYMBOL TABLE",
+    "FUNCTION SCOPE",
+    "VARIABLE/FUNCTION",
+    "NAME",
+    "TYPE",
+    "RETURN TYPE",
+    "PARAMETERS",
+]
 
 STATIC_VARIABLE_MAPS = {}
 
 
-def pop_scope():
-    global SYMBOL_TABLES
-    s = SYMBOL_TABLES.pop()
-    s.display(1)
-    return s
-
+class ScopeStack:
+    # Scope state of one compilation. Popped tables are printed and appended
+    # to csv_path (None to skip the CSV); timer is an optional PhaseTimer.
+    def __init__(self, csv_path="symtables.csv", timer=None):
+        self.tables = []
+        self.table_number = 0
+        self.num_display_invocations = 0
+        self.csv_path = csv_path
+        self.timer = timer
+
+    def pop_scope(self):
+        s = self.tables.pop()
+        if self.timer is None:
+            s.display(1)
+            self.write_csv(s)
+        else:
+            with self.timer.phase("symtab"):
+                s.display(1)
+                self.write_csv(s)
+        return s
 
-def push_scope(s):
-    global SYMBOL_TABLES
-    SYMBOL_TABLES.append(s)
+    def push_scope(self, s):
+        self.tables.append(s)
 
+    def new_scope(self, parent=None, function_scope=None):
+        s = SymbolTable(parent, function_scope, table_number=self.table_number)
+        self.table_number += 1
+        return s
 
-def new_scope(parent=None, function_scope=None):
-    return SymbolTable(parent, function_scope)
+    def get_current_symtab(self):
+        return None if len(self.tables) == 0 else self.tables[-1]
 
+    def write_csv(self, table):
+        if self.csv_path is None:
+            return
+        # printing symbol tables in csv
+        if self.num_display_invocations == 0:
+            if os.path.isfile(self.csv_path):
+                os.remove(self.csv_path)
 
-def get_current_symtab():
-    global SYMBOL_TABLES
-    return None if len(SYMBOL_TABLES) == 0 else SYMBOL_TABLES[-1]
+        with open(self.csv_path, mode="a+") as sym_file:
+            sym_writer = csv.writer(sym_file, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL)
+            if self.num_display_invocations == 0:
+                sym_writer.writerow(CSV_HEADER)
+                self.num_display_invocations += 1
+            sym_writer.writerows(table.csv_rows())
@@ -0,0 +1,114 @@
+import os
+import sys
+import hashlib
+import importlib.util
+import ply
+import ply.lex as lex
+import ply.yacc as yacc
+
+# Frozen lexer/LALR tables live in a versioned cache, one file per grammar
+# hash, so a normal start only has to load them. Set CS335_NO_CACHE to get
+# the old behaviour (full validation, parser.out and parsetab.py in src/).
+CACHE_VERSION = 1
+
+def cache_dir():
+    d = os.environ.get("CS335_CACHE_DIR")
+    if not d:
+        d = os.path.join(os.path.expanduser("~"), ".cache", "cs335")
+    return os.path.join(d, f"v{CACHE_VERSION}")
+
+def use_cache():
+    return not os.environ.get("CS335_NO_CACHE")
+
+def _digest(parts):
+    h = hashlib.sha1()
+    h.update(f"{CACHE_VERSION}:{ply.__version__}:{sys.version_info[0]}.{sys.version_info[1]}".encode())
+    for part in parts:
+        h.update(b"\0"+str(part).encode())
+    return h.hexdigest()[:16]
+
+def _rules(ns, prefix):
+    # (name, regex/docstring) of every rule in definition order; the order
+    # decides priority between lexer rules so it is part of the hash
+    funcs = []
+    strings = []
+    for name in dir(ns):
+        if not name.startswith(prefix):
+            continue
+        v = getattr(ns, name)
+        if callable(v):
+            code = getattr(v, "__code__", None)
+            line = code.co_firstlineno if code else 0
+            funcs.append((line, name, getattr(v, "regex", v.__doc__)))
+        elif isinstance(v, str):
+            strings.append((name, v))
+    funcs.sort()
+    return [(n, d) for _, n, d in funcs]+sorted(strings)
+
+def lexer_hash(obj):
+    return _digest([obj.tokens, obj.literals]+_rules(obj, "t_"))
+
+def grammar_hash(module):
+    return _digest([getattr(module, "start", ""), getattr(module, "precedence", ""), module.tokens]+_rules(module, "p_"))
+
+def _load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+def build_lexer(obj):
+    if not use_cache():
+        return lex.lex(module=obj)
+    d = cache_dir()
+    name = "lextab_"+lexer_hash(obj)
+    path = os.path.join(d, name+".py")
+    if os.path.exists(path):
+        try:
+            return lex.lex(module=obj, optimize=True, lextab=_load_module(name, path))
+        except Exception:
+            pass
+    lexer = lex.lex(module=obj)
+    try:
+        # write under a private name first so concurrent starts never read
+        # a half written table
+        os.makedirs(d, exist_ok=True)
+        tmp = f"{name}_{os.getpid()}"
+        lexer.writetab(tmp, d)
+        os.replace(os.path.join(d, tmp+".py"), path)
+    except OSError:
+        pass
+    return lexer
+
+def build_parser(module):
+    if not use_cache():
+        return yacc.yacc(module=module)
+    d = cache_dir()
+    path = os.path.join(d, "parsetab_"+grammar_hash(module)+".pickle")
+    if os.path.exists(path):
+        try:
+            return yacc.yacc(module=module, optimize=True, picklefile=path, debug=False)
+        except Exception:
+            pass
+    try:
+        os.makedirs(d, exist_ok=True)
+    except OSError:
+        return yacc.yacc(module=module, debug=False, write_tables=False)
+    tmp = f"{path}.{os.getpid()}"
+    parser = yacc.yacc(module=module, picklefile=tmp, debug=False)
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return parser
+
+def clear_cache():
+    d = cache_dir()
+    if not os.path.isdir(d):
+        return 0
+    n = 0
+    for f in os.listdir(d):
+        if f.startswith(("lextab_", "parsetab_")):
+            os.remove(os.path.join(d, f))
+            n += 1
+    return n
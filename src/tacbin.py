@@ -0,0 +1,191 @@
+import os
+import sys
+import mmap
+import struct
+import argparse
+from array import array
+import ir
+
+# Binary TAC. Little-endian, every section 8-byte aligned:
+#   header   magic "TACB", version, counts and section offsets (HEADER)
+#   strings  u32 offsets[nstrings+1], u8 kinds[nstrings], utf-8 blob
+#   quads    nquads * (i32 op, i32 x, i32 y, i32 z); operands index the
+#            string table, -1 when absent
+#   funcs    nfuncs * (i32 name, i32 first quad, i32 end quad)
+# TacFile maps the file and reads quads straight out of the mapping; strings
+# are decoded the first time they are asked for.
+#   python tacbin.py dump tac.txt [-o tac.bin]
+#   python tacbin.py show tac.bin [--function main] [--stats]
+
+MAGIC = b"TACB"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIIIQQQ")
+
+def _align(n):
+    return (n+7) & ~7
+
+def _functions(prog):
+    funcs = []
+    for i, op in enumerate(prog.op):
+        if op == ir.Op.FUNC:
+            if funcs:
+                funcs[-1][2] = i
+            funcs.append([prog.x[i], i, len(prog.op)])
+    return funcs
+
+def write(prog, path="tac.bin"):
+    n = len(prog)
+    blobs = [s.encode() for s in prog.names]
+    offsets = array("I", [0])
+    for b in blobs:
+        offsets.append(offsets[-1]+len(b))
+    quads = array("i", bytes(16*n))
+    quads[0::4] = array("i", prog.op)
+    quads[1::4] = prog.x
+    quads[2::4] = prog.y
+    quads[3::4] = prog.z
+    funcs = array("i", [v for f in _functions(prog) for v in f])
+    if sys.byteorder != "little":
+        for a in (offsets, quads, funcs):
+            a.byteswap()
+    strings = offsets.tobytes()+bytes(prog.kinds)+b"".join(blobs)
+    off_strings = _align(HEADER.size)
+    off_quads = _align(off_strings+len(strings))
+    off_funcs = _align(off_quads+16*n)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, n, len(blobs), len(funcs)//3, 0, off_strings, off_quads, off_funcs))
+        for off, data in ((off_strings, strings), (off_quads, quads.tobytes()), (off_funcs, funcs.tobytes())):
+            f.write(bytes(off-f.tell()))
+            f.write(data)
+    return path
+
+class TacFile:
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < HEADER.size:
+            self._file.close()
+            raise ValueError(f"{path}: truncated binary TAC file")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, n, nstrings, nfuncs, _, off_strings, off_quads, off_funcs = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: not a version {VERSION} binary TAC file")
+        # every section, the string blob last, has to lie inside the file
+        if (off_strings+5*nstrings+4 > size or off_quads+16*n > size or off_funcs+12*nfuncs > size
+                or off_strings+5*nstrings+4+struct.unpack_from("<I", self._map, off_strings+4*nstrings)[0] > size):
+            self.close()
+            raise ValueError(f"{path}: truncated binary TAC file")
+        self.nquads = n
+        self.nstrings = nstrings
+        view = memoryview(self._map)
+        self._offsets = self._ints(view[off_strings:off_strings+4*(nstrings+1)], "I")
+        kinds_at = off_strings+4*(nstrings+1)
+        self.kinds = view[kinds_at:kinds_at+nstrings]
+        self._blob = kinds_at+nstrings
+        self._quads = self._ints(view[off_quads:off_quads+16*n], "i")
+        self._funcs = self._ints(view[off_funcs:off_funcs+12*nfuncs], "i")
+        self._names = {}
+
+    @staticmethod
+    def _ints(view, code):
+        if sys.byteorder == "little":
+            return view.cast(code)
+        a = array(code, view.tobytes())
+        a.byteswap()
+        return a
+
+    def close(self):
+        # views into the mapping have to go before it can be closed
+        for attr in ("_offsets", "kinds", "_quads", "_funcs"):
+            v = getattr(self, attr, None)
+            if isinstance(v, memoryview):
+                v.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.nquads
+
+    def string(self, i):
+        if i < 0:
+            return None
+        s = self._names.get(i)
+        if s is None:
+            start = self._blob+self._offsets[i]
+            s = self._names[i] = self._map[start:self._blob+self._offsets[i+1]].decode()
+        return s
+
+    @property
+    def ops(self):
+        # the opcode column as a strided view of the mapping
+        return self._quads[0::4]
+
+    def raw(self, i):
+        # (op, x, y, z) as integers, without touching the string table
+        q = self._quads
+        return q[4*i], q[4*i+1], q[4*i+2], q[4*i+3]
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.nquads
+        if not 0 <= i < self.nquads:
+            raise IndexError(i)
+        op, x, y, z = self.raw(i)
+        return ir.Op(op), self.string(x), self.string(y), self.string(z)
+
+    def __iter__(self):
+        return self.quads(0, self.nquads)
+
+    def quads(self, start, end):
+        for i in range(start, end):
+            yield self[i]
+
+    def functions(self):
+        f = self._funcs
+        return {self.string(f[k]): (f[k+1], f[k+2]) for k in range(0, len(f), 3)}
+
+    def function(self, name):
+        start, end = self.functions()[name]
+        return self.quads(start, end)
+
+    def to_program(self):
+        prog = ir.Program()
+        for q in self:
+            prog.append(*q)
+        return prog
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="binary TAC files")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sp = sub.add_parser("dump", help="convert tac.txt to the binary format")
+    sp.add_argument("tac")
+    sp.add_argument("-o", "--output", default="tac.bin")
+    sp = sub.add_parser("show", help="print a binary TAC file as text")
+    sp.add_argument("bin")
+    sp.add_argument("--function")
+    sp.add_argument("--stats", action="store_true", help="only counts and the function table")
+    args = ap.parse_args(argv)
+    if args.cmd == "dump":
+        write(ir.read(args.tac), args.output)
+        return 0
+    with TacFile(args.bin) as tf:
+        if args.stats:
+            print(f"{len(tf)} quads, {tf.nstrings} strings")
+            for name, (start, end) in tf.functions().items():
+                print(f"{name:<20} quads {start}..{end}")
+            return 0
+        quads = tf.function(args.function) if args.function else iter(tf)
+        out = sys.stdout
+        for q in quads:
+            out.write(ir.format_quad(q)+"\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
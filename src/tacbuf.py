@@ -0,0 +1,68 @@
+class TacBuffer:
+    """Immutable rope of TAC quads.
+
+    Every parser action glues the code of its children together, so plain
+    list concatenation copies each quad once per enclosing production.
+    Adding two buffers only records both halves; the quads are copied out a
+    single time when the buffer is iterated (see ir.Program.from_quads).
+    Lists handed to a buffer are owned by it and must not be mutated later.
+    """
+    __slots__ = ("_parts", "_len")
+
+    def __init__(self, quads=None):
+        if quads:
+            self._parts = (quads,)
+            self._len = len(quads)
+        else:
+            self._parts = ()
+            self._len = 0
+
+    @staticmethod
+    def _wrap(other):
+        if isinstance(other, TacBuffer):
+            return other
+        if isinstance(other, list):
+            return TacBuffer(other)
+        return NotImplemented
+
+    def _join(self, left, right):
+        if not right._len:
+            return left
+        if not left._len:
+            return right
+        buf = TacBuffer.__new__(TacBuffer)
+        buf._parts = (left, right)
+        buf._len = left._len + right._len
+        return buf
+
+    def __add__(self, other):
+        other = self._wrap(other)
+        if other is NotImplemented:
+            return other
+        return self._join(self, other)
+
+    def __radd__(self, other):
+        other = self._wrap(other)
+        if other is NotImplemented:
+            return other
+        return self._join(other, self)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        # explicit stack: left-leaning ropes from long statement lists are far
+        # deeper than the recursion limit
+        stack = [self]
+        while stack:
+            part = stack.pop()
+            if isinstance(part, TacBuffer):
+                stack.extend(reversed(part._parts))
+            else:
+                yield from part
+
+    def flatten(self):
+        return list(self)
+
+    def __repr__(self):
+        return f"TacBuffer({self._len} quads)"
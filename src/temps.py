@@ -0,0 +1,100 @@
+import sys
+import argparse
+import ir
+import cfg
+from ir import Op, Kind, classify, defines, reads
+
+# Temp reuse. The parser hands out a new VARn for every subexpression; this
+# pass renames the temps of each function onto as few of its own VARn names
+# as live ranges allow. Two temps interfere when one is assigned while the
+# other is live afterwards (a copy t = s does not make t and s interfere,
+# so it often turns into t = t and goes). Temps are coloured greedily in
+# order of first appearance; colour k becomes the function's k-th lowest
+# temp name, so names stay unique to their function. Temps whose address
+# is taken keep their names.
+#   python temps.py tac.txt     max live temps per function
+
+def _number(t):
+    return int(t[3:]) if t[3:].isdigit() else 0
+
+class Ranges:
+    def __init__(self, f, names=None):
+        # interference among names, by default the function's temps
+        self.f = f
+        self.order = []     # names by first appearance
+        seen = set()
+        for q in f.quads():
+            for t in q[1:]:
+                if t is not None and t not in seen and (classify(t) == Kind.TEMP if names is None else t in names):
+                    seen.add(t)
+                    self.order.append(t)
+        self.fixed = {q[2] for q in f.quads() if q[0] == Op.ADDR} & seen
+        self.edges = {t: set() for t in self.order}
+        self.max_live = 0
+        _, live_out = f.liveness()
+        for b in f.blocks:
+            live = {t for t in live_out[b] if t in seen}
+            self.max_live = max(self.max_live, len(live))
+            for q in reversed(b.quads):
+                op = q[0]
+                if defines(op) and q[1] in seen:
+                    t = q[1]
+                    for u in live:
+                        if u != t and not (op == Op.COPY and u == q[2]):
+                            self.edges[t].add(u)
+                            self.edges[u].add(t)
+                    live.discard(t)
+                for i in reads(op):
+                    if q[i] in seen:
+                        live.add(q[i])
+                self.max_live = max(self.max_live, len(live))
+
+    def colour(self):
+        # temp -> new name
+        names = sorted((t for t in self.order if t not in self.fixed), key=_number)
+        colours = {}
+        rename = {}
+        for t in self.order:
+            if t in self.fixed:
+                continue
+            taken = {colours[u] for u in self.edges[t] if u in colours}
+            c = 0
+            while c in taken:
+                c += 1
+            colours[t] = c
+            rename[t] = names[c]
+        return rename
+
+def run(f, ctx):
+    r = Ranges(f)
+    if not r.order:
+        return
+    rename = r.colour()
+    used = set(rename.values())
+    ctx.stats["temps"] += len(r.order)
+    slots = len(used)+len(r.fixed)
+    ctx.stats["slots"] += slots
+    ctx.stats["max_live"] = max(ctx.stats["max_live"], r.max_live)
+    ctx.stats.setdefault("per_function", {})[f.name or "-"] = {"max_live": r.max_live, "slots": slots}
+    for b in f.blocks:
+        out = []
+        for q in b.quads:
+            q = (q[0],)+tuple(rename.get(t, t) for t in q[1:])
+            if q[0] == Op.COPY and q[1] == q[2] and classify(q[1]) == Kind.TEMP:
+                ctx.stats["copies"] += 1
+                continue
+            out.append(q)
+        b.quads = out
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="temps and the most of them live at once, per function")
+    ap.add_argument("tac")
+    args = ap.parse_args(argv)
+    print(f"{'function':<20} {'temps':>8} {'max live':>8}")
+    for f in cfg.build(ir.read(args.tac)):
+        r = Ranges(f)
+        print(f"{f.name or '-':<20} {len(r.order):>8} {r.max_live:>8}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
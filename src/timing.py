@@ -0,0 +1,116 @@
+import time
+import json
+import tracemalloc
+import contextlib
+
+# Per-phase wall time, CPU time and peak memory of one compilation.
+# Phases nest (the symbol table writes happen inside parser actions, the
+# actions inside the parse); times are exclusive, so a parent's numbers do
+# not include its children. Peak memory comes from tracemalloc and is the
+# highest traced size seen while the phase or one nested in it was running.
+
+PHASES = ("scanner", "parse", "semantic", "symtab", "ast", "opt", "tac")
+
+class Phase:
+    __slots__ = ("name", "wall", "cpu", "peak", "calls")
+
+    def __init__(self, name):
+        self.name = name
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peak = 0
+        self.calls = 0
+
+class PhaseTimer:
+    def __init__(self, memory=True):
+        self.memory = memory
+        self.reset()
+
+    def reset(self):
+        # forget earlier measurements; wrapped callables stay valid
+        self.phases = {name: Phase(name) for name in PHASES}
+        self._stack = []
+        self._started = None
+        self._own_tracemalloc = False
+        self.total = (0.0, 0.0, 0)
+
+    def start(self):
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._own_tracemalloc = True
+        self._started = (time.perf_counter(), time.process_time())
+
+    def stop(self):
+        wall = time.perf_counter()-self._started[0]
+        cpu = time.process_time()-self._started[1]
+        peak = 0
+        if self.memory:
+            # the per-phase bookkeeping resets tracemalloc's peak, so the
+            # overall peak is the largest one any phase saw
+            peak = max([p.peak for p in self.phases.values()]+[tracemalloc.get_traced_memory()[1]])
+        self.total = (wall, cpu, peak)
+        if self._own_tracemalloc:
+            tracemalloc.stop()
+
+    def _enter(self, name):
+        now = (time.perf_counter(), time.process_time())
+        if self._stack:
+            self._pause(self._stack[-1], now)
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = Phase(name)
+        phase.calls += 1
+        self._stack.append([phase, now])
+
+    def _pause(self, frame, now):
+        phase, since = frame
+        phase.wall += now[0]-since[0]
+        phase.cpu += now[1]-since[1]
+        if self.memory:
+            phase.peak = max(phase.peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+    def _exit(self):
+        now = (time.perf_counter(), time.process_time())
+        frame = self._stack.pop()
+        self._pause(frame, now)
+        if self._stack:
+            parent = self._stack[-1]
+            parent[0].peak = max(parent[0].peak, frame[0].peak)
+            parent[1] = now
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        self._enter(name)
+        try:
+            yield
+        finally:
+            self._exit()
+
+    def wrap(self, name, func):
+        def timed(*args):
+            self._enter(name)
+            try:
+                return func(*args)
+            finally:
+                self._exit()
+        timed.__name__ = func.__name__
+        return timed
+
+    def report(self, **info):
+        phases = {}
+        for p in self.phases.values():
+            phases[p.name] = {"wall_s": p.wall, "cpu_s": p.cpu, "peak_bytes": p.peak, "calls": p.calls}
+        wall, cpu, peak = self.total
+        info.update(phases=phases, total={"wall_s": wall, "cpu_s": cpu, "peak_bytes": peak})
+        return info
+
+def format_report(report, fmt="text"):
+    if fmt == "json":
+        return json.dumps(report, indent=2)
+    lines = [f"{'phase':<10} {'wall ms':>10} {'cpu ms':>10} {'peak KiB':>10} {'calls':>8}"]
+    for name, p in report["phases"].items():
+        lines.append(f"{name:<10} {p['wall_s']*1000:10.2f} {p['cpu_s']*1000:10.2f} {p['peak_bytes']/1024:10.1f} {p['calls']:8d}")
+    t = report["total"]
+    lines.append(f"{'total':<10} {t['wall_s']*1000:10.2f} {t['cpu_s']*1000:10.2f} {t['peak_bytes']/1024:10.1f}")
+    return "\n".join(lines)
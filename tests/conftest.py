@@ -0,0 +1,5 @@
+import os
+import sys
+
+# the compiler's modules are imported flat from src/, as the scripts there do
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
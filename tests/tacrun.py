@@ -0,0 +1,113 @@
+import ir
+from ir import Op, Kind
+
+# A small interpreter for the TAC in ir.Program, enough to check that the
+# optimiser and the lowering keep a program's behaviour. Values are 32-bit
+# ints; division by zero and reads outside an array give 0; INPUT takes the
+# next of inputs and OUT appends to the output. Top level code runs first,
+# then main.
+
+class Trap(Exception):
+    pass
+
+def _div(a, b):
+    if b == 0:
+        return 0
+    q = abs(a)//abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+def _wrap(v):
+    v &= 0xffffffff
+    return v-(1 << 32) if v & 0x80000000 else v
+
+BINARY = {Op.ADD: lambda a, b: a+b, Op.SUB: lambda a, b: a-b, Op.MUL: lambda a, b: a*b,
+          Op.DIV: _div, Op.MOD: lambda a, b: a-b*_div(a, b),
+          Op.LT: lambda a, b: int(a < b), Op.GT: lambda a, b: int(a > b),
+          Op.LE: lambda a, b: int(a <= b), Op.GE: lambda a, b: int(a >= b),
+          Op.EQ: lambda a, b: int(a == b), Op.NE: lambda a, b: int(a != b),
+          Op.BAND: lambda a, b: a & b, Op.BXOR: lambda a, b: a ^ b, Op.BOR: lambda a, b: a | b,
+          Op.AND: lambda a, b: int(bool(a) and bool(b)), Op.OR: lambda a, b: int(bool(a) or bool(b)),
+          Op.SHL: lambda a, b: a << b, Op.SHR: lambda a, b: a >> b}
+UNARY = {Op.NEG: lambda a: -a, Op.POS: lambda a: a, Op.NOT: lambda a: int(not a), Op.BNOT: lambda a: ~a}
+RELATION = {Op.IF_EQ: lambda a, b: a == b, Op.IF_NE: lambda a, b: a != b,
+            Op.IF_LT: lambda a, b: a < b, Op.IF_LE: lambda a, b: a <= b,
+            Op.IF_GT: lambda a, b: a > b, Op.IF_GE: lambda a, b: a >= b}
+
+def run(program, global_names=(), inputs=(), limit=100000):
+    # (return value of main, outputs, globals); raises Trap
+    quads = list(program)
+    labels = {q[1]: i for i, q in enumerate(quads) if q[0] == Op.LABEL}
+    funcs = {q[1]: i for i, q in enumerate(quads) if q[0] == Op.FUNC}
+    global_names = set(global_names)
+    globals_ = {}
+    inputs = list(inputs)
+    out = []
+    steps = 0
+
+    def value(frame, t):
+        if ir.classify(t) == Kind.CONST:
+            if t in ("true", "false"):
+                return int(t == "true")
+            if t[0] == "'":
+                return ord(t[1])
+            return int(t)
+        return (globals_ if t in global_names else frame).get(t, 0)
+
+    def store(frame, t, v):
+        (globals_ if t in global_names else frame)[t] = _wrap(v)
+
+    def call(start, args):
+        nonlocal steps
+        frame = {}
+        params = []
+        ret = last = None
+        pc = start+1
+        while pc < len(quads):
+            steps += 1
+            if steps > limit:
+                raise Trap("step limit")
+            op, x, y, z = quads[pc]
+            pc += 1
+            if op == Op.FUNC or op == Op.RETURN:
+                return ret
+            if op in (Op.LABEL, Op.SAVE):
+                continue
+            if op == Op.GOTO:
+                pc = labels[x]
+            elif op in RELATION:
+                if RELATION[op](value(frame, x), value(frame, y)):
+                    pc = labels[z]
+            elif op == Op.COPY:
+                store(frame, x, value(frame, y))
+            elif op in BINARY:
+                store(frame, x, BINARY[op](value(frame, y), value(frame, z)))
+            elif op in UNARY:
+                store(frame, x, UNARY[op](value(frame, y)))
+            elif op == Op.ALLOC:
+                (globals_ if x in global_names else frame)[x] = [0]*value(frame, y)
+            elif op == Op.GETIDX:
+                arr = (globals_ if y in global_names else frame).get(y)
+                i = value(frame, z)
+                store(frame, x, arr[i] if isinstance(arr, list) and 0 <= i < len(arr) else 0)
+            elif op == Op.PARAM:
+                params.append(value(frame, x))
+            elif op == Op.GET:
+                store(frame, x, args.pop(0) if args else 0)
+            elif op == Op.CALL:
+                last = call(funcs[x], params)
+                params = []
+            elif op == Op.RETVAL:
+                store(frame, x, last)
+            elif op == Op.STORE_RET:
+                ret = value(frame, x)
+            elif op == Op.OUT:
+                out.append(value(frame, x))
+            elif op == Op.INPUT:
+                store(frame, x, inputs.pop(0) if inputs else 0)
+            else:
+                raise Trap(f"cannot run {op.name}")
+        return ret
+
+    call(-1, [])
+    result = call(funcs["main"], [])
+    return result, out, globals_
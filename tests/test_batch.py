@@ -0,0 +1,39 @@
+import os
+import sys
+import shutil
+import subprocess
+
+# batch.py end to end: a pool of workers over a few files, one of them
+# broken.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BATCH = os.path.join(HERE, "..", "src", "batch.py")
+PARSER = os.path.join(HERE, "..", "src", "parser.py")
+GOOD = ["gcd.cpp", "fibb.cpp", "isPrime.cpp"]
+
+def test_batch(tmp_path):
+    for name in GOOD:
+        shutil.copy(os.path.join(HERE, name), tmp_path)
+    (tmp_path/"bad.cpp").write_text("int main(){ int a = 1 +; return a; }\n")
+    out = tmp_path/"out"
+    r = subprocess.run([sys.executable, BATCH, "-j", "2", "-o", str(out), str(tmp_path)],
+                       capture_output=True, text=True)
+    assert r.returncode == 1
+    assert "FAIL" in r.stdout and "bad.cpp" in r.stdout
+    assert "4 files (1 failed)" in r.stdout
+    assert not (out/"bad"/"tac.txt").exists()
+    assert "error at line no" in (out/"bad"/"stdout.txt").read_text()
+    for name in GOOD:
+        # the same TAC as compiling the file on its own
+        single = tmp_path/("single_"+name)
+        single.mkdir()
+        subprocess.run([sys.executable, PARSER, str(tmp_path/name)], cwd=single, check=True, capture_output=True)
+        stem = name[:-4]
+        assert (out/stem/"tac.txt").read_text() == (single/"tac.txt").read_text()
+        assert (out/stem/"symtables.csv").exists() and (out/stem/"AST.dot").exists()
+
+def test_batch_all_good(tmp_path):
+    files = [os.path.join(HERE, name) for name in GOOD]
+    r = subprocess.run([sys.executable, BATCH, "-j", "2", "-q", "-O", "-o", str(tmp_path), *files],
+                       capture_output=True, text=True)
+    assert r.returncode == 0 and "(0 failed)" in r.stdout
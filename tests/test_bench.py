@@ -0,0 +1,30 @@
+import io
+import contextlib
+import bench
+import tacbuf
+from parser import Compiler
+
+# The inputs of `bench.py scaling` compile in linear time. Timing them is
+# no use at sizes a test can afford, since quadratic copying only shows up
+# well past them, so count instead: every quad is copied out of the
+# TacBuffer exactly once, however long the function.
+
+def test_quads_copied_once(tmp_path, monkeypatch):
+    copied = [0]
+    iterate = tacbuf.TacBuffer.__iter__
+
+    def counting(self):
+        for q in iterate(self):
+            copied[0] += 1
+            yield q
+
+    monkeypatch.setattr(tacbuf.TacBuffer, "__iter__", counting)
+    sizes = []
+    for n in (250, 1000, 4000):
+        copied[0] = 0
+        compiler = Compiler()
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert compiler.compile_to(bench.gen_statements(n), str(tmp_path)) is not None
+        assert copied[0] == len(compiler.program)
+        sizes.append(len(compiler.program))
+    assert sizes[2]-sizes[1] == 4*(sizes[1]-sizes[0])
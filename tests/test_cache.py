@@ -0,0 +1,67 @@
+import os
+import json
+import time
+from cache import CompileCache, compile_cached
+from parser import Compiler
+
+# The compile cache: lookups, the byte count kept in stats.json and LRU
+# eviction once it outgrows max_bytes.
+
+def stored_bytes(cache):
+    with open(os.path.join(cache.root, "stats.json")) as f:
+        return json.load(f)["bytes"]
+
+def entry(n):
+    return {"ok": True, "errors": [], "stdout": "x"*n}
+
+def test_hit_and_miss(tmp_path):
+    cache = CompileCache(str(tmp_path))
+    key = cache.key("int main(){}")
+    assert key != cache.key("int main(){}", "constprop") != cache.key("int main(){ }")
+    assert cache.get(key) is None
+    cache.put(key, entry(10))
+    assert cache.get(key) == entry(10)
+    s = cache.stats()
+    assert (s["hits"], s["misses"], s["entries"]) == (1, 1, 1)
+
+def test_overwrite_keeps_byte_count(tmp_path):
+    cache = CompileCache(str(tmp_path))
+    cache.put("a"*64, entry(100))
+    for n in (5000, 300, 2000):
+        cache.put("a"*64, entry(n))
+        assert stored_bytes(cache) == cache._scan_bytes()
+    assert cache.stats()["entries"] == 1
+
+def test_lru_eviction(tmp_path):
+    cache = CompileCache(str(tmp_path), max_bytes=3500)
+    keys = [c*64 for c in "abc"]
+    for k in keys:
+        cache.put(k, entry(1000))
+    # a is the oldest but gets used, so b goes first
+    now = time.time()
+    for age, k in zip((300, 200, 100), keys):
+        os.utime(cache._path(k), (now-age, now-age))
+    assert cache.get(keys[0]) is not None
+    cache.put("d"*64, entry(1000))
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None and cache.get("d"*64) is not None
+    s = cache.stats()
+    assert s["evictions"] >= 1 and s["bytes"] <= 3500
+    assert stored_bytes(cache) == cache._scan_bytes()
+
+def test_compile_cached(tmp_path):
+    with open(os.path.join(os.path.dirname(__file__), "gcd.cpp")) as f:
+        source = f.read()
+    cache = CompileCache(str(tmp_path/"cache"))
+    outs = []
+    for run in range(2):
+        out = tmp_path/f"out{run}"
+        out.mkdir()
+        ok, errors, hit = compile_cached(cache, source, str(out), Compiler())
+        assert ok and not errors and hit == (run == 1)
+        outs.append((out/"tac.txt").read_text())
+    assert outs[0] == outs[1]
+    # failed compiles are not kept
+    for run in range(2):
+        ok, _, hit = compile_cached(cache, "int main(){ int a = ; }", str(tmp_path), Compiler())
+        assert not ok and not hit
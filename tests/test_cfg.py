@@ -0,0 +1,136 @@
+import glob
+import os
+import ir
+import cfg
+from parser import Compiler
+
+# Dominators, natural loops and liveness on small hand-written CFGs. Blocks
+# are looked up by their label; the function's first block is "entry" and
+# a block without a label by the label of the block before it plus "+".
+
+def function(text):
+    f, = cfg.build(ir.parse(text))
+    assert list(cfg.to_program([f])) == list(ir.parse(text))
+    return f, names(f)
+
+def names(f):
+    by = {}
+    prev = "entry"
+    for b in f.blocks:
+        name = b.label or (prev+"+" if b is not f.entry else "entry")
+        by[name] = b
+        prev = name
+    return by
+
+def idoms(b):
+    name = {blk: n for n, blk in b.items()}
+    return {n: name.get(blk.idom) for n, blk in b.items()}
+
+DIAMOND = """\
+f:
+IF a < b GOTO L1
+x = 1
+GOTO L2
+L1 :
+x = 2
+L2 :
+OUT x
+RETURN
+"""
+
+def test_diamond():
+    f, b = function(DIAMOND)
+    assert list(b) == ["entry", "entry+", "L1", "L2"]
+    assert [s.label for s in b["entry"].succ] == [None, "L1"]
+    assert idoms(b) == {"entry": None, "entry+": "entry", "L1": "entry", "L2": "entry"}
+    assert f.dominates(b["entry"], b["L2"]) and not f.dominates(b["L1"], b["L2"])
+    assert f.loops == []
+    live_in, live_out = f.liveness()
+    assert live_in[b["entry"]] == {"a", "b"}
+    assert live_in[b["L2"]] == {"x"} and live_out[b["L1"]] == {"x"}
+    assert live_in[b["entry+"]] == set()
+
+NESTED = """\
+f:
+i = 0
+L1 :
+IF i >= n GOTO L4
+j = 0
+L2 :
+IF j >= n GOTO L3
+j = j + 1
+IF j == 5 GOTO L2
+GOTO L2
+L3 :
+i = i + 1
+GOTO L1
+L4 :
+OUT i
+RETURN
+"""
+
+def test_nested_loops():
+    f, b = function(NESTED)
+    assert idoms(b) == {"entry": None, "L1": "entry", "L1+": "L1", "L2": "L1+", "L2+": "L2",
+                           "L2++": "L2+", "L3": "L2", "L4": "L1"}
+    outer, inner = f.loops
+    assert outer.header is b["L1"] and inner.header is b["L2"]
+    assert outer.blocks == {b[n] for n in ("L1", "L1+", "L2", "L2+", "L2++", "L3")}
+    # the two back edges into L2 make one loop
+    assert inner.blocks == {b[n] for n in ("L2", "L2+", "L2++")}
+    assert set(inner.latches) == {b["L2+"], b["L2++"]}
+    assert inner.parent is outer and outer.children == [inner] and inner.depth == 2
+    assert b["L2+"].loop is inner and b["L3"].loop is outer and b["L4"].loop is None
+    assert sorted(outer.exits(), key=lambda e: e[1].id) == [(b["L1"], b["L4"])]
+    live_in, _ = f.liveness()
+    assert live_in[b["L1"]] == {"i", "n"} and live_in[b["L2"]] == {"i", "j", "n"}
+    assert live_in[b["L4"]] == {"i"}
+
+IRREDUCIBLE = """\
+f:
+IF a < 0 GOTO L2
+L1 :
+x = x + 1
+IF x < 10 GOTO L2
+RETURN
+L2 :
+x = x + 2
+GOTO L1
+"""
+
+def test_irreducible():
+    # L1 and L2 are both entered from outside the cycle, so neither
+    # dominates the other and there is no natural loop
+    f, b = function(IRREDUCIBLE)
+    assert idoms(b) == {"entry": None, "L1": "entry", "L1+": "L1", "L2": "entry"}
+    assert f.loops == []
+    live_in, _ = f.liveness()
+    assert live_in[b["L1"]] == {"x"} and live_in[b["L2"]] == {"x"}
+
+UNREACHABLE = """\
+f:
+GOTO L1
+x = 5
+OUT x
+L1 :
+RETURN
+L9 :
+y = y + 1
+GOTO L9
+"""
+
+def test_unreachable_blocks():
+    f, b = function(UNREACHABLE)
+    assert [blk.rpo for blk in f.blocks] == [0, None, 1, None]
+    assert idoms(b) == {"entry": None, "entry+": None, "L1": "entry", "L9": None}
+    # the unreachable self loop at L9 is not a loop of the function
+    assert f.loops == [] and b["L9"].loop is None
+    assert not f.dominates(b["L9"], b["L9"])
+
+def test_to_program_round_trip(tmp_path):
+    for path in sorted(glob.glob(os.path.join(os.path.dirname(__file__), "*.cpp"))):
+        with open(path) as f:
+            source = f.read()
+        compiler = Compiler()
+        assert compiler.compile_to(source, str(tmp_path)) is not None
+        assert list(cfg.to_program(cfg.build(compiler.program))) == list(compiler.program)
@@ -0,0 +1,71 @@
+import os
+import threading
+from parser import Compiler
+
+# A Compiler can be reused and several can run side by side: each compile
+# must give exactly what a fresh, single-use Compiler gives.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def source(name):
+    with open(os.path.join(HERE, name)) as f:
+        return f.read()
+
+def outputs(compiler, src, outdir):
+    os.makedirs(outdir, exist_ok=True)
+    assert compiler.compile_to(src, str(outdir)) is not None
+    assert not compiler.errors
+    result = []
+    for name in ("tac.txt", "symtables.csv"):
+        with open(os.path.join(outdir, name)) as f:
+            result.append(f.read())
+    return result
+
+def fresh(src, outdir):
+    return outputs(Compiler(), src, outdir)
+
+GCD, PRIME = source("gcd.cpp"), source("isPrime.cpp")
+SEMANTIC_ERROR = "int main(){ int a; a = b+1; while(a < 3) { a = a+1; } return a; }"
+SYNTAX_ERROR = "int main(){ int a; while(a < 3 +) { a = a+1; } break; return a; }"
+
+def test_reuse(tmp_path):
+    want = {"gcd": fresh(GCD, tmp_path/"gcd"), "prime": fresh(PRIME, tmp_path/"prime")}
+    assert want["gcd"] != want["prime"]
+    c = Compiler()
+    for name in ("gcd", "prime", "gcd", "prime"):
+        assert outputs(c, GCD if name == "gcd" else PRIME, tmp_path/"reuse") == want[name]
+
+def test_interleaved(tmp_path):
+    want_gcd, want_prime = fresh(GCD, tmp_path/"gcd"), fresh(PRIME, tmp_path/"prime")
+    a, b = Compiler(), Compiler()
+    assert outputs(a, GCD, tmp_path/"a") == want_gcd
+    assert outputs(b, PRIME, tmp_path/"b") == want_prime
+    assert outputs(a, PRIME, tmp_path/"a") == want_prime
+    assert outputs(b, GCD, tmp_path/"b") == want_gcd
+
+def test_side_by_side(tmp_path):
+    # two compilers in two threads, their parses interleaved by the GIL
+    want = [fresh(GCD, tmp_path/"gcd"), fresh(PRIME, tmp_path/"prime")]
+    got = [None, None]
+    start = threading.Barrier(2)
+
+    def work(i, src):
+        c = Compiler()
+        start.wait()
+        got[i] = [outputs(c, src, tmp_path/f"t{i}.{k}") for k in range(5)]
+
+    threads = [threading.Thread(target=work, args=(i, src)) for i, src in enumerate((GCD, PRIME))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert got == [[want[0]]*5, [want[1]]*5]
+
+def test_failed_compile_leaves_nothing(tmp_path):
+    want = fresh(GCD, tmp_path/"gcd")
+    for bad in (SEMANTIC_ERROR, SYNTAX_ERROR):
+        c = Compiler()
+        assert c.compile_to(bad, str(tmp_path)) is None or c.errors
+        assert c.errors or c.syntax_error
+        assert outputs(c, GCD, tmp_path/"after") == want
+        assert c.errors == [] and not c.syntax_error and c.loops == [] and c.scopes.tables == []
@@ -0,0 +1,38 @@
+import os
+import draw
+from parser import Compiler
+from tacrun import run
+
+# Inputs far deeper than the recursion limit: the parser's actions, the AST
+# walk behind AST.dot and the TAC lowering must all get through them.
+
+def compile_program(source, outdir):
+    compiler = Compiler()
+    result = compiler.compile_to(source, str(outdir))
+    assert result is not None and not compiler.errors
+    assert os.path.getsize(outdir/"AST.dot") > 0
+    return result, compiler.program
+
+def test_else_if_chain(tmp_path):
+    n = 3000
+    chain = "".join(f"if(x == {i} || x == {i+n}) y = {i+1};\nelse " for i in range(n))
+    source = "int main(){ int x,y; cin>>x; y = 0;\n%sy = 0;\nreturn y; }" % chain
+    result, program = compile_program(source, tmp_path)
+    assert draw.walk(result) > 2*n
+    for x, y in [(0, 1), (n-1, n), (2*n-1, n), (2*n, 0)]:
+        assert run(program, inputs=[x])[0] == y
+
+def test_long_expression(tmp_path):
+    n = 30000
+    source = "int main(){ int x,y; cin>>x; y = %s; return y; }" % " + ".join(["x"]*n)
+    _, program = compile_program(source, tmp_path)
+    assert run(program, inputs=[3])[0] == 3*n
+
+def test_long_conditions(tmp_path):
+    n = 3000
+    any_of = " || ".join(f"x == {i}" for i in range(n))
+    all_of = " && ".join(f"x != {i}" for i in range(n))
+    source = "int main(){ int x,y; cin>>x; y = 0; while(%s) { y = y+1; x = x+%d; } if(%s) y = y+10; return y; }" % (any_of, n, all_of)
+    _, program = compile_program(source, tmp_path)
+    assert run(program, inputs=[5])[0] == 11
+    assert run(program, inputs=[n])[0] == 10
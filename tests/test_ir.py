@@ -0,0 +1,106 @@
+import glob
+import os
+import pytest
+import ir
+import corpus
+from ir import Op, Kind
+from parser import Compiler
+
+# tac.txt <-> ir.Program: every line format the compiler writes has to
+# parse back to the same quad and print as the same text.
+
+HAND_WRITTEN = """\
+f:
+GET n
+ALLOC_MEM a 10
+VAR1 = GETIDX a n
+VAR2 = n << 2
+VAR3 = - VAR2
+VAR4 = ! VAR3
+p = & n
+q = * p
+IF VAR1 >= 0 GOTO L1
+IF c == ' ' GOTO L1
+OUT "hello,  world : x = 1"
+STORE_RET VAR1
+RETURN
+L1 :
+BREAK
+CONTINUE
+main:
+STORE PARENT VARS
+STORE 3
+JAL f
+VAR5 = RET_VAL
+x = VAR5
+INPUT y
+x = y % 7
+GOTO L1
+"""
+
+def test_hand_written_round_trip():
+    prog = ir.parse(HAND_WRITTEN)
+    assert prog.to_text() == HAND_WRITTEN
+    quads = list(prog)
+    assert quads[0] == (Op.FUNC, "f", None, None)
+    assert quads[3] == (Op.GETIDX, "VAR1", "a", "n")
+    assert quads[10] == (Op.IF_EQ, "c", "' '", "L1")
+    assert quads[11] == (Op.OUT, '"hello,  world : x = 1"', None, None)
+    assert quads[14] == (Op.LABEL, "L1", None, None)
+    assert quads[18] == (Op.SAVE, None, None, None)
+    assert quads[19] == (Op.PARAM, "3", None, None)
+    assert quads[21] == (Op.RETVAL, "VAR5", None, None)
+    # labels and function names get their kind from the operand position
+    kinds = {(prog.name(prog.x[i]), prog.kinds[prog.x[i]]) for i in range(len(prog)) if prog.x[i] >= 0}
+    assert ("L1", Kind.LABEL) in kinds and ("main", Kind.FUNC) in kinds and ("x", Kind.VAR) in kinds
+    assert ir.Program.from_quads(quads).to_text() == HAND_WRITTEN
+
+def test_compiled_round_trip(tmp_path):
+    # the sample programs and a few from the benchmark corpus
+    sources = []
+    for path in sorted(glob.glob(os.path.join(os.path.dirname(__file__), "*.cpp"))):
+        with open(path) as f:
+            sources.append(f.read())
+    sources += [corpus.generate(seed, statements=60) for seed in range(3)]
+    for source in sources:
+        compiler = Compiler()
+        assert compiler.compile_to(source, str(tmp_path)) is not None
+        with open(tmp_path/"tac.txt") as f:
+            text = f.read()
+        assert text == compiler.program.to_text()
+        prog = ir.parse(text)
+        assert prog.to_text() == text
+        assert list(prog) == list(compiler.program)
+
+def test_generated_round_trip():
+    # every opcode with operands of every kind, as format_quad spells them
+    quads = []
+    for op in Op:
+        if op == Op.LABEL or op == Op.GOTO:
+            quads.append((op, f"L{op}"))
+        elif op == Op.FUNC or op == Op.CALL:
+            quads.append((op, f"func{op}"))
+        elif op in ir.IF_OPS:
+            quads.append((op, "VAR1", "'a'", "L2"))
+        elif op == Op.COPY or op in ir.UNARY_OPS:
+            quads.append((op, "x", "-12"))
+        elif op in ir.BINARY_OPS or op == Op.GETIDX:
+            quads.append((op, "VAR3", "y", "true"))
+        elif op in (Op.SAVE, Op.RETURN, Op.BREAK, Op.CONTINUE):
+            quads.append((op,))
+        elif op == Op.ALLOC:
+            quads.append((op, "arr", "100"))
+        else:
+            quads.append((op, "v"))
+    text = "".join(ir.format_quad(q)+"\n" for q in quads)
+    prog = ir.parse(text)
+    assert [q[:len(want)] for q, want in zip(prog, quads)] == quads
+    assert prog.to_text() == text
+
+def test_opcode_table():
+    assert all(ir.OPS[op] is op for op in Op)
+
+@pytest.mark.parametrize("text,lineno", [("main:\nx = \n", 2), ("L1 :\nIF x < GOTO L1\n", 2), ("f:\n\nFOO x\n", 3)])
+def test_bad_line(text, lineno):
+    with pytest.raises(ValueError, match=f"line {lineno}:"):
+        ir.parse(text)
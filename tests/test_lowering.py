@@ -0,0 +1,130 @@
+from parser import Compiler
+from tacrun import run
+
+# Golden TAC for the control flow lowering of parser.py: conditions turn
+# into chains of IF .. GOTO, and the programs still compute what they
+# should.
+
+def lower(source, outdir):
+    compiler = Compiler()
+    assert compiler.compile_to(source, str(outdir)) is not None
+    assert not compiler.errors
+    with open(outdir/"tac.txt") as f:
+        return compiler.program, f.read()
+
+SHORT_CIRCUIT = r"""
+int main(){
+    int a,b,c;
+    cin>>a;
+    if(a>1 && a<5 || a==9) c = 1;
+    else c = 2;
+    while(!(a<=0) && b!=3){
+        a = a-1;
+        b = b+1;
+    }
+    return c;
+}
+"""
+SHORT_CIRCUIT_TAC = """\
+main:
+INPUT a
+IF a <= 1 GOTO L4
+IF a < 5 GOTO L3
+L4 :
+IF a != 9 GOTO L1
+L3 :
+c = 1
+GOTO L2
+L1 :
+c = 2
+L2 :
+L5 :
+IF a <= 0 GOTO L6
+IF b == 3 GOTO L6
+VAR9 = a - 1
+a = VAR9
+VAR10 = b + 1
+b = VAR10
+GOTO L5
+L6 :
+STORE_RET c
+RETURN
+"""
+
+def test_short_circuit(tmp_path):
+    program, tac = lower(SHORT_CIRCUIT, tmp_path)
+    assert tac == SHORT_CIRCUIT_TAC
+    for a, c in [(0, 2), (1, 2), (3, 1), (5, 2), (9, 1)]:
+        assert run(program, inputs=[a])[0] == c
+
+BREAK_CONTINUE = r"""
+int main(){
+    int i,j,s;
+    s = 0;
+    for(i=0;i<4;i++){
+        if(i==1) continue;
+        j = 0;
+        while(j<i){
+            if(j==2) break;
+            j = j+1;
+            s = s+j;
+        }
+        if(s>5) break;
+    }
+    return s;
+}
+"""
+BREAK_CONTINUE_TAC = """\
+main:
+s = 0
+i = 0
+L1 :
+IF i >= 4 GOTO L2
+IF i != 1 GOTO L5
+GOTO L3
+L5 :
+j = 0
+L6 :
+IF j >= i GOTO L7
+IF j != 2 GOTO L9
+GOTO L7
+L9 :
+VAR5 = j + 1
+j = VAR5
+VAR6 = s + j
+s = VAR6
+GOTO L6
+L7 :
+IF s <= 5 GOTO L11
+GOTO L2
+L11 :
+L3 :
+i = i + 1
+GOTO L1
+L2 :
+STORE_RET s
+RETURN
+"""
+
+def test_break_continue(tmp_path):
+    program, tac = lower(BREAK_CONTINUE, tmp_path)
+    assert tac == BREAK_CONTINUE_TAC
+    assert run(program)[0] == 6
+
+def test_loops_dropped_by_error_recovery():
+    # the syntax errors throw away loops whose labels were already pushed
+    for source in ["int main(){ int i; while (i < 3 +) { i = i + 1; } break; return 0; }",
+                   "int main(){ int i; for (i = 0; i < 3; i++) { while (1) { int = ; } break; } continue; return 0; }"]:
+        compiler = Compiler()
+        assert compiler.compile(source) is None
+        assert compiler.syntax_error and compiler.loops == []
+
+def test_long_short_circuit_chains(tmp_path):
+    # jump_code must not recurse once per operand
+    n = 3000
+    any_of = " || ".join(f"x == {i}" for i in range(0, 2*n, 2))
+    all_of = " && ".join(f"x != {i}" for i in range(1, 2*n, 2))
+    source = "int main(){ int x,y; cin>>x; y = 0; if(%s) y = 1; if(%s) y = y+2; return y; }" % (any_of, all_of)
+    program, _ = lower(source, tmp_path)
+    for x, y in [(0, 3), (2*n-2, 3), (1, 0), (2*n-1, 0), (2*n, 2), (-1, 2)]:
+        assert run(program, inputs=[x])[0] == y
@@ -0,0 +1,101 @@
+import optimize
+from parser import Compiler
+from tacrun import run
+
+# Every pass of optimize.py has to leave what a program prints and returns
+# unchanged. PROGRAM is small enough for tacrun and gives each pass
+# something to do; it runs once per entry of INPUTS (the value of n).
+
+PROGRAM = r"""
+int total;
+int scale(int x){
+    int y;
+    y = x*8;
+    return y;
+}
+int main(){
+    int n,i,j,k,s,t,u,a[10];
+    cin>>n;
+    k = 4;
+    s = 0;
+    t = k*2+1;
+    for(i=0;i<n;i++){
+        u = n*t;
+        a[i] = u+i*4;
+        s = s+u;
+        if(i==3) continue;
+        if(s>1000 || i>6 && n!=0) break;
+        j = i*16;
+        s = s+j;
+    }
+    while(1){
+        n = n-1;
+        if(n<2) break;
+    }
+    total = scale(s)+k*3;
+    cout<<s;
+    cout<<total;
+    return s;
+}
+"""
+INPUTS = [(0,), (3,), (5,), (9,)]
+
+def compile_program(source, outdir):
+    compiler = Compiler()
+    assert compiler.compile_to(source, str(outdir)) is not None
+    assert not compiler.errors
+    return compiler.program, compiler.global_names()
+
+def check(passes, outdir, source=PROGRAM):
+    # the report of optimize() after comparing runs before and after
+    program, names = compile_program(source, outdir)
+    optimised, report = optimize.optimize(program, passes, names)
+    for inputs in INPUTS:
+        assert run(optimised, names, inputs) == run(program, names, inputs)
+    return report
+
+def test_constprop(tmp_path):
+    r, = check(["constprop"], tmp_path)
+    assert r["folded"] and r["after"] < r["before"]
+
+def test_dce(tmp_path):
+    r, = check(["dce"], tmp_path)
+    assert r["dead"] and r["after"] < r["before"]
+
+def test_gvn(tmp_path):
+    r, = check(["gvn"], tmp_path)
+    assert r["operands"]
+
+def test_lvn(tmp_path):
+    r, = check(["lvn"], tmp_path)
+    assert r["operands"]
+
+def test_licm(tmp_path):
+    r, = check(["licm"], tmp_path)
+    assert r["hoisted"]
+
+def test_strength(tmp_path):
+    r, = check(["strength"], tmp_path)
+    assert r["shifts"] and r["reduced"]
+
+def test_peephole(tmp_path):
+    r, = check(["peephole"], tmp_path)
+    assert r["copy_fold"] and r["jump_thread"] and r["after"] < r["before"]
+
+def test_temps(tmp_path):
+    r, = check(["temps"], tmp_path)
+    assert r["slots"] < r["temps"]
+    # per function: main's 13 temps fit in two names, scale keeps its one
+    assert r["per_function"] == {"scale": {"max_live": 1, "slots": 1}, "main": {"max_live": 2, "slots": 2}}
+    assert r["max_live"] == 2 and r["slots"] == 3
+
+def test_ssa(tmp_path):
+    # nothing changes the code in SSA form, so it comes back as it was
+    r, = check(["ssa"], tmp_path)
+    assert r["phis"]
+    program, names = compile_program(PROGRAM, tmp_path)
+    assert list(optimize.optimize(program, ["ssa"], names)[0]) == list(optimize.optimize(program, [], names)[0])
+
+def test_pipelines(tmp_path):
+    check(optimize.DEFAULT, tmp_path)
+    check(["ssa", "constprop", "ssa", "gvn", "licm", "ssa", "strength", "dce", "peephole", "ssa", "temps"], tmp_path)
@@ -0,0 +1,61 @@
+import os
+import sys
+import time
+import signal
+import subprocess
+import pytest
+from client import request
+
+# server.py and client.py end to end: a server on a socket of its own, files
+# compiled through the client must come out as parser.py writes them.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SRC = os.path.join(HERE, "..", "src")
+
+def compile_with(script, args, cwd):
+    os.makedirs(cwd, exist_ok=True)
+    return subprocess.run([sys.executable, os.path.join(SRC, script), *args], cwd=cwd, capture_output=True, text=True)
+
+def outputs(cwd):
+    # AST.dot names nodes by object id, so only tac and symtables compare
+    return [open(os.path.join(cwd, name)).read() for name in ("tac.txt", "symtables.csv")]
+
+@pytest.fixture
+def server(tmp_path):
+    sock = str(tmp_path/"s.sock")
+    proc = subprocess.Popen([sys.executable, os.path.join(SRC, "server.py"), "--socket", sock, "-j", "1"])
+    deadline = time.time()+30
+    while True:
+        try:
+            assert request(sock, {"op": "ping"})["ok"]
+            break
+        except OSError:
+            assert proc.poll() is None and time.time() < deadline
+            time.sleep(0.05)
+    yield sock
+    proc.send_signal(signal.SIGTERM)
+    assert proc.wait(timeout=30) == 0
+    assert not os.path.exists(sock)
+
+def test_client(server, tmp_path):
+    for name in ("gcd.cpp", "isPrime.cpp"):
+        src = os.path.join(HERE, name)
+        for opts in ([], ["-O"]):
+            tag = name+"".join(opts)
+            direct = compile_with("parser.py", [src, *opts], tmp_path/"direct"/tag)
+            remote = compile_with("client.py", [src, "--socket", server, "--no-fallback", *opts], tmp_path/"remote"/tag)
+            assert direct.returncode == remote.returncode == 0
+            assert remote.stdout == direct.stdout
+            assert outputs(tmp_path/"remote"/tag) == outputs(tmp_path/"direct"/tag)
+            assert os.path.exists(tmp_path/"remote"/tag/"AST.dot")
+
+def test_client_syntax_error(server, tmp_path):
+    bad = tmp_path/"bad.cpp"
+    bad.write_text("int main(){ int a = 1 +; return a; }\n")
+    r = compile_with("client.py", [str(bad), "--socket", server, "--no-fallback"], tmp_path/"out")
+    assert r.returncode == 1 and "error at line no" in r.stdout
+    assert not os.path.exists(tmp_path/"out"/"tac.txt")
+
+def test_no_server(tmp_path):
+    r = compile_with("client.py", [os.path.join(HERE, "gcd.cpp"), "--socket", str(tmp_path/"none.sock"), "--no-fallback"], tmp_path)
+    assert r.returncode == 2 and not os.path.exists(tmp_path/"tac.txt")
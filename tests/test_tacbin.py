@@ -0,0 +1,66 @@
+import os
+import pytest
+import ir
+import tacbin
+from parser import Compiler
+
+# ir.Program -> tac.bin -> quads: the binary format keeps every quad, and
+# files that are not whole binary TAC files are refused.
+
+TEXT = """\
+f:
+GET n
+OUT "grüße, 世界"
+OUT "two  spaces"
+VAR1 = n * 2
+STORE_RET VAR1
+RETURN
+main:
+STORE PARENT VARS
+STORE 4
+JAL f
+VAR2 = RET_VAL
+IF VAR2 != 8 GOTO L1
+L1 :
+"""
+
+def round_trip(prog, path):
+    tacbin.write(prog, str(path))
+    with tacbin.TacFile(str(path)) as tf:
+        quads = list(tf)
+        functions = tf.functions()
+        text = tf.to_program().to_text()
+    return quads, functions, text
+
+def test_round_trip(tmp_path):
+    prog = ir.parse(TEXT)
+    quads, functions, text = round_trip(prog, tmp_path/"tac.bin")
+    assert quads == list(prog)
+    assert text == TEXT
+    assert functions == {"f": (0, 7), "main": (7, len(prog))}
+
+def test_compiled_round_trip(tmp_path):
+    with open(os.path.join(os.path.dirname(__file__), "gcd.cpp")) as f:
+        source = f.read()
+    compiler = Compiler()
+    assert compiler.compile_to(source, str(tmp_path)) is not None
+    quads, functions, _ = round_trip(compiler.program, tmp_path/"tac.bin")
+    assert quads == list(compiler.program)
+    assert set(functions) == {"gcd", "main"}
+
+def test_empty_program(tmp_path):
+    assert round_trip(ir.Program(), tmp_path/"tac.bin") == ([], {}, "")
+
+def test_rejects_bad_files(tmp_path):
+    path = tmp_path/"tac.bin"
+    tacbin.write(ir.parse(TEXT), str(path))
+    data = path.read_bytes()
+    bad = {"empty": b"", "header": data[:tacbin.HEADER.size-1], "magic": b"TACX"+data[4:]}
+    # cut anywhere in the sections: before the end of the quads or of the
+    # string blob
+    for cut in (len(data)-1, len(data)//2, tacbin.HEADER.size+8):
+        bad[f"cut {cut}"] = data[:cut]
+    for name, content in bad.items():
+        path.write_bytes(content)
+        with pytest.raises(ValueError):
+            tacbin.TacFile(str(path))
@@ -0,0 +1,49 @@
+import sys
+from tacbuf import TacBuffer
+
+# TacBuffer only records concatenations; iterating it must give the quads in
+# the order the lists were added, however the rope is shaped.
+
+def quads(a, b):
+    return [("=", f"v{i}", str(i), "") for i in range(a, b)]
+
+def test_concatenation_order():
+    a, b, c = quads(0, 3), quads(3, 5), quads(5, 9)
+    buf = TacBuffer(a) + TacBuffer(b) + c
+    assert list(buf) == a+b+c and buf.flatten() == a+b+c
+    assert len(buf) == 9
+    # lists on either side
+    assert list(a + TacBuffer(b)) == a+b
+    assert list(TacBuffer(a) + b) == a+b
+    # right-nested gives the same quads as left-nested
+    assert list(TacBuffer(a) + (TacBuffer(b) + c)) == a+b+c
+
+def test_empty_buffers():
+    a = quads(0, 2)
+    empty = TacBuffer()
+    assert list(empty) == [] and len(empty) == 0 and empty.flatten() == []
+    assert list(TacBuffer([])) == []
+    assert list(empty + empty) == []
+    buf = TacBuffer(a)
+    assert empty + buf is buf and buf + empty is buf
+    assert list([] + buf + [] + empty) == a and len([] + buf) == 2
+
+def test_nested_buffers():
+    a, b, c, d = quads(0, 2), quads(2, 3), quads(3, 6), quads(6, 7)
+    left = TacBuffer(a) + b
+    right = c + TacBuffer(d)
+    both = left + right
+    assert list(both) == a+b+c+d and len(both) == 7
+    # the halves are shared, not changed
+    assert list(left) == a+b and list(right) == c+d
+    assert list(both + both) == 2*(a+b+c+d)
+
+def test_deep_ropes():
+    n = 5*sys.getrecursionlimit()
+    left = TacBuffer()
+    right = TacBuffer()
+    for i in range(n):
+        left = left + quads(i, i+1)
+        right = quads(n-1-i, n-i) + right
+    assert list(left) == quads(0, n) == list(right)
+    assert len(left) == len(right) == n